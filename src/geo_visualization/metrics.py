@@ -0,0 +1,9 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("geo_visualization")
+
+tile_cache_lookups = meter.create_counter(
+    "openforms.map.tile_cache_lookups",
+    unit="1",  # unitless count
+    description="The number of cache lookups for WMTS map tiles, by result (hit or miss).",
+)
@@ -1,9 +1,25 @@
+from io import BytesIO
 from unittest import TestCase
+from unittest.mock import call, patch
 
+from django.core.cache import cache
+
+import requests_mock
+from PIL import Image
 from shapely.geometry import shape
 
+from ..constants import TILE_SIZE
 from ..typing import PolygonGeometry
 from ..utils import find_maximum_zoom, geojson_to_rd
+from ..wmts_map_generator import construct_image_from_tiles, get_tile_cache_key
+
+URL_TEMPLATE = "https://tiles.example.com/{z}/{x}/{y}.png"
+
+
+def _tile_content(color: str) -> bytes:
+    stream = BytesIO()
+    Image.new("RGBA", (TILE_SIZE, TILE_SIZE), color).save(stream, format="png")
+    return stream.getvalue()
 
 
 class WMTSMapTests(TestCase):
@@ -27,3 +43,73 @@ class WMTSMapTests(TestCase):
         zoom = find_maximum_zoom(geometry, (400, 300), min_zoom=5)
 
         self.assertEqual(zoom, 5)
+
+
+class TileCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @requests_mock.Mocker()
+    def test_tiles_are_loaded_once(self, m):
+        m.get(requests_mock.ANY, content=_tile_content("red"))
+
+        with patch(
+            "geo_visualization.wmts_map_generator.tile_cache_lookups"
+        ) as mock_counter:
+            image1 = construct_image_from_tiles(URL_TEMPLATE, 10, 5, 5, 1, 0, 0, 0)
+            image2 = construct_image_from_tiles(URL_TEMPLATE, 10, 5, 5, 1, 0, 0, 0)
+
+        self.assertEqual(m.call_count, 2)
+        assert image1 is not None and image2 is not None
+        self.assertEqual(image1.tobytes(), image2.tobytes())
+        mock_counter.add.assert_has_calls(
+            [
+                call(0, attributes={"type": "hit"}),
+                call(2, attributes={"type": "miss"}),
+                call(2, attributes={"type": "hit"}),
+                call(0, attributes={"type": "miss"}),
+            ]
+        )
+
+    @requests_mock.Mocker()
+    def test_only_missing_tiles_are_loaded(self, m):
+        cache.set(get_tile_cache_key(URL_TEMPLATE, 10, 4, 5), _tile_content("blue"))
+        m.get("https://tiles.example.com/10/5/5.png", content=_tile_content("red"))
+
+        image = construct_image_from_tiles(URL_TEMPLATE, 10, 5, 5, 1, 0, 0, 0)
+
+        self.assertEqual(m.call_count, 1)
+        assert image is not None
+        self.assertEqual(image.getpixel((0, 0)), (0, 0, 255, 255))
+        self.assertEqual(image.getpixel((TILE_SIZE, 0)), (255, 0, 0, 255))
+
+    @requests_mock.Mocker()
+    def test_loaded_tiles_are_cached_if_others_fail(self, m):
+        m.get("https://tiles.example.com/10/4/5.png", status_code=404)
+        m.get("https://tiles.example.com/10/5/5.png", content=_tile_content("red"))
+
+        image = construct_image_from_tiles(URL_TEMPLATE, 10, 5, 5, 1, 0, 0, 0)
+
+        self.assertIsNone(image)
+        self.assertIsNone(cache.get(get_tile_cache_key(URL_TEMPLATE, 10, 4, 5)))
+        self.assertIsNotNone(cache.get(get_tile_cache_key(URL_TEMPLATE, 10, 5, 5)))
+
+    @requests_mock.Mocker()
+    def test_invalid_tiles_are_not_cached(self, m):
+        m.get(
+            "https://tiles.example.com/10/4/5.png",
+            content=b"<html>Service unavailable</html>",
+        )
+        m.get(
+            "https://tiles.example.com/10/5/5.png",
+            content=_tile_content("red")[:100],
+        )
+
+        image = construct_image_from_tiles(URL_TEMPLATE, 10, 5, 5, 1, 0, 0, 0)
+
+        self.assertIsNone(image)
+        self.assertIsNone(cache.get(get_tile_cache_key(URL_TEMPLATE, 10, 4, 5)))
+        self.assertIsNone(cache.get(get_tile_cache_key(URL_TEMPLATE, 10, 5, 5)))
@@ -7,17 +7,28 @@ https://github.com/Amsterdam/signals/blob/main/app/signals/apps/services/domain/
 
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
 from io import BytesIO
 from math import ceil, modf
 
+from django.core.cache import cache
+
 from PIL import Image
 from requests import RequestException, Session
 from shapely.geometry import Point
 
 from .constants import ORIGIN_X, ORIGIN_Y, TILE_SIZE
+from .metrics import tile_cache_lookups
 from .utils import px_to_rd
 
+# The tiles of the background maps rarely change, and a tile is only a couple of kB.
+# Eviction when the cache is full is left to the cache backend (Redis' maxmemory
+# policy).
+TILE_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+
+
+def get_tile_cache_key(url_template: str, zoom_level: int, x: int, y: int) -> str:
+    return f"wmts_tile|{url_template}|{zoom_level}|{x}|{y}"
+
 
 def convert_rd_coordinate_to_tile(
     x_rd: float, y_rd: float, zoom_level: int
@@ -99,41 +110,76 @@ def construct_image_from_tiles(
     tiles_x = range(x_tile_center - n_tiles_left, x_tile_center + n_tiles_right + 1)
     tiles_y = range(y_tile_center - n_tiles_top, y_tile_center + n_tiles_bottom + 1)
 
-    def fetch_tile(session: Session, url_: str, offset_: tuple[int, int]):
+    # The location of where the upper left corner of each tile image should be pasted
+    # on the total image.
+    offsets = {
+        (tile_x, tile_y): (i * TILE_SIZE, j * TILE_SIZE)
+        for i, tile_x in enumerate(tiles_x)
+        for j, tile_y in enumerate(tiles_y)
+    }
+    cache_keys = {
+        tile: get_tile_cache_key(url_template, zoom_level, *tile) for tile in offsets
+    }
+
+    # Tiles are shared between all maps using the same tile layer, so only the ones
+    # that aren't in the cache yet are loaded.
+    cached = cache.get_many(cache_keys.values())
+    contents: dict[tuple[int, int], bytes] = {
+        tile: cached[key] for tile, key in cache_keys.items() if key in cached
+    }
+    missing = [tile for tile in offsets if tile not in contents]
+    tile_cache_lookups.add(len(contents), attributes={"type": "hit"})
+    tile_cache_lookups.add(len(missing), attributes={"type": "miss"})
+
+    def fetch_tile(session: Session, tile_: tuple[int, int]) -> bytes | None:
+        x, y = tile_
         try:
-            res = session.get(url_)
+            res = session.get(url_template.format(z=zoom_level, x=x, y=y))
             res.raise_for_status()
         except RequestException:
             return None
 
-        return Image.open(BytesIO(res.content)), offset_
+        # Tiles are cached for a long time, so make sure we don't store error pages
+        # or truncated responses served with a successful status code.
+        try:
+            Image.open(BytesIO(res.content)).verify()
+        except Exception:  # Pillow raises a variety of exceptions for broken images
+            return None
 
-    img = Image.new("RGBA", (n_tiles_x * TILE_SIZE, n_tiles_y * TILE_SIZE), 0)
+        return res.content
+
+    if missing:
+        fetched: dict[tuple[int, int], bytes] = {}
+        num_workers = int(os.getenv("_MAP_GENERATION_MAX_WORKERS", default="4"))
+        with (
+            ThreadPoolExecutor(max_workers=num_workers) as executor,
+            Session() as session,
+        ):
+            futures = {
+                executor.submit(fetch_tile, session, tile): tile for tile in missing
+            }
+            for future in as_completed(futures):
+                if (content := future.result()) is not None:
+                    fetched[futures[future]] = content
+
+        # Also store the tiles that were loaded when others failed, so a next attempt
+        # has less to load.
+        cache.set_many(
+            {cache_keys[tile]: content for tile, content in fetched.items()},
+            timeout=TILE_CACHE_TIMEOUT,
+        )
+        # Return no image if one of the tiles couldn't be loaded
+        if len(fetched) != len(missing):
+            return None
+        contents.update(fetched)
 
-    tasks = []
-    num_workers = int(os.getenv("_MAP_GENERATION_MAX_WORKERS", default="4"))
-    with (
-        ThreadPoolExecutor(max_workers=num_workers) as executor,
-        Session() as session,
-    ):
-        for i, tile_x in enumerate(tiles_x):
-            for j, tile_y in enumerate(tiles_y):
-                url = url_template.format(z=zoom_level, x=tile_x, y=tile_y)
-                # The location of where the upper left corner of the tile image should
-                # be pasted on the total image.
-                offset = (i * TILE_SIZE, j * TILE_SIZE)
-                tasks.append(executor.submit(fetch_tile, session, url, offset))
-
-        for future in as_completed(tasks):
-            # Return no image if one of the tiles couldn't be loaded
-            if (result := future.result()) is None:
-                return None
-            img.paste(*result)
+    img = Image.new("RGBA", (n_tiles_x * TILE_SIZE, n_tiles_y * TILE_SIZE), 0)
+    for tile, content in contents.items():
+        img.paste(Image.open(BytesIO(content)), offsets[tile])
 
     return img
 
 
-@lru_cache(maxsize=32)
 def generate_map_image(
     url_template: str,
     center_rd: Point,
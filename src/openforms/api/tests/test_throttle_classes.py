@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from ..throttle_classes import AnonRateThrottle, ScopedRateThrottle
+
+
+class LimitedAnonRateThrottle(AnonRateThrottle):
+    rate = "3/minute"
+
+
+class AnonView(APIView):
+    authentication_classes = ()
+    permission_classes = ()
+    throttle_classes = (LimitedAnonRateThrottle,)
+
+    def get(self, request):
+        return Response()
+
+
+class LimitedScopedRateThrottle(ScopedRateThrottle):
+    THROTTLE_RATES = {"pause": "1/minute"}
+
+
+class ScopedView(AnonView):
+    throttle_classes = (LimitedScopedRateThrottle,)
+    throttle_scope = "pause"
+
+
+factory = APIRequestFactory()
+
+
+class CounterRateThrottleTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        # 2025-01-21T11:30:10Z
+        self.now = 1737459010.0
+        patcher = patch(
+            "openforms.api.throttle_classes.CounterRateThrottle.timer",
+            side_effect=lambda: self.now,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requests_are_counted_per_window(self):
+        view = AnonView.as_view()
+
+        for _ in range(3):
+            response = view(factory.get("/"))
+            self.assertEqual(response.status_code, 200)
+
+        response = view(factory.get("/"))
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "50")
+
+        self.now += 50
+        response = view(factory.get("/"))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_requests_are_counted_per_client(self):
+        view = AnonView.as_view()
+
+        for _ in range(3):
+            view(factory.get("/", REMOTE_ADDR="10.0.0.1"))
+
+        response = view(factory.get("/", REMOTE_ADDR="10.0.0.2"))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_scope_from_view(self):
+        view = ScopedView.as_view()
+
+        first_response = view(factory.get("/"))
+        second_response = view(factory.get("/"))
+
+        self.assertEqual(first_response.status_code, 200)
+        self.assertEqual(second_response.status_code, 429)
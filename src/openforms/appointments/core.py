@@ -42,6 +42,7 @@ def book(appointment: Appointment, remarks: str = "") -> str:
     """
     plugin = _get_plugin(appointment)
     audit_log = audit_logger.bind(
+        submission_pk=appointment.submission.pk,
         submission_uuid=str(appointment.submission.uuid),
         plugin=plugin,
     )
@@ -96,7 +97,9 @@ def book_for_submission(submission: Submission) -> str:
     if not submission.form.type == FormTypeChoices.appointment:
         raise NoAppointmentForm("Not an appointment form")
 
-    audit_log = audit_logger.bind(submission_uuid=str(submission.uuid))
+    audit_log = audit_logger.bind(
+        submission_pk=submission.pk, submission_uuid=str(submission.uuid)
+    )
 
     try:
         appointment = submission.appointment
@@ -720,6 +720,20 @@ MAX_UNTRUSTED_JSON_PARSE_SIZE = config(
 # Perform HTML escaping on user's data-input
 ESCAPE_REGISTRATION_OUTPUT = config("ESCAPE_REGISTRATION_OUTPUT", default=False)
 DISABLE_SENDING_HIDDEN_FIELDS = config("DISABLE_SENDING_HIDDEN_FIELDS", default=False)
+# Upper bound for the number of simultaneous attachment uploads while registering a
+# single submission, to avoid overloading the remote service.
+REGISTRATION_MAX_CONCURRENT_UPLOADS: int = config(
+    "REGISTRATION_MAX_CONCURRENT_UPLOADS", default=4
+)
+
+#
+# Form logic
+#
+
+# Re-use the outcome of logic rules with unchanged inputs between logic checks
+LOGIC_CHECK_INCREMENTAL_EVALUATION = config(
+    "LOGIC_CHECK_INCREMENTAL_EVALUATION", default=True
+)
 
 ##############################
 #                            #
@@ -1028,9 +1042,9 @@ REST_FRAMEWORK = {
         "djangorestframework_camel_case.parser.CamelCaseMultiPartParser",
     ],
     "DEFAULT_THROTTLE_CLASSES": (
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
-        "rest_framework.throttling.ScopedRateThrottle",
+        "openforms.api.throttle_classes.AnonRateThrottle",
+        "openforms.api.throttle_classes.UserRateThrottle",
+        "openforms.api.throttle_classes.ScopedRateThrottle",
     ),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_THROTTLE_RATES": {
@@ -47,6 +47,9 @@ TIMELINE_HANDLER_USE_QUEUE = False
 # ensure we insert outgoing request logs in the main thread & DB transaction in tests
 LOG_OUTGOING_REQUESTS_HANDLER_USE_QUEUE = False
 
+# upload attachments one by one, the recorded VCR cassettes rely on the request order
+REGISTRATION_MAX_CONCURRENT_UPLOADS = 1
+
 # shut up logging
 mute_logging(LOGGING)
 
@@ -1,4 +1,3 @@
-from base64 import b64encode
 from io import BytesIO
 from typing import Literal, assert_never
 
@@ -9,6 +8,7 @@ from zgw_consumers.nlx import NLXClient
 from openforms.contrib.client import LoggingMixin
 from openforms.translations.utils import to_iso639_2b
 from openforms.utils.date import get_today
+from openforms.utils.json_stream import Base64Content, get_json_body
 
 type DocumentStatus = Literal[
     "in_bewerking",
@@ -36,18 +36,15 @@ class DocumentenClient(LoggingMixin, NLXClient):
     ):
         assert author, "author must be a non-empty string"
         today = get_today().isoformat()
-        file_content = content.read()
-
         file_size: int
         match content:
             case File():
                 file_size = content.size
             case BytesIO():
-                file_size = len(file_content)
+                file_size = content.getbuffer().nbytes - content.tell()
             case _:  # pragma: no cover
                 assert_never(content)
 
-        base64_body = b64encode(file_content).decode()
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -56,7 +53,7 @@ class DocumentenClient(LoggingMixin, NLXClient):
             "auteur": author,
             "taal": to_iso639_2b(language),
             "formaat": format,
-            "inhoud": base64_body,
+            "inhoud": Base64Content(content, size=file_size),
             "status": status,
             "bestandsnaam": filename,
             "ontvangstdatum": received_date,
@@ -68,7 +65,13 @@ class DocumentenClient(LoggingMixin, NLXClient):
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        # the file content is only read and encoded while the request is being sent,
+        # which keeps the memory usage bounded for large attachments
+        response = self.post(
+            "enkelvoudiginformatieobjecten",
+            data=get_json_body(data),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
 
         return response.json()
@@ -1,6 +1,6 @@
-import itertools
 from datetime import timedelta
 
+from django.db import transaction
 from django.db.models import F, Q
 from django.utils import timezone
 
@@ -10,6 +10,7 @@ from openforms.celery import app
 from openforms.forms.constants import FormTypeChoices
 from openforms.submissions.constants import Stages
 from openforms.submissions.models import Submission
+from openforms.submissions.query import SubmissionQuerySet
 
 from .constants import RemovalMethods
 
@@ -17,6 +18,32 @@ logger = structlog.stdlib.get_logger(__name__)
 
 TIME_SINCE_CREATION_DELTA = F("removal_limit") * timedelta(days=1)
 
+# Number of submissions deleted in a single transaction - deleting a submission
+# cascades to its steps, variables, attachments, logs...
+DELETE_CHUNK_SIZE = 100
+
+
+def _delete_in_chunks(
+    queryset: SubmissionQuerySet,
+    log: structlog.stdlib.BoundLogger,
+    kind: str,
+) -> None:
+    """
+    Delete the submissions in the queryset in batches, ordered by primary key.
+
+    Every batch is deleted in its own (short) transaction, which limits the memory
+    needed for the related objects and the duration of the locks. Deleted submissions
+    are no longer matched by the queryset, so an interrupted run resumes where it
+    stopped.
+    """
+    queryset = queryset.order_by("pk")
+    deleted = 0
+    while pks := list(queryset.values_list("pk", flat=True)[:DELETE_CHUNK_SIZE]):
+        with transaction.atomic():
+            Submission.objects.filter(pk__in=pks).delete()
+        deleted += len(pks)
+        log.info("delete_submissions_progress", kind=kind, deleted=deleted)
+
 
 @app.task(ignore_result=True)
 def delete_submissions():
@@ -48,7 +75,7 @@ def delete_submissions():
         kind="successful",
         amount=successful_submissions_to_delete.count(),
     )
-    successful_submissions_to_delete.delete()
+    _delete_in_chunks(successful_submissions_to_delete, log, kind="successful")
 
     incomplete_submissions_to_delete = base_qs.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
@@ -59,7 +86,7 @@ def delete_submissions():
         kind="incomplete",
         amount=incomplete_submissions_to_delete.count(),
     )
-    incomplete_submissions_to_delete.delete()
+    _delete_in_chunks(incomplete_submissions_to_delete, log, kind="incomplete")
 
     errored_submissions_to_delete = base_qs.annotate_removal_fields(
         "errored_submissions_removal_limit",
@@ -70,7 +97,7 @@ def delete_submissions():
         kind="errored",
         amount=errored_submissions_to_delete.count(),
     )
-    errored_submissions_to_delete.delete()
+    _delete_in_chunks(errored_submissions_to_delete, log, kind="errored")
 
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
@@ -81,7 +108,7 @@ def delete_submissions():
     log.info(
         "delete_submissions", kind="other", amount=other_submissions_to_delete.count()
     )
-    other_submissions_to_delete.delete()
+    _delete_in_chunks(other_submissions_to_delete, log, kind="other")
 
 
 @app.task(ignore_result=True)
@@ -124,9 +151,9 @@ def make_sensitive_data_anonymous() -> None:
         "anonymize_submissions", kind="errored", amount=errored_submissions.count()
     )
 
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
+    for submissions in (
+        successful_submissions,
+        incomplete_submissions,
+        errored_submissions,
     ):
-        submission.remove_sensitive_data()
+        submissions.remove_sensitive_data()
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from unittest.mock import call, patch
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import TestCase, tag
@@ -18,6 +19,7 @@ from openforms.submissions.constants import (
     SubmissionValueVariableSources,
 )
 from openforms.submissions.models import Submission, SubmissionValueVariable
+from openforms.submissions.query import SubmissionQuerySet
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionStepFactory,
@@ -439,6 +441,43 @@ class DeleteSubmissionsTask(TestCase):
         with self.assertRaises(ObjectDoesNotExist):
             old_submission.refresh_from_db()
 
+    def test_submissions_deleted_in_chunks(self):
+        recent_submission = SubmissionFactory.create()
+        with freeze_time(timezone.now() - timedelta(days=365)):
+            old_submissions = SubmissionFactory.create_batch(
+                5, registration_success=True
+            )
+        deleted_batches = []
+        delete = SubmissionQuerySet.delete
+
+        def _record_delete(queryset):
+            deleted_batches.append(sorted(queryset.values_list("pk", flat=True)))
+            return delete(queryset)
+
+        with (
+            patch("openforms.data_removal.tasks.DELETE_CHUNK_SIZE", 2),
+            patch.object(SubmissionQuerySet, "delete", _record_delete),
+            patch("openforms.data_removal.tasks.logger") as mock_logger,
+        ):
+            delete_submissions()
+
+        self.assertEqual(list(Submission.objects.all()), [recent_submission])
+        pks = sorted(submission.pk for submission in old_submissions)
+        self.assertEqual(deleted_batches, [pks[:2], pks[2:4], pks[4:]])
+        progress_calls = [
+            call
+            for call in mock_logger.bind.return_value.info.call_args_list
+            if call.args == ("delete_submissions_progress",)
+        ]
+        self.assertEqual(
+            progress_calls,
+            [
+                call("delete_submissions_progress", kind="successful", deleted=2),
+                call("delete_submissions_progress", kind="successful", deleted=4),
+                call("delete_submissions_progress", kind="successful", deleted=5),
+            ],
+        )
+
     def test_all_submissions_correctly_deleted_the_same_day_when_form_removal_limit_is_0(
         self,
     ):
@@ -51,6 +51,7 @@ def yubin_messages_status_change_handler(
 
     audit_log.info(
         "email_status_change",
+        submission_pk=submission.pk,
         new_status=instance.status,
         status_label=str(status_label),
     )
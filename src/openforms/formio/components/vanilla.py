@@ -59,7 +59,11 @@ from ..formatters.formio import (
     TimeFormatter,
 )
 from ..registry import BasePlugin, register
-from ..serializers import build_serializer
+from ..serializers import (
+    StepDataSerializer,
+    build_serializer,
+    get_hidden_component_keys,
+)
 from ..service import as_json_schema
 from ..typing import (
     Column,
@@ -70,6 +74,7 @@ from ..typing import (
     FieldsetComponent,
     FileComponent,
     FileValue,
+    FormioConfiguration,
     RadioComponent,
     SelectBoxesComponent,
     SelectComponent,
@@ -1053,8 +1058,9 @@ class EditGridField(serializers.Field):
     The same child serializer cannot be applied for each item in the list of values,
     since the field validation parameters depend on the input data/conditionals.
 
-    For each item, a dynamic serializer is set up on the fly to perform input
-    validation.
+    For each item, the hidden state of the child components is determined and a
+    dynamic serializer is set up on the fly to perform input validation. Items with the
+    same hidden state share the same serializer.
     """
 
     initial = []
@@ -1122,17 +1128,39 @@ class EditGridField(serializers.Field):
         result = []
         errors = {}
 
+        if "configuration_wrapper" not in self.context:
+            self.context["configuration_wrapper"] = FormioConfigurationWrapper(
+                self.context["configuration"]
+            )
+        config_wrapper: FormioConfigurationWrapper = self.context[
+            "configuration_wrapper"
+        ]
+        configuration: FormioConfiguration = {"components": self.components}
+        root_data = FormioData(self.root.initial_data).data
+        # The field tree only depends on the hidden state of the child components, so
+        # the rows sharing the same hidden state can share the same serializer.
+        nested_serializers: dict[frozenset[str], StepDataSerializer] = {}
+
         for idx, item in enumerate(data):
-            # given the local scope of data, build a nested serializer for the component
-            # configuration and apply the dynamic hide/visible logic to it.
-            # Note that we add the editgrid key as container so that the
-            # conditional.when values resolve, as these look like `editgridparent.child`.
-            data = FormioData({**self.root.initial_data, self.field_name: item}).data
-            nested_serializer = self._build_child(data=data)
-
-            # this is explicitly bound to the parent because we need to have access to the
-            # context of the parent in the children
-            nested_serializer.bind(field_name=self.field_name, parent=self)
+            # Given the local scope of data, determine the dynamic hide/visible state of
+            # the child components. Note that we add the editgrid key as container so
+            # that the conditional.when values resolve, as these look like
+            # `editgridparent.child`.
+            values = FormioData()
+            values.data = {**root_data, self.field_name: item}
+            hidden_keys = get_hidden_component_keys(
+                configuration,
+                values,
+                config_wrapper=config_wrapper,
+                register=self.registry,
+            )
+
+            if (nested_serializer := nested_serializers.get(hidden_keys)) is None:
+                nested_serializer = self._build_child(hidden_keys=hidden_keys)
+                # this is explicitly bound to the parent because we need to have access
+                # to the context of the parent in the children
+                nested_serializer.bind(field_name=self.field_name, parent=self)
+                nested_serializers[hidden_keys] = nested_serializer
 
             try:
                 result.append(nested_serializer.run_validation(item))
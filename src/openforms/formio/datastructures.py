@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from collections import UserDict, defaultdict
+import copy
+import threading
+from collections import OrderedDict, UserDict, defaultdict
 from collections.abc import Collection, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 
 from openforms.formio.typing.vanilla import ColumnsComponent, FieldsetComponent
 from openforms.typing import VariableValue
+from openforms.utils.cache import get_digest
 
 from .typing import Component, EditGridComponent, FormioConfiguration
 from .utils import iter_components
@@ -48,6 +53,108 @@ type ChildKey = str
 
 type Branch = Sequence[Component]  # component tree branch, from root to (leaf) node
 
+type _Path = tuple[str | int, ...]
+
+# Number of distinct form configurations for which the component structure is
+# remembered in a (worker) process.
+COMPONENT_INDEX_CACHE_SIZE = 256
+
+
+def _get_digest(configuration: FormioConfiguration) -> str | None:
+    try:
+        # the key order determines the order of the components in the map
+        return get_digest(configuration, sort_keys=False)
+    except TypeError:
+        # not JSON serializable - don't bother caching
+        return None
+
+
+def _iter_paths(node: object, path: _Path = ()) -> Iterator[tuple[int, _Path]]:
+    if isinstance(node, dict):
+        yield id(node), path
+        for key, value in node.items():
+            yield from _iter_paths(value, (*path, key))
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            yield from _iter_paths(value, (*path, index))
+
+
+@dataclass(frozen=True)
+class _ComponentIndex:
+    """
+    The structure of a component map, independent of any particular configuration
+    instance.
+
+    Rather than the components themselves, the locations of the components inside the
+    configuration are stored. This makes it possible to share the index between
+    (copies of) configurations with identical content without sharing any mutable
+    state.
+    """
+
+    paths: tuple[tuple[str, _Path], ...]
+    parent_refs: Mapping[ChildKey, ParentKey]
+
+    @classmethod
+    def build(
+        cls,
+        configuration: FormioConfiguration,
+        component_map: Mapping[str, Component],
+        parent_refs: Mapping[ChildKey, ParentKey],
+    ) -> _ComponentIndex | None:
+        paths_by_id = dict(_iter_paths(configuration))
+        paths: list[tuple[str, _Path]] = []
+        for key, component in component_map.items():
+            if (path := paths_by_id.get(id(component))) is None:
+                return None
+            paths.append((key, path))
+        return cls(paths=tuple(paths), parent_refs=dict(parent_refs))
+
+    def resolve(self, configuration: FormioConfiguration) -> dict[str, Component]:
+        component_map: dict[str, Component] = {}
+        # editgrid children are present with multiple keys, they must resolve to the
+        # same component
+        resolved: dict[_Path, Component] = {}
+        for key, path in self.paths:
+            if (component := resolved.get(path)) is None:
+                node = configuration
+                for step in path:
+                    node = node[step]  # type: ignore
+                component = resolved[path] = node  # type: ignore
+            component_map[key] = component
+        return component_map
+
+
+class _ComponentIndexCache:
+    """
+    Thread-safe, process-level LRU cache of component indices, keyed by the digest of
+    the configuration content.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, _ComponentIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> _ComponentIndex | None:
+        with self._lock:
+            if (index := self._data.get(digest)) is not None:
+                self._data.move_to_end(digest)
+            return index
+
+    def set(self, digest: str, index: _ComponentIndex) -> None:
+        with self._lock:
+            self._data[digest] = index
+            self._data.move_to_end(digest)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_component_indices = _ComponentIndexCache(maxsize=COMPONENT_INDEX_CACHE_SIZE)
+
 
 class FormioConfigurationWrapper:
     """
@@ -79,46 +186,65 @@ class FormioConfigurationWrapper:
     @property
     def component_map(self) -> dict[str, Component]:
         if self._cached_component_map is None:
-            self._cached_component_map = {}
-
-            for component in iter_components(
-                self.configuration,
-                recursive=True,
-                parent_map=self._parent_refs,
-            ):
-                # Keys are supposed to be unique for the entire form, and the frontend
-                # validates this. However, frontend validation can be bypassed so we
-                # perform an additional check that can be used by backend validation.
-                if (
-                    key := component["key"]
-                ) in self._cached_component_map and self.validate_unique_keys:
-                    raise DuplicateKeyError(key)
-
-                # first, ensure we add every component by its own key so that we can
-                # look it up. This is okay because we just validated its uniqueness.
-                # Even if the key is present in an edit grid (repeating group), we lean
-                # on this uniqueness guarantee. Note that formio is perfectly fine with
-                # a root 'foo' key and 'foo' key inside an editgrid. Our behaviour is
-                # different from that because of historical reasons...
-                self._cached_component_map[key] = component
-
-                # now, formio itself addresses components inside an edit grid with the
-                # pattern ``<editGridKey>.<componentKey>`` (e.g. in simple conditionals),
-                # which means that we also need to add the editgrid components to our
-                # 'registry' for easy lookups. See GH issue #4247 for one possible way
-                # this can cause crashes. So, we add the nested components with a
-                # namespaced key too.
-                #
-                # NOTE - this could conflict with a component outside the editgrid with
-                # this specific, explicit key. At the time of writing, this crashes on
-                # Formio's own demo site because it can't properly resolve the component,
-                # so we do not need to consider this case (it's broken anyway).
-                if component["type"] == "editgrid":
-                    editgrid_components = _get_editgrid_component_map(component)  # type: ignore
-                    self._cached_component_map.update(editgrid_components)
-
+            self._cached_component_map = self._build_component_map()
         return self._cached_component_map
 
+    def _build_component_map(self) -> dict[str, Component]:
+        # Walking the configuration is expensive for big forms, while the same
+        # (popular) form definitions are processed over and over again. Re-use the
+        # structure of an earlier walk over identical content if we can.
+        digest = None if self.validate_unique_keys else _get_digest(self.configuration)
+        if digest is not None and (index := _component_indices.get(digest)):
+            self._parent_refs.update(index.parent_refs)
+            return index.resolve(self.configuration)
+
+        component_map = self._walk_components()
+        if digest is not None and (
+            index := _ComponentIndex.build(
+                self.configuration, component_map, self._parent_refs
+            )
+        ):
+            _component_indices.set(digest, index)
+        return component_map
+
+    def _walk_components(self) -> dict[str, Component]:
+        component_map: dict[str, Component] = {}
+        for component in iter_components(
+            self.configuration,
+            recursive=True,
+            parent_map=self._parent_refs,
+        ):
+            # Keys are supposed to be unique for the entire form, and the frontend
+            # validates this. However, frontend validation can be bypassed so we
+            # perform an additional check that can be used by backend validation.
+            if (key := component["key"]) in component_map and self.validate_unique_keys:
+                raise DuplicateKeyError(key)
+
+            # first, ensure we add every component by its own key so that we can
+            # look it up. This is okay because we just validated its uniqueness.
+            # Even if the key is present in an edit grid (repeating group), we lean
+            # on this uniqueness guarantee. Note that formio is perfectly fine with
+            # a root 'foo' key and 'foo' key inside an editgrid. Our behaviour is
+            # different from that because of historical reasons...
+            component_map[key] = component
+
+            # now, formio itself addresses components inside an edit grid with the
+            # pattern ``<editGridKey>.<componentKey>`` (e.g. in simple conditionals),
+            # which means that we also need to add the editgrid components to our
+            # 'registry' for easy lookups. See GH issue #4247 for one possible way
+            # this can cause crashes. So, we add the nested components with a
+            # namespaced key too.
+            #
+            # NOTE - this could conflict with a component outside the editgrid with
+            # this specific, explicit key. At the time of writing, this crashes on
+            # Formio's own demo site because it can't properly resolve the component,
+            # so we do not need to consider this case (it's broken anyway).
+            if component["type"] == "editgrid":
+                editgrid_components = _get_editgrid_component_map(component)  # type: ignore
+                component_map.update(editgrid_components)
+
+        return component_map
+
     def __iter__(self) -> Iterator[Component]:
         """
         Yield the components in the configuration by looping over this object.
@@ -149,10 +275,51 @@ class FormioConfigurationWrapper:
         self._parent_refs.update(other_wrapper._parent_refs)
         return self
 
+    def __deepcopy__(self, memo) -> FormioConfigurationWrapper:
+        return self.copy()
+
     @property
     def configuration(self) -> FormioConfiguration:
         return self._configuration
 
+    def copy(self) -> FormioConfigurationWrapper:
+        """
+        Create a fully independent copy of the wrapper and its configuration.
+
+        This is equivalent to :func:`copy.deepcopy`, but a lot cheaper for big forms -
+        the configuration is (mostly) plain JSON, which can be cloned without the
+        bookkeeping of :func:`copy.deepcopy`, and the component map and parent refs
+        are carried over to the copy instead of walking the copied configuration again.
+        """
+        component_ids = {id(component) for component in self.component_map.values()}
+        clones: dict[int, Component] = {}
+
+        def _clone(value):
+            if (value_type := type(value)) is dict:
+                clone = {key: _clone(item) for key, item in value.items()}
+                if id(value) in component_ids:
+                    clones[id(value)] = clone  # type: ignore
+                return clone
+            if value_type is list:
+                return [_clone(item) for item in value]
+            if value_type in (str, int, float, bool) or value is None:
+                return value
+            return copy.deepcopy(value)
+
+        wrapper = type(self)(
+            _clone(self.configuration),
+            validate_unique_keys=self.validate_unique_keys,
+        )
+        # components that are not part of the configuration (shouldn't happen) would
+        # end up being shared, rather build the component map from scratch then.
+        if len(clones) == len(component_ids):
+            wrapper._cached_component_map = {
+                key: clones[id(component)]
+                for key, component in self.component_map.items()
+            }
+            wrapper._parent_refs = dict(self._parent_refs)
+        return wrapper
+
     def get_parent(self, key: str) -> Component | None:
         """
         Given a component key, return its parent component if there is a parent.
@@ -289,6 +456,31 @@ class FormioConfigurationWrapper:
         return duplicates
 
 
+type _KeyPath = tuple[tuple[str, int | None], ...]
+
+# Number of distinct (dotted) keys for which the split up path is remembered. The
+# same keys are looked up over and over again while processing submission data.
+KEY_PATH_CACHE_SIZE = 4096
+
+_missing = object()
+
+
+@lru_cache(maxsize=KEY_PATH_CACHE_SIZE)
+def _split_key(key: str) -> _KeyPath:
+    """
+    Split a dotted key into its parts, with the list index for every part (if the part
+    can be used as list index).
+    """
+    parts: list[tuple[str, int | None]] = []
+    for part in key.split("."):
+        try:
+            index = int(part)
+        except ValueError:
+            index = None
+        parts.append((part, index))
+    return tuple(parts)
+
+
 class FormioData(UserDict):
     """
     Handle formio (submission) data transparently.
@@ -320,6 +512,23 @@ class FormioData(UserDict):
 
     data: dict[str, VariableValue]
 
+    def _resolve(self, parts: _KeyPath) -> VariableValue | object:
+        value = self.data
+        for part, index in parts:
+            if isinstance(value, dict):
+                if (value := value.get(part, _missing)) is _missing:
+                    return _missing
+            elif isinstance(value, list):
+                if index is None:
+                    return _missing
+                try:
+                    value = value[index]
+                except IndexError:
+                    return _missing
+            else:
+                return _missing
+        return value
+
     def __getitem__(self, key: str) -> VariableValue:
         """
         Get a value from the internal data dict.
@@ -332,25 +541,20 @@ class FormioData(UserDict):
         if "." not in key:
             return self.data[key]
 
-        value = self.data
-        raise_error = False
-        for k in key.split("."):
-            if isinstance(value, dict):
-                try:
-                    value = value[k]
-                except KeyError:
-                    raise_error = True
-            elif isinstance(value, list):
-                try:
-                    value = value[int(k)]
-                except (ValueError, IndexError):
-                    raise_error = True
-            else:
-                raise_error = True
+        if (value := self._resolve(_split_key(key))) is _missing:
+            raise KeyError(f"Key '{key}' is not present in the data")
+        return value  # type: ignore
 
-            if raise_error:
-                raise KeyError(f"Key '{key}' is not present in the data")
+    def get(self, key: str, default=None):
+        # Look up the value only once, rather than checking containment and then
+        # getting the item.
+        assert isinstance(key, str)
+
+        if "." not in key:
+            return self.data.get(key, default)
 
+        if (value := self._resolve(_split_key(key))) is _missing:
+            return default
         return value
 
     def __setitem__(self, key: str, value: VariableValue):
@@ -367,55 +571,40 @@ class FormioData(UserDict):
             return
 
         data = self.data
-        key_list = key.split(".")
-        for k in key_list[:-1]:
+        *parts, (last, _) = _split_key(key)
+        for k, index in parts:
             if isinstance(data, dict):
                 child = data.get(k, None)
             elif isinstance(data, list):
-                try:
-                    k = int(k)
-                    child = data[k]
-                except (ValueError, IndexError):
+                if index is None:
                     raise KeyError(f"Cannot set an item in a list on index '{k}'")
+                try:
+                    child = data[index]
+                except IndexError:
+                    raise KeyError(f"Cannot set an item in a list on index '{index}'")
+                k = index
             else:
                 raise AttributeError(f"Item '{data}' has no attribute '{k}'")
 
             if not isinstance(child, dict | list):
-                data[k] = {}
+                data[k] = child = {}
 
-            data = data[k]
+            data = child
 
-        data[key_list[-1]] = value
+        data[last] = value
 
     def __contains__(self, key: object) -> bool:
         """
         Check if the key is present in the data container.
 
-        This gets called via ``formio_data.get(...)`` to check if the default needs to
-        be returned or not. Keys are expected to be strings taken from ``variable.key``
-        fields.
+        Keys are expected to be strings taken from ``variable.key`` fields.
         """
         assert isinstance(key, str)
 
         if "." not in key:
             return key in self.data
 
-        value = self.data
-        for k in key.split("."):
-            if isinstance(value, dict):
-                try:
-                    value = value[k]
-                except KeyError:
-                    return False
-            elif isinstance(value, list):
-                try:
-                    value = value[int(k)]
-                except (ValueError, IndexError):
-                    return False
-            else:
-                return False
-
-        return True
+        return self._resolve(_split_key(key)) is not _missing
 
     def __delitem__(self, key: str) -> None:
         """
@@ -430,12 +619,9 @@ class FormioData(UserDict):
             del self.data[key]
             return
 
-        path, last = key.rsplit(".", 1)
+        *path, (last, index) = _split_key(key)
         error = KeyError(f"Key '{key}' is not present in the data")
-        try:
-            container = self[path]
-        except KeyError:
-            raise error
+        container = self._resolve(tuple(path))
 
         if isinstance(container, dict):
             try:
@@ -443,9 +629,11 @@ class FormioData(UserDict):
             except KeyError:
                 raise error
         elif isinstance(container, list):
+            if index is None:
+                raise error
             try:
-                container.pop(int(last))
-            except (ValueError, IndexError):
+                container.pop(index)
+            except IndexError:
                 raise error
         else:
             raise error
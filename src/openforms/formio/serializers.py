@@ -8,7 +8,7 @@ https://github.com/formio/formio.js/blob/4.13.x/src/validator/Validator.js.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import TYPE_CHECKING
 
 import structlog
@@ -52,29 +52,24 @@ class StepDataSerializer(serializers.Serializer):
 
         assert self.context
         assert "configuration_wrapper" in self.context
-        config_wrapper: FormioConfigurationWrapper = self.context[
-            "configuration_wrapper"
-        ]
-
-        values = FormioData(self.initial_data)
-
-        # loop over all components and delegate application to the registry
-        for component in iter_components(configuration, recurse_into_editgrid=False):
-            # Components without submission data do not have serializer fields
-            # associated with them.
-            if not register.holds_submission_data(component):
-                continue
-
-            is_hidden = config_wrapper.is_hidden(component["key"], values)
-
-            # we don't have to do anything when the component is visible, regular
-            # validation rules apply
-            if not is_hidden:
-                continue
+        hidden_keys = get_hidden_component_keys(
+            configuration,
+            FormioData(self.initial_data),
+            config_wrapper=self.context["configuration_wrapper"],
+            register=register,
+        )
+        self.remove_validations(fields, hidden_keys)
 
+    def remove_validations(
+        self, fields: dict[str, FieldOrNestedFields], keys: Collection[str]
+    ) -> None:
+        """
+        Remove all the validators from the serializer fields of the provided keys.
+        """
+        for key in keys:
             # when it's not visible, grab the field from the serializer and remove all
             # the validators to match Formio's behaviour.
-            serializer_field = glom(fields, component["key"])
+            serializer_field = glom(fields, key)
             self._remove_validations_from_field(serializer_field)
 
     def _remove_validations_from_field(self, field: serializers.Field) -> None:
@@ -123,6 +118,33 @@ class StepDataSerializer(serializers.Serializer):
     required = property(_get_required, _set_required)  # type:ignore
 
 
+def get_hidden_component_keys(
+    configuration: FormioConfiguration,
+    values: FormioData,
+    config_wrapper: FormioConfigurationWrapper,
+    register: ComponentRegistry,
+) -> frozenset[str]:
+    """
+    Determine the keys of the components holding submission data that are hidden.
+
+    Components may be hidden in a static fashion (through the 'hidden' property), or be
+    hidden dynamically based on the input data via the 'conditional' property.
+    """
+    hidden_keys: set[str] = set()
+    # loop over all components and delegate application to the registry
+    for component in iter_components(configuration, recurse_into_editgrid=False):
+        # Components without submission data do not have serializer fields
+        # associated with them.
+        if not register.holds_submission_data(component):
+            continue
+
+        # we don't have to do anything when the component is visible, regular
+        # validation rules apply
+        if config_wrapper.is_hidden(component["key"], values):
+            hidden_keys.add(component["key"])
+    return frozenset(hidden_keys)
+
+
 def dict_to_serializer(
     fields: dict[str, FieldOrNestedFields], **kwargs
 ) -> StepDataSerializer:
@@ -150,13 +172,19 @@ def dict_to_serializer(
 
 
 def build_serializer(
-    components: Sequence[Component], register: ComponentRegistry, **kwargs
+    components: Sequence[Component],
+    register: ComponentRegistry,
+    hidden_keys: Collection[str] | None = None,
+    **kwargs,
 ) -> StepDataSerializer:
     """
     Translate a sequence of Formio.js component definitions into a serializer.
 
     This recursively builds up the serializer fields for each (nested) component and
     puts them into a serializer instance ready for validation.
+
+    :param hidden_keys: The keys of the components that are known to be hidden. If
+      provided, the hidden state is not derived from the input data.
     """
     if context := kwargs.get("context"):
         assert isinstance(context, dict) and "configuration" in context
@@ -177,5 +205,8 @@ def build_serializer(
         assign(obj=fields, path=component["key"], val=field, missing=dict)
 
     serializer = dict_to_serializer(fields, **kwargs)
-    serializer.apply_hidden_state(config, fields, register)
+    if hidden_keys is not None:
+        serializer.remove_validations(fields, hidden_keys)
+    else:
+        serializer.apply_hidden_state(config, fields, register)
     return serializer
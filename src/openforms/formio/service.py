@@ -34,7 +34,7 @@ from .utils import (
     iter_components,
 )
 from .variables import extract_variables_from_template_properties, inject_variables
-from .visibility import is_hidden, process_visibility
+from .visibility import VisibilityGraph, is_hidden, process_visibility
 
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
@@ -55,6 +55,7 @@ __all__ = [
     "as_json_data",
     "as_json_schema",
     "process_visibility",
+    "VisibilityGraph",
     "get_component_empty_value",
     "get_branch_representation",
     "holds_submission_data",
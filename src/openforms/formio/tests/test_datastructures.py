@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest import TestCase
 
 from openforms.formio.typing import (
@@ -12,6 +13,7 @@ from ..datastructures import (
     FormioConfiguration,
     FormioConfigurationWrapper,
     FormioData,
+    _component_indices,
 )
 
 
@@ -100,6 +102,34 @@ class FormioDataTests(TestCase):
         with self.subTest("nested list absent"):
             self.assertFalse("list.4.foo" in formio_data)
 
+    def test_get_with_default(self):
+        formio_data = FormioData(
+            {"foo": {"bar": None}, "list": [{"foo": "bar"}], "key": "value"}
+        )
+
+        self.assertIsNone(formio_data.get("foo.bar", "a default"))
+        self.assertEqual(formio_data.get("list.0.foo", "a default"), "bar")
+        self.assertEqual(formio_data.get("list.-1.foo", "a default"), "bar")
+        self.assertEqual(formio_data.get("list.1.foo", "a default"), "a default")
+        self.assertEqual(formio_data.get("list.foo", "a default"), "a default")
+        self.assertEqual(formio_data.get("key.0", "a default"), "a default")
+        self.assertEqual(formio_data.get("absent", "a default"), "a default")
+
+    def test_set_nested_list_item(self):
+        formio_data = FormioData({"list": [{"foo": "bar"}, "baz"]})
+
+        formio_data["list.0.foo"] = "updated"
+        formio_data["list.1.foo"] = "replaced"
+
+        self.assertEqual(
+            formio_data.data,
+            {"list": [{"foo": "updated"}, {"foo": "replaced"}]},
+        )
+        with self.assertRaises(KeyError):
+            formio_data["list.2.foo"] = "out of range"
+        with self.assertRaises(KeyError):
+            formio_data["list.foo.bar"] = "not an index"
+
     def test_initializing_with_dotted_paths_expands(self):
         formio_data = FormioData(
             {
@@ -257,6 +287,10 @@ class FormioDataTests(TestCase):
 
 
 class FormioConfigurationWrapperTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(_component_indices.clear)
+
     def test_editgrid_lookups_by_key(self):
         outer_textfield: Component = {
             "type": "textfield",
@@ -541,3 +575,108 @@ class FormioConfigurationWrapperTests(TestCase):
             ],
         }
         self.assertEqual(duplicates, expected)
+
+    def test_component_map_reuses_structure_of_identical_configuration(self):
+        configuration: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "textfield", "label": "Textfield"},
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "components": [
+                        {
+                            "type": "editgrid",
+                            "key": "editgrid",
+                            "label": "Repeating group",
+                            "components": [
+                                {"type": "email", "key": "email", "label": "Email"}
+                            ],
+                        }
+                    ],
+                },
+            ]
+        }
+        original_map = FormioConfigurationWrapper(configuration).component_map
+        copied_configuration = deepcopy(configuration)
+        config_wrapper = FormioConfigurationWrapper(copied_configuration)
+
+        component_map = config_wrapper.component_map
+
+        self.assertEqual(list(component_map), list(original_map))
+        fieldset = copied_configuration["components"][1]
+        editgrid = fieldset["components"][0]  # type: ignore
+        email = editgrid["components"][0]
+        with self.subTest("components of the copied configuration are returned"):
+            self.assertIs(component_map["fieldset"], fieldset)
+            self.assertIs(component_map["editgrid"], editgrid)
+            self.assertIs(component_map["email"], email)
+            self.assertIs(component_map["editgrid.email"], email)
+        with self.subTest("parent refs are restored"):
+            self.assertIs(config_wrapper.get_parent("email"), editgrid)
+            self.assertIs(config_wrapper.get_parent("editgrid"), fieldset)
+            self.assertIsNone(config_wrapper.get_parent("textfield"))
+
+    def test_component_map_of_modified_configuration(self):
+        configuration: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "textfield", "label": "Textfield"},
+            ]
+        }
+        FormioConfigurationWrapper(configuration).component_map  # noqa: B018
+        configuration["components"].insert(
+            0, {"type": "email", "key": "email", "label": "Email"}
+        )
+
+        component_map = FormioConfigurationWrapper(configuration).component_map
+
+        self.assertEqual(list(component_map), ["email", "textfield"])
+        self.assertIs(component_map["email"], configuration["components"][0])
+
+    def test_copy(self):
+        configuration: FormioConfiguration = {
+            "components": [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "components": [
+                        {
+                            "type": "editgrid",
+                            "key": "editgrid",
+                            "label": "Repeating group",
+                            "components": [
+                                {
+                                    "type": "email",
+                                    "key": "email",
+                                    "label": "Email",
+                                    "validate": {"required": False},
+                                }
+                            ],
+                        }
+                    ],
+                },
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(configuration)
+
+        copied_wrapper = config_wrapper.copy()
+
+        self.assertEqual(copied_wrapper.configuration, configuration)
+        self.assertEqual(
+            list(copied_wrapper.component_map), list(config_wrapper.component_map)
+        )
+        with self.subTest("component map points to copied components"):
+            fieldset = copied_wrapper.configuration["components"][0]
+            email = fieldset["components"][0]["components"][0]  # type: ignore
+
+            self.assertIs(copied_wrapper["fieldset"], fieldset)
+            self.assertIs(copied_wrapper["email"], email)
+            self.assertIs(copied_wrapper["editgrid.email"], email)
+            self.assertEqual(copied_wrapper.get_parent("email")["key"], "editgrid")  # type: ignore
+        with self.subTest("copy is independent of the original"):
+            copied_wrapper["email"]["validate"]["required"] = True  # type: ignore
+
+            self.assertFalse(config_wrapper["email"]["validate"]["required"])  # type: ignore
+        with self.subTest("deepcopy"):
+            self.assertEqual(deepcopy(config_wrapper).configuration, configuration)
@@ -1,3 +1,6 @@
+from copy import deepcopy
+from unittest.mock import patch
+
 from django.test import SimpleTestCase, tag
 
 from hypothesis import example, given, strategies as st
@@ -8,7 +11,7 @@ from openforms.typing import JSONPrimitive
 
 from ..datastructures import FormioConfigurationWrapper, FormioData
 from ..typing import Component
-from ..visibility import is_hidden
+from ..visibility import VisibilityGraph, is_hidden, process_visibility
 
 FORMIO_COMPONENTS: list[Component] = [
     {
@@ -159,3 +162,131 @@ class IsHiddenTests(SimpleTestCase):
             is_hidden(component, data, configuration_wrapper)
         except Exception:
             self.fail("Visibility check unexpectedly crashed")
+
+
+def _textfield(key: str, when: str = "", eq: str = "") -> Component:
+    component: Component = {"type": "textfield", "key": key, "label": key}
+    if when:
+        component["conditional"] = {"show": True, "when": when, "eq": eq}
+    return component
+
+
+class VisibilityGraphTests(SimpleTestCase):
+    def _process(self, configuration, data: FormioData) -> list[str]:
+        wrapper = FormioConfigurationWrapper(configuration)
+        graph = VisibilityGraph.build(configuration, wrapper)
+        evaluated = []
+
+        def _is_hidden(component, *args):
+            evaluated.append(component["key"])
+            return is_hidden(component, *args)
+
+        with patch("openforms.formio.visibility.is_hidden", side_effect=_is_hidden):
+            graph.process(data)
+
+        return evaluated
+
+    def _process_until_unchanged(self, configuration, data: FormioData) -> None:
+        wrapper = FormioConfigurationWrapper(configuration)
+        processed_data = None
+        while processed_data != data:
+            processed_data = deepcopy(data)
+            process_visibility(configuration, data, wrapper)
+
+    def test_single_pass_without_forward_references(self):
+        configuration = {
+            "components": [
+                _textfield("a"),
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "conditional": {"show": True, "when": "a", "eq": "yes"},
+                    "components": [_textfield("b")],
+                },
+                {
+                    "type": "columns",
+                    "key": "columns",
+                    "label": "Columns",
+                    "columns": [
+                        {"size": 6, "components": [_textfield("c", when="b", eq="x")]},
+                        {"size": 6, "components": [_textfield("d")]},
+                    ],
+                },
+            ]
+        }
+        data = FormioData({"a": "no", "b": "x", "c": "foo", "d": "bar"})
+
+        evaluated = self._process(configuration, data)
+
+        self.assertEqual(evaluated, ["a", "fieldset", "columns", "c", "d"])
+        self.assertEqual(data, {"a": "no", "d": "bar"})
+
+    def test_only_affected_components_are_evaluated_again(self):
+        configuration = {
+            "components": [
+                _textfield("a", when="c", eq="x"),
+                _textfield("b"),
+                _textfield("c", when="d", eq="yes"),
+                _textfield("d"),
+            ]
+        }
+        data = FormioData({"a": "foo", "b": "bar", "c": "x", "d": "no"})
+
+        evaluated = self._process(configuration, data)
+
+        self.assertEqual(evaluated, ["a", "b", "c", "d", "a"])
+        self.assertEqual(data, {"b": "bar", "d": "no"})
+
+    def test_same_result_as_repeated_processing(self):
+        configuration = {
+            "components": [
+                _textfield("textfield2", when="textfield3", eq="visible"),
+                {
+                    **_textfield("textfield3"),
+                    "conditional": {
+                        "show": False,
+                        "when": "textfield1",
+                        "eq": "hidden",
+                    },
+                },
+                _textfield("textfield1"),
+                _textfield("textfield4", when="textfield2", eq=""),
+                {
+                    "type": "editgrid",
+                    "key": "editgrid",
+                    "label": "Repeating group",
+                    "components": [
+                        _textfield("child1", when="editgrid.child2", eq="x"),
+                        _textfield("child2"),
+                        _textfield("child3", when="textfield5", eq="x"),
+                    ],
+                },
+                _textfield("textfield5", when="textfield1", eq="visible"),
+            ]
+        }
+        data = {
+            "textfield1": "hidden",
+            "textfield2": "visible",
+            "textfield3": "visible",
+            "textfield4": "",
+            "textfield5": "x",
+            "editgrid": [
+                {"child1": "a", "child2": "x", "child3": "b"},
+                {"child1": "c", "child2": "y"},
+            ],
+        }
+        expected = FormioData(deepcopy(data))
+        self._process_until_unchanged(configuration, expected)
+
+        result = FormioData(deepcopy(data))
+        self._process(configuration, result)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            result,
+            {
+                "textfield1": "hidden",
+                "editgrid": [{"child1": "a", "child2": "x"}, {"child2": "y"}],
+            },
+        )
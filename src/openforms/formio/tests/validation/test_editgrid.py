@@ -1,4 +1,5 @@
 from collections import namedtuple
+from unittest.mock import patch
 
 from django.test import SimpleTestCase, tag
 
@@ -14,6 +15,8 @@ from ...service import build_serializer
 from ...typing import EditGridComponent, FieldsetComponent
 from .helpers import extract_error, validate_formio_data
 
+_build_child = EditGridField._build_child
+
 
 class EditGridValidationTests(SimpleTestCase):
     """
@@ -467,6 +470,55 @@ class EditGridValidationTests(SimpleTestCase):
         error = extract_error(errors["editgrid"][0], "textfield2")
         self.assertEqual(error.code, "required")
 
+    def test_items_with_same_hidden_state_share_serializer(self):
+        component: EditGridComponent = {
+            "type": "editgrid",
+            "key": "editgrid",
+            "label": "Edit grid with nested conditional",
+            "groupLabel": "item",
+            "components": [
+                {
+                    "type": "textfield",
+                    "key": "textfield1",
+                    "label": "text field 1",
+                },
+                {
+                    "type": "textfield",
+                    "key": "textfield2",
+                    "label": "text field 2",
+                    "validate": {"required": True},
+                    "conditional": {  # type: ignore
+                        "eq": "SHOW_FIELD_2",
+                        "show": True,
+                        "when": "editgrid.textfield1",
+                    },
+                },
+            ],
+        }
+        data: JSONValue = {
+            "editgrid": [
+                {"textfield1": "NO_SHOW_FIELD_2"},
+                {"textfield1": "SHOW_FIELD_2"},
+                {"textfield1": "NO_SHOW_FIELD_2"},
+                {"textfield1": "SHOW_FIELD_2", "textfield2": "filled"},
+                {"textfield1": "SHOW_FIELD_2"},
+            ]
+        }
+
+        with patch.object(
+            EditGridField, "_build_child", autospec=True, side_effect=_build_child
+        ) as mock_build_child:
+            is_valid, errors = validate_formio_data(component, data)
+
+        self.assertFalse(is_valid)
+        # one serializer for the visible and one for the hidden state of textfield2
+        self.assertEqual(mock_build_child.call_count, 2)
+        self.assertEqual(set(errors["editgrid"]), {1, 4})
+        for idx in (1, 4):
+            with self.subTest(idx=idx):
+                error = extract_error(errors["editgrid"][idx], "textfield2")
+                self.assertEqual(error.code, "required")
+
 
 class EditGridFieldTests(SimpleTestCase):
     """
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from copy import deepcopy
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
 from openforms.typing import JSONObject
 
 from .registry import register
 from .typing import Column, Component, ConditionalCompareValue
+from .utils import iter_components
 
 if TYPE_CHECKING:
     from .datastructures import (
@@ -152,3 +158,185 @@ def process_visibility(
             get_evaluation_data=get_evaluation_data,
             data_for_visible_state=data_for_visible_state,
         )
+
+
+# Maximum number of passes over the components, as a safety net for conditional logic
+# that does not converge to a final state.
+MAX_VISIBILITY_PASSES = 50
+
+_missing = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _Node:
+    component: Component
+    parent: Component | None
+    """
+    The closest ancestor component that is processed in the same data scope, if any.
+    """
+
+
+def _iter_nodes(
+    configuration: FormioConfiguration | Component | Column | JSONObject,
+    parent: Component | None = None,
+) -> Iterator[_Node]:
+    # Mirrors the traversal of :func:`process_visibility` - fieldsets and columns
+    # apply the visibility of their children using the same data, while the children
+    # of edit grids are processed for every item (as part of the edit grid node).
+    for component in configuration.get("components", []):
+        yield _Node(component=component, parent=parent)
+        match component["type"]:
+            case "fieldset":
+                yield from _iter_nodes(component, parent=component)
+            case "columns":
+                for column in component["columns"]:
+                    yield from _iter_nodes(column, parent=component)
+
+
+class VisibilityGraph:
+    """
+    The components of a configuration with the dependencies of their visibility.
+
+    A component depends on its parent component (it's hidden when the parent is hidden)
+    and on the component referenced in its simple conditional (``conditional.when``),
+    of which the value may be cleared. Processing the visibility gives the same result
+    as repeatedly calling :func:`process_visibility` until the data no longer changes,
+    but after the first pass only the components of which a dependency changed are
+    evaluated again.
+    """
+
+    def __init__(
+        self,
+        wrapper: FormioConfigurationWrapper,
+        nodes: Sequence[_Node],
+        dependents: Sequence[Sequence[int]],
+    ):
+        self.wrapper = wrapper
+        self._nodes = nodes
+        self._dependents = dependents
+        self._positions = {
+            id(node.component): index for index, node in enumerate(nodes)
+        }
+
+    @classmethod
+    def build(
+        cls,
+        configuration: FormioConfiguration,
+        wrapper: FormioConfigurationWrapper,
+    ) -> VisibilityGraph:
+        """
+        Build the graph for the configuration.
+
+        :param configuration: Formio configuration.
+        :param wrapper: Formio configuration wrapper. Required for component lookup.
+        """
+        nodes = list(_iter_nodes(configuration))
+        positions = {id(node.component): index for index, node in enumerate(nodes)}
+        positions_by_key: defaultdict[str, list[int]] = defaultdict(list)
+        for index, node in enumerate(nodes):
+            positions_by_key[node.component["key"]].append(index)
+
+        def _get_trigger_positions(key: str) -> list[int]:
+            if key in positions_by_key:
+                return positions_by_key[key]
+            if key not in wrapper:
+                return []
+            # the trigger is nested inside an edit grid, which takes care of the
+            # values of its children
+            component = wrapper[key]
+            while (component := wrapper.get_parent(component["key"])) is not None:
+                if (component_key := component["key"]) in positions_by_key:
+                    return positions_by_key[component_key]
+            return []
+
+        dependents: list[set[int]] = [set() for _ in nodes]
+        for index, node in enumerate(nodes):
+            component = node.component
+            if node.parent is not None:
+                dependents[positions[id(node.parent)]].add(index)
+
+            conditionals = [get_conditional(component)]
+            # the children of an edit grid are processed as part of the edit grid. Note
+            # that children depending on (later) children of the same edit grid make
+            # the edit grid depend on itself.
+            if component["type"] == "editgrid":
+                conditionals += [
+                    get_conditional(child)
+                    for child in iter_components(component, recursive=True)
+                ]
+            for conditional in conditionals:
+                if conditional is None:
+                    continue
+                for position in _get_trigger_positions(conditional[1]):
+                    dependents[position].add(index)
+
+        return cls(
+            wrapper,
+            nodes=nodes,
+            dependents=[sorted(node_dependents) for node_dependents in dependents],
+        )
+
+    def process(self, data: FormioData) -> None:
+        """
+        Process the visibility of the components, clearing the values of hidden
+        components when applicable (``clearOnHide`` is ``True``).
+
+        Note that the data mutations are applied directly.
+
+        :param data: Data used for processing.
+        """
+        hidden_state = [False] * len(self._nodes)
+        # the first pass evaluates all components in document order, the next passes
+        # only the components that are affected by changes of a later component
+        pending = list(range(len(self._nodes)))
+        for _ in range(MAX_VISIBILITY_PASSES):
+            if not pending:
+                return
+            scheduled = set(pending)
+            next_pending: set[int] = set()
+            while pending:
+                index = heapq.heappop(pending)
+                scheduled.remove(index)
+                if not self._process_node(index, data, hidden_state):
+                    continue
+                for dependent in self._dependents[index]:
+                    if dependent <= index:
+                        next_pending.add(dependent)
+                    elif dependent not in scheduled:
+                        heapq.heappush(pending, dependent)
+                        scheduled.add(dependent)
+            pending = sorted(next_pending)
+        raise RuntimeError("Potential infinite loop stopped!")
+
+    def _process_node(
+        self, index: int, data: FormioData, hidden_state: list[bool]
+    ) -> bool:
+        # Returns whether the hidden state or the data of the component changed.
+        node = self._nodes[index]
+        component = node.component
+        key = component["key"]
+
+        parent_hidden = (
+            node.parent is not None and hidden_state[self._positions[id(node.parent)]]
+        )
+        hidden = parent_hidden or is_hidden(component, data, self.wrapper)
+        changed = hidden != hidden_state[index]
+        hidden_state[index] = hidden
+
+        if (
+            hidden
+            and component.get("clearOnHide", True)
+            and register.holds_submission_data(component)
+        ):
+            changed |= data.pop(key, _missing) is not _missing
+
+        # the children of layout components are nodes of their own
+        if component["type"] in ("fieldset", "columns"):
+            return changed
+
+        track_value = bool(self._dependents[index]) and key in data
+        value = deepcopy(data[key]) if track_value else None
+        register.apply_visibility(component, data, self.wrapper, parent_hidden=hidden)
+        if track_value:
+            changed |= data.get(key) != value
+        return changed
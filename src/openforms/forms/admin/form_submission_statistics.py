@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.db.models import Count, ExpressionWrapper, F, IntegerField
+from django.db.models import Count
 from django.template.response import TemplateResponse
 from django.urls import path
 from django.utils.translation import gettext_lazy as _
@@ -19,19 +19,14 @@ class FormSubmissionStatisticsAdmin(admin.ModelAdmin):
     """
     Modified admin view to display the submission statistics for each form.
 
-    The table displays the form name, number of submission and when the first and last
-    submission happened _within the selected date range_. We do this by looking at the
-    logged events for each completed submission, stored in the django-timeline-logger
-    database table with particular metadata.
+    The table displays the form name and number of submissions _within the selected
+    date range_. We do this by looking at the statistics records that are created when
+    the events for each completed submission are logged.
 
     Filtering for submissions on date range is possible based on the timestamp.
 
-    If the log events are pruned, this affects the reported statistics. Filtering a date
-    range will also show the first/last timestamps within the selected range.
-
-    There are no detail views to click through, the table overview is all you get. If
-    you construct the URLs by hand, you end up in the standard timeline log detail page.
-    No permissions to create, delete or modify records are enabled.
+    There are no detail views to click through, the table overview is all you get. No
+    permissions to create, delete or modify records are enabled.
     """
 
     list_filter = (
@@ -44,7 +39,7 @@ class FormSubmissionStatisticsAdmin(admin.ModelAdmin):
             ),
         ),
     )
-    search_fields = ("extra_data__form_name",)
+    search_fields = ("form_name",)
     show_full_result_count = False
 
     def has_add_permission(self, request):
@@ -77,17 +72,8 @@ class FormSubmissionStatisticsAdmin(admin.ModelAdmin):
         assert response.context_data is not None
         qs = (
             response.context_data["cl"]
-            .queryset.annotate(
-                form_id=ExpressionWrapper(
-                    F("extra_data__form_id"), output_field=IntegerField()
-                )
-            )
-            .exclude(form_id__isnull=True)
-            .values("form_id")
-            .annotate(
-                submission_count=Count("id"),
-                form_name=F("extra_data__form_name"),
-            )
+            .queryset.values("form_id", "form_name")
+            .annotate(submission_count=Count("id"))
             .order_by("form_name")
         )
         response.context_data["aggregated_qs"] = qs
@@ -80,7 +80,15 @@ def process_forms_import(import_file: str, user_id: int) -> None:
     # This deletes the temp dir once the context manager is exited
     with tempfile.TemporaryDirectory() as temp_dir:
         with zipfile.ZipFile(private_media_storage.open(import_file), "r") as zip_file:
-            for zipped_form_file in zip_file.infolist():
+            zipped_form_files = zip_file.infolist()
+            total = len(zipped_form_files)
+            for index, zipped_form_file in enumerate(zipped_form_files, start=1):
+                logger.info(
+                    "forms.import_progress",
+                    filename=Path(zipped_form_file.filename).name,
+                    position=index,
+                    total=total,
+                )
                 try:
                     # This normalises the path before extracting the files (to avoid writing outside the temp_dir)
                     import_form(
@@ -0,0 +1,30 @@
+from django.core.management import BaseCommand
+
+from openforms.logging.constants import (
+    FORM_SUBMIT_SUCCESS_EVENT,
+    REGISTRATION_SUCCESS_EVENT,
+)
+
+from ...statistics import backfill_submission_statistics
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the submission statistics records from the submission completion and "
+        "registration events that were logged before these records were introduced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of log records to process at once.",
+        )
+
+    def handle(self, *args, **options):
+        for event in (FORM_SUBMIT_SUCCESS_EVENT, REGISTRATION_SUCCESS_EVENT):
+            num_created = backfill_submission_statistics(
+                event, batch_size=options["batch_size"]
+            )
+            self.stdout.write(f"Created {num_created} record(s) for '{event}' events.")
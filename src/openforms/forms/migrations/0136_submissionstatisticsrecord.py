@@ -0,0 +1,99 @@
+# Generated by Django 5.2.17 on 2026-10-17 07:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("forms", "0135_form_help_dialog_content_form_help_dialog_content_en_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionStatisticsRecord",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event", models.CharField(max_length=50, verbose_name="event")),
+                (
+                    "form_name",
+                    models.CharField(max_length=150, verbose_name="form name"),
+                ),
+                (
+                    "internal_form_name",
+                    models.CharField(
+                        blank=True, max_length=150, verbose_name="internal form name"
+                    ),
+                ),
+                (
+                    "public_reference",
+                    models.CharField(
+                        blank=True, max_length=100, verbose_name="public reference"
+                    ),
+                ),
+                (
+                    "submitted_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="submitted on"
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Moment the event was logged.",
+                        verbose_name="timestamp",
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="forms.form",
+                        verbose_name="form",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "submission statistics record",
+                "verbose_name_plural": "submission statistics records",
+                "indexes": [
+                    models.Index(
+                        fields=["event", "timestamp"],
+                        name="forms_submi_event_fc6194_idx",
+                    ),
+                    models.Index(
+                        fields=["event", "form", "timestamp"],
+                        name="forms_submi_event_5264db_idx",
+                    ),
+                ],
+            },
+        ),
+        # the admin statistics proxy model now reads from the records rather than the
+        # log records - the content type and permissions are retained
+        migrations.DeleteModel(name="FormSubmissionStatistics"),
+        migrations.CreateModel(
+            name="FormSubmissionStatistics",
+            fields=[],
+            options={
+                "verbose_name": "form submission statistics",
+                "verbose_name_plural": "form submission statistics",
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("forms.submissionstatisticsrecord",),
+        ),
+    ]
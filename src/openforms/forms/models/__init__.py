@@ -4,7 +4,10 @@ from .form_authentication_backend import FormAuthenticationBackend
 from .form_definition import FormDefinition
 from .form_registration_backend import FormRegistrationBackend
 from .form_step import FormStep
-from .form_submission_statistics import FormSubmissionStatistics
+from .form_submission_statistics import (
+    FormSubmissionStatistics,
+    SubmissionStatisticsRecord,
+)
 from .form_variable import FormVariable
 from .form_version import FormVersion
 from .logic import FormLogic
@@ -17,6 +20,7 @@ __all__ = [
     "FormVersion",
     "FormLogic",
     "FormSubmissionStatistics",
+    "SubmissionStatisticsRecord",
     "FormVariable",
     "Category",
     "FormRegistrationBackend",
@@ -2,31 +2,75 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from openforms.logging.constants import FORM_SUBMIT_SUCCESS_EVENT
-from openforms.logging.models import TimelineLogProxy
+
+from .form import Form
+
+
+class SubmissionStatisticsRecord(models.Model):
+    """
+    Snapshot of a completed or registered submission, used for the statistics.
+
+    A record is created whenever a submission is completed or successfully registered
+    (the ``form_submit_success`` and ``registration_success`` events), so that the
+    statistics can be queried on indexed columns rather than by scanning the JSON data
+    of (all) the log records. Records for events logged before this table existed are
+    created with the ``backfill_submission_statistics`` management command.
+
+    The form details are copied rather than looked up, since the statistics must remain
+    available after the submissions (and possibly forms) have been deleted.
+    """
+
+    event = models.CharField(_("event"), max_length=50)
+    form = models.ForeignKey(
+        Form,
+        on_delete=models.SET_NULL,
+        verbose_name=_("form"),
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    form_name = models.CharField(_("form name"), max_length=150)
+    internal_form_name = models.CharField(
+        _("internal form name"), max_length=150, blank=True
+    )
+    public_reference = models.CharField(
+        _("public reference"), max_length=100, blank=True
+    )
+    submitted_on = models.DateTimeField(_("submitted on"), null=True, blank=True)
+    timestamp = models.DateTimeField(
+        _("timestamp"),
+        default=timezone.now,
+        help_text=_("Moment the event was logged."),
+    )
+
+    class Meta:
+        verbose_name = _("submission statistics record")
+        verbose_name_plural = _("submission statistics records")
+        indexes = [
+            models.Index(fields=["event", "timestamp"]),
+            models.Index(fields=["event", "form", "timestamp"]),
+        ]
+
+    def __str__(self):
+        return f"{self.event}: {self.form_name} ({self.timestamp.isoformat()})"
 
 
 class FormStatisticsV2Manager(models.Manager["FormSubmissionStatistics"]):
     def get_queryset(self):
-        from openforms.submissions.models import Submission
-
         qs = super().get_queryset()
-        submission_content_type = ContentType.objects.get_for_model(Submission)
         # only consider form_submit_success events, recorded by
         # openforms.submissions.api.mixins.SubmissionCompletionMixin._complete_submission
-        return qs.filter(
-            content_type=submission_content_type,
-            extra_data__log_event=FORM_SUBMIT_SUCCESS_EVENT,
-        )
+        return qs.filter(event=FORM_SUBMIT_SUCCESS_EVENT)
 
 
-class FormSubmissionStatistics(TimelineLogProxy):
+class FormSubmissionStatistics(SubmissionStatisticsRecord):
     """
-    Display aggregated statistics in the admin based on log records.
+    Display aggregated statistics in the admin based on the statistics records.
 
     The model kind of abused to make use of standard Django admin functions for the
     list display and filter fields, rather than writing an entirely custom admin view.
@@ -36,7 +80,6 @@ class FormSubmissionStatistics(TimelineLogProxy):
     """
 
     # annotation fields
-    form_name: str
     submission_count: int
     first_submission: datetime
     last_submission: datetime
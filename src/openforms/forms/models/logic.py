@@ -11,7 +11,9 @@ from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
 
 from openforms.forms.models import FormStep
+from openforms.typing import JSONValue
 from openforms.utils.json_logic import introspect_json_logic
+from openforms.utils.json_logic.compiler import CompiledExpression, compile_json_logic
 from openforms.variables.service import resolve_key
 
 if TYPE_CHECKING:
@@ -73,6 +75,8 @@ class FormLogic(OrderedModel):
     _steps: set[FormStep] | None = None
     _input_variables_from_action_map: Mapping[str, set[int]] | None = None
     _output_variables_from_action_map: Mapping[str, set[int]] | None = None
+    _compiled_actions: tuple[list, list[ActionOperation]] | None = None
+    _compiled_trigger: tuple[JSONValue, CompiledExpression] | None = None
 
     class Meta(OrderedModel.Meta):
         verbose_name = _("form logic")
@@ -82,9 +86,28 @@ class FormLogic(OrderedModel):
     def action_operations(self) -> Iterator[ActionOperation]:
         from openforms.submissions.logic.actions import compile_action_operation
 
-        for action in map(compile_action_operation, self.actions):
-            action.rule = self
-            yield action
+        # The actions are compiled only once per instance, unless they are replaced.
+        actions = self.actions
+        if self._compiled_actions is None or self._compiled_actions[0] is not actions:
+            operations = list(map(compile_action_operation, actions))
+            for operation in operations:
+                operation.rule = self
+            self._compiled_actions = (actions, operations)
+
+        yield from self._compiled_actions[1]
+
+    @property
+    def compiled_trigger(self) -> CompiledExpression:
+        """
+        The JSON logic trigger compiled into a callable taking the evaluation data.
+        """
+        # The trigger is compiled only once per instance, unless it is replaced. The
+        # compiler cache shares the program between instances of the same rule.
+        trigger = self.json_logic_trigger
+        if self._compiled_trigger is None or self._compiled_trigger[0] is not trigger:
+            program = compile_json_logic(trigger, use_var_undefined=True)
+            self._compiled_trigger = (trigger, program)
+        return self._compiled_trigger[1]
 
     @property
     def hidden_actions(self) -> Iterator[PropertyAction]:
@@ -1,10 +1,13 @@
 from datetime import date, datetime, time
 
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db import models, transaction
+from django.utils.dateparse import parse_datetime
 from django.utils.timezone import make_aware
 from django.utils.translation import gettext_lazy as _
 
+import structlog
 from tablib import Dataset
 
 from openforms.logging.constants import (
@@ -14,7 +17,9 @@ from openforms.logging.constants import (
 from openforms.logging.models import TimelineLogProxy
 from openforms.submissions.models import Submission
 
-from .models import Form
+from .models import Form, SubmissionStatisticsRecord
+
+logger = structlog.stdlib.get_logger(__name__)
 
 
 def export_registration_statistics(
@@ -26,9 +31,9 @@ def export_registration_statistics(
     """
     Export the form registration statistics to a tablib Dataset.
 
-    The export retrieves log records within the specified date range (closed interval,
-    [start_date, end_date]), optionally filtering them down to a set of forms. Only log
-    records for successful registration are considered.
+    The export retrieves the statistics records within the specified date range (closed
+    interval, [start_date, end_date]), optionally filtering them down to a set of forms.
+    Only records for the specified event are considered.
 
     :param start_date: include log records starting from this date (midnight, in the local
       timezone).
@@ -64,52 +69,140 @@ def export_registration_statistics(
     _start_date = make_aware(datetime.combine(start_date, time.min))
     _end_date = make_aware(datetime.combine(end_date, time.max))
 
-    log_records = TimelineLogProxy.objects.filter(
-        content_type=ContentType.objects.get_for_model(Submission),
+    records = SubmissionStatisticsRecord.objects.filter(
+        event=event,
         timestamp__gte=_start_date,
         timestamp__lte=_end_date,
+    ).order_by("timestamp")
+
+    if limit_to_forms:
+        records = records.filter(form__in=limit_to_forms.values("pk"))
+
+    for record in records.iterator():
+        dataset.append(
+            (
+                record.public_reference,
+                record.form_name,
+                record.internal_form_name,
+                # when the user submitted the form
+                record.submitted_on.isoformat() if record.submitted_on else None,
+                # when the registration succeeeded - this must be close to when it was logged
+                record.timestamp.isoformat(),
+            )
+        )
+
+    return dataset
+
+
+def record_submission_statistics(
+    event: str, submission: Submission, timestamp: datetime
+) -> None:
+    """
+    Record the completion or registration of a submission for the statistics.
+
+    Failing to record the statistics is logged, but does not fail the completion or
+    registration of the submission.
+
+    :param event: The event, either ``form_submit_success`` or
+      ``registration_success``.
+    :param submission: The submission the event is about.
+    :param timestamp: The moment the event happened.
+    """
+    try:
+        with transaction.atomic():
+            SubmissionStatisticsRecord.objects.create(
+                event=event,
+                form=submission.form,
+                form_name=submission.form.name,
+                internal_form_name=submission.form.internal_name,
+                public_reference=submission.public_registration_reference,
+                submitted_on=submission.completed_on,
+                timestamp=timestamp,
+            )
+    except Exception as exc:
+        logger.error(
+            "submission_statistics_recording_failure",
+            event_name=event,
+            submission_uuid=str(submission.uuid),
+            exc_info=exc,
+        )
+
+
+def backfill_submission_statistics(event: str, batch_size: int = 1000) -> int:
+    """
+    Create the statistics records from the log records of the event.
+
+    Only the log records from before the first existing statistics record for the
+    event are processed, so that the backfill can safely be repeated. The log records
+    are processed from new to old, so that the records created by an interrupted run
+    always form a contiguous range and the next run picks up where it stopped.
+
+    :param event: The logged event, either ``form_submit_success`` or
+      ``registration_success``.
+    :param batch_size: The number of log records to process at once.
+    :returns: The number of created statistics records.
+    """
+    log_records = TimelineLogProxy.objects.filter(
+        content_type=ContentType.objects.get_for_model(Submission),
         # see openforms.logging.adapter for the data structure of the extra_data
         # JSONField
         extra_data__log_event=event,
-    ).order_by("timestamp")
+    )
+    first_record = (
+        SubmissionStatisticsRecord.objects.filter(event=event)
+        .order_by("timestamp")
+        .first()
+    )
+    if first_record is not None:
+        log_records = log_records.filter(timestamp__lt=first_record.timestamp)
 
-    if limit_to_forms:
-        form_ids = list(limit_to_forms.values_list("pk", flat=True))
-        log_records = log_records.filter(extra_data__form_id__in=form_ids)
+    form_ids = set(Form.objects.values_list("pk", flat=True))
+    records: list[SubmissionStatisticsRecord] = []
+    num_created = 0
+    log_records = log_records.order_by("-timestamp").prefetch_related(
+        GenericPrefetch("content_object", [Submission.objects.select_related("form")])
+    )
+    for log_record in log_records.iterator(chunk_size=batch_size):
+        # Log records with the same timestamp must be committed in the same batch, as
+        # a next run only picks up records older than the oldest one created.
+        if len(records) >= batch_size and records[-1].timestamp != log_record.timestamp:
+            num_created += len(SubmissionStatisticsRecord.objects.bulk_create(records))
+            records = []
 
-    for record in log_records.iterator():
-        extra_data = record.extra_data
+        extra_data = log_record.extra_data
         # GFKs will be broken when the submissions are pruned, so prefer extracting
         # information from the extra_data snapshot
-        submission: Submission | None = record.content_object
-        dataset.append(
-            (
-                # public reference
-                extra_data.get(
+        submission: Submission | None = log_record.content_object
+        form_id = extra_data.get("form_id", submission.form.pk if submission else None)
+        submitted_on = extra_data.get("submitted_on")
+        records.append(
+            SubmissionStatisticsRecord(
+                event=event,
+                form_id=form_id if form_id in form_ids else None,
+                form_name=extra_data.get(
+                    "form_name", submission.form.name if submission else "-unknown-"
+                ),
+                internal_form_name=extra_data.get(
+                    "internal_form_name",
+                    submission.form.internal_name if submission else "-unknown-",
+                ),
+                public_reference=extra_data.get(
                     "public_reference",
                     (
                         submission.public_registration_reference
                         if submission
                         else "-unknown-"
                     ),
+                )
+                or "",
+                submitted_on=(
+                    parse_datetime(submitted_on)
+                    if submitted_on
+                    else (submission.completed_on if submission else None)
                 ),
-                # public form name
-                extra_data.get(
-                    "form_name", submission.form.name if submission else "-unknown-"
-                ),
-                # internal form name
-                extra_data.get(
-                    "internal_form_name",
-                    submission.form.internal_name if submission else "-unknown-",
-                ),
-                # when the user submitted the form
-                extra_data.get(
-                    "submitted_on",
-                    submission.completed_on.isoformat() if submission else None,
-                ),
-                # when the registration succeeeded - this must be close to when it was logged
-                record.timestamp.isoformat(),
+                timestamp=log_record.timestamp,
             )
         )
 
-    return dataset
+    num_created += len(SubmissionStatisticsRecord.objects.bulk_create(records))
+    return num_created
@@ -1,4 +1,5 @@
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from django_webtest import WebTest
@@ -6,26 +7,38 @@ from freezegun import freeze_time
 from maykin_2fa.test import disable_admin_mfa
 
 from openforms.accounts.tests.factories import SuperUserFactory, UserFactory
-from openforms.logging import audit_logger
 from openforms.logging.constants import (
     FORM_SUBMIT_SUCCESS_EVENT,
     REGISTRATION_SUCCESS_EVENT,
 )
-from openforms.registrations.contrib.demo.plugin import DemoRegistration
 from openforms.submissions.models import Submission
 from openforms.submissions.tests.factories import SubmissionFactory
 
 from ...forms import ExportStatisticsForm
+from ...statistics import record_submission_statistics
 from ..factories import FormFactory
 
 
-def _log_form_submit_success(submission: Submission) -> None:
+def _record_form_submit_success(submission: Submission) -> None:
     """
-    Lightweight helper to log the form submit event.
+    Lightweight helper to record the form submit event.
 
     Keep in sync with :meth:`openforms.submissions.api.mixins.SubmissionCompletionMixin._complete_submission`.
     """
-    audit_logger.info(FORM_SUBMIT_SUCCESS_EVENT, submission_uuid=str(submission.uuid))
+    record_submission_statistics(
+        FORM_SUBMIT_SUCCESS_EVENT, submission, timestamp=timezone.now()
+    )
+
+
+def _record_registration_success(submission: Submission) -> None:
+    """
+    Lightweight helper to record the registration success event.
+
+    Keep in sync with :func:`openforms.registrations.tasks.register_submission`.
+    """
+    record_submission_statistics(
+        REGISTRATION_SUCCESS_EVENT, submission, timestamp=timezone.now()
+    )
 
 
 @disable_admin_mfa()
@@ -73,11 +86,11 @@ class SubmissionStatisticsAdminTests(WebTest):
         form_1 = FormFactory.create(name="Order coffee")
         form_2 = FormFactory.create(name="Request bathroom break")
         submission1 = SubmissionFactory.create(completed=True, form=form_1)
-        _log_form_submit_success(submission1)
+        _record_form_submit_success(submission1)
         submission2 = SubmissionFactory.create(completed=True, form=form_1)
-        _log_form_submit_success(submission2)
+        _record_form_submit_success(submission2)
         submission3 = SubmissionFactory.create(completed=True, form=form_2)
-        _log_form_submit_success(submission3)
+        _record_form_submit_success(submission3)
 
         changelist_page = self.app.get(self.admin_url, user=superuser)
 
@@ -97,11 +110,11 @@ class SubmissionStatisticsAdminTests(WebTest):
         form_1 = FormFactory.create(name="Order coffee")
         form_2 = FormFactory.create(name="Request bathroom break")
         submission1 = SubmissionFactory.create(completed=True, form=form_1)
-        _log_form_submit_success(submission1)
+        _record_form_submit_success(submission1)
         submission2 = SubmissionFactory.create(completed=True, form=form_1)
-        _log_form_submit_success(submission2)
+        _record_form_submit_success(submission2)
         submission3 = SubmissionFactory.create(completed=True, form=form_2)
-        _log_form_submit_success(submission3)
+        _record_form_submit_success(submission3)
 
         _changelist_page = self.app.get(self.admin_url, user=superuser)
         search_form = _changelist_page.forms["changelist-search"]
@@ -122,13 +135,13 @@ class SubmissionStatisticsAdminTests(WebTest):
         # create submissions at different points in time
         with freeze_time("2024-10-07T12:00:00Z"):
             submission1 = SubmissionFactory.create(completed=True, form=form)
-            _log_form_submit_success(submission1)
+            _record_form_submit_success(submission1)
         with freeze_time("2025-01-03T10:00:00Z"):
             submission1 = SubmissionFactory.create(completed=True, form=form)
-            _log_form_submit_success(submission1)
+            _record_form_submit_success(submission1)
         with freeze_time("2025-01-04T23:59:59+01:00"):
             submission1 = SubmissionFactory.create(completed=True, form=form)
-            _log_form_submit_success(submission1)
+            _record_form_submit_success(submission1)
 
         _changelist_page = self.app.get(self.admin_url, user=superuser)
         # this library translates the form ID from the label, wtf
@@ -214,16 +227,14 @@ class FormStatisticsExportAdminTests(WebTest):
             is_staff=True,
             user_permissions=["forms.view_formsubmissionstatistics"],
         )
-        plugin = DemoRegistration("demo")
-        audit_log = audit_logger.bind(plugin=plugin)
-        # create some log records for submissions
+        # create some statistics records for submissions
         with freeze_time("2024-12-20T16:44:00+01:00"):
             sub1, sub2, sub3 = SubmissionFactory.create_batch(
                 3, registration_success=True
             )
-            audit_log.info("registration_success", submission_uuid=str(sub1.uuid))
-            audit_log.info("registration_success", submission_uuid=str(sub2.uuid))
-            audit_log.info("registration_success", submission_uuid=str(sub3.uuid))
+            _record_registration_success(sub1)
+            _record_registration_success(sub2)
+            _record_registration_success(sub3)
 
         export_page = self.app.get(self.admin_url, user=user)
         form = export_page.forms["export-statistics"]
@@ -246,10 +257,8 @@ class FormStatisticsExportAdminTests(WebTest):
 
     def test_export_form_filters(self):
         """
-        Test that the form filters correctly filter down the matching log records.
+        Test that the form filters correctly filter down the matching records.
         """
-        plugin = DemoRegistration("demo")
-        audit_log = audit_logger.bind(plugin=plugin)
         form1, form2, form3 = FormFactory.create_batch(3)
         with freeze_time("2024-12-20T16:44:00+01:00"):
             registered_submission_1 = SubmissionFactory.create(
@@ -257,31 +266,21 @@ class FormStatisticsExportAdminTests(WebTest):
                 registration_success=True,
                 public_registration_reference="SUB-01",
             )
-            audit_log.info(
-                "registration_success",
-                submission_uuid=str(registered_submission_1.uuid),
-            )
+            _record_registration_success(registered_submission_1)
 
-            failed_submission = SubmissionFactory.create(
+            # failed registrations are not recorded
+            SubmissionFactory.create(
                 form=form1,
                 registration_failed=True,
                 public_registration_reference="FAIL-01",
             )
-            audit_log.warning(
-                "registration_failure",
-                submission_uuid=str(failed_submission.uuid),
-                exc_info=Exception("nope"),
-            )
         with freeze_time("2024-11-20T12:00:00+01:00"):
             registered_submission_2 = SubmissionFactory.create(
                 form=form2,
                 registration_success=True,
                 public_registration_reference="SUB-02",
             )
-            audit_log.info(
-                "registration_success",
-                submission_uuid=str(registered_submission_2.uuid),
-            )
+            _record_registration_success(registered_submission_2)
 
         with freeze_time("2024-12-05T12:00:00+01:00"):
             registered_submission_3 = SubmissionFactory.create(
@@ -289,10 +288,7 @@ class FormStatisticsExportAdminTests(WebTest):
                 registration_success=True,
                 public_registration_reference="SUB-03",
             )
-            audit_log.info(
-                "registration_success",
-                submission_uuid=str(registered_submission_3.uuid),
-            )
+            _record_registration_success(registered_submission_3)
 
         with freeze_time("2024-12-06T10:00:00+01:00"):
             registered_submission_4 = SubmissionFactory.create(
@@ -300,10 +296,7 @@ class FormStatisticsExportAdminTests(WebTest):
                 registration_success=True,
                 public_registration_reference="SUB-04",
             )
-            audit_log.info(
-                "registration_success",
-                submission_uuid=str(registered_submission_4.uuid),
-            )
+            _record_registration_success(registered_submission_4)
 
         with self.subTest("filter on start date"):
             export_form1 = ExportStatisticsForm(
@@ -7,7 +7,7 @@ from textwrap import dedent
 from unittest.mock import patch
 from uuid import UUID
 
-from django.test import TestCase, override_settings, tag
+from django.test import SimpleTestCase, TestCase, override_settings, tag
 from django.utils import translation
 
 from digid_eherkenning.choices import AssuranceLevels, DigiDAssuranceLevels
@@ -68,7 +68,7 @@ from ..models import (
     FormStep,
     FormVariable,
 )
-from ..utils import export_form, form_to_json, import_form
+from ..utils import _remap_uuids, export_form, form_to_json, import_form
 from .factories import (
     CategoryFactory,
     FormDefinitionFactory,
@@ -3128,3 +3128,54 @@ class DisableNextImportConversionTests(TestCase):
         self.assertEqual(rule["actions"][0]["form_step_uuid"], str(step_2.uuid))
         self.assertEqual(rule["actions"][1]["form_step_uuid"], str(step_3.uuid))
         self.assertEqual(rule["actions"][1]["action"], {"type": "disable-next"})
+
+
+class RemapUUIDsTests(SimpleTestCase):
+    def test_known_uuids_are_replaced(self):
+        old1 = "d61e5a1c-1e5c-4a3c-9b06-0b3b6d2c3f1a"
+        old2 = "3E0A4E1C-8D9B-4F1A-A0E2-5C6F7B8D9E0F"
+        unknown = "a5a9e7b2-4c3d-4e2f-8a1b-9c0d1e2f3a4b"
+        data = json.dumps(
+            [
+                {"uuid": old1, "url": f"http://testserver/api/v2/forms/{old1}"},
+                {"uuid": old2, "form": unknown, "logic": {"==": [old1, old2]}},
+            ]
+        )
+        mapping = {
+            old1: "00000000-0000-0000-0000-000000000001",
+            old2: "00000000-0000-0000-0000-000000000002",
+        }
+
+        result = json.loads(_remap_uuids(data, mapping))
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "uuid": "00000000-0000-0000-0000-000000000001",
+                    "url": "http://testserver/api/v2/forms/00000000-0000-0000-0000-000000000001",
+                },
+                {
+                    "uuid": "00000000-0000-0000-0000-000000000002",
+                    "form": unknown,
+                    "logic": {
+                        "==": [
+                            "00000000-0000-0000-0000-000000000001",
+                            "00000000-0000-0000-0000-000000000002",
+                        ]
+                    },
+                },
+            ],
+        )
+
+    def test_replacements_are_applied_in_order(self):
+        # an export can use the same UUID for different resources - the old UUID of
+        # a later resource may then be the replacement of an earlier one
+        mapping = {
+            "a54864c6-c460-48bd-a520-eced60ffb209": "f0dad93b-333b-49af-868b-a6bcb94fa1b8",
+            "f0dad93b-333b-49af-868b-a6bcb94fa1b8": "3ca01601-cd20-4746-bce5-baab47636823",
+        }
+
+        result = _remap_uuids('["a54864c6-c460-48bd-a520-eced60ffb209"]', mapping)
+
+        self.assertEqual(result, '["3ca01601-cd20-4746-bce5-baab47636823"]')
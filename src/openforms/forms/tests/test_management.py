@@ -1,12 +1,25 @@
+from datetime import UTC, datetime
+from io import StringIO
+from unittest.mock import patch
+
 from django.core.management import call_command
+from django.db import DatabaseError
 from django.test import TestCase, override_settings
 
 from freezegun import freeze_time
 from privates.test import temp_private_root
 
 from openforms.accounts.tests.factories import StaffUserFactory
+from openforms.logging import audit_logger
+from openforms.logging.constants import (
+    FORM_SUBMIT_SUCCESS_EVENT,
+    REGISTRATION_SUCCESS_EVENT,
+)
+from openforms.registrations.contrib.demo.plugin import DemoRegistration
+from openforms.submissions.tests.factories import SubmissionFactory
 
 from ..admin.tasks import process_forms_export
+from ..models import SubmissionStatisticsRecord
 from ..models.form import FormsExport
 from .factories import FormFactory
 
@@ -37,3 +50,110 @@ class DeleteFormExportFilesTest(TestCase):
 
         self.assertFalse(FormsExport.objects.filter(pk=forms_export.pk).exists())
         self.assertFalse(storage.exists(path))
+
+
+class BackfillSubmissionStatisticsTests(TestCase):
+    def test_records_created_from_log_records(self):
+        form = FormFactory.create(name="Order coffee", internal_name="Coffee")
+        audit_log = audit_logger.bind(plugin=DemoRegistration("demo"))
+        with freeze_time("2024-12-20T16:44:00+01:00"):
+            submission_1 = SubmissionFactory.create(
+                form=form,
+                completed=True,
+                completed_on=datetime(2024, 12, 20, 15, 30, tzinfo=UTC),
+                registration_success=True,
+                public_registration_reference="OF-123",
+            )
+            submission_2 = SubmissionFactory.create(form=form, completed=True)
+            audit_log.info(
+                FORM_SUBMIT_SUCCESS_EVENT, submission_uuid=str(submission_1.uuid)
+            )
+            audit_log.info(
+                FORM_SUBMIT_SUCCESS_EVENT, submission_uuid=str(submission_2.uuid)
+            )
+            audit_log.info(
+                REGISTRATION_SUCCESS_EVENT, submission_uuid=str(submission_1.uuid)
+            )
+        # the log records were created before the statistics records were introduced
+        SubmissionStatisticsRecord.objects.all().delete()
+
+        call_command("backfill_submission_statistics", stdout=StringIO())
+
+        self.assertEqual(
+            SubmissionStatisticsRecord.objects.filter(
+                event=FORM_SUBMIT_SUCCESS_EVENT
+            ).count(),
+            2,
+        )
+        record = SubmissionStatisticsRecord.objects.get(
+            event=REGISTRATION_SUCCESS_EVENT
+        )
+        self.assertEqual(record.form, form)
+        self.assertEqual(record.form_name, "Order coffee")
+        self.assertEqual(record.internal_form_name, "Coffee")
+        self.assertEqual(record.public_reference, "OF-123")
+        self.assertEqual(
+            record.submitted_on, datetime(2024, 12, 20, 15, 30, tzinfo=UTC)
+        )
+        self.assertEqual(record.timestamp.isoformat(), "2024-12-20T15:44:00+00:00")
+
+        with self.subTest("backfill can be repeated"):
+            call_command("backfill_submission_statistics", stdout=StringIO())
+
+            self.assertEqual(SubmissionStatisticsRecord.objects.count(), 3)
+
+    def test_interrupted_backfill_is_completed_by_next_run(self):
+        form = FormFactory.create()
+        audit_log = audit_logger.bind(plugin=DemoRegistration("demo"))
+        for timestamp in (
+            "2024-12-18T10:00:00+00:00",
+            "2024-12-19T10:00:00+00:00",
+            "2024-12-20T10:00:00+00:00",
+        ):
+            with freeze_time(timestamp):
+                submission = SubmissionFactory.create(form=form, completed=True)
+                audit_log.info(
+                    FORM_SUBMIT_SUCCESS_EVENT, submission_uuid=str(submission.uuid)
+                )
+        SubmissionStatisticsRecord.objects.all().delete()
+        bulk_create = SubmissionStatisticsRecord.objects.bulk_create
+
+        def _interrupt_after_first_batch(records):
+            if SubmissionStatisticsRecord.objects.exists():
+                raise DatabaseError("interrupted")
+            return bulk_create(records)
+
+        with (
+            patch.object(
+                SubmissionStatisticsRecord.objects,
+                "bulk_create",
+                side_effect=_interrupt_after_first_batch,
+            ),
+            self.assertRaises(DatabaseError),
+        ):
+            call_command(
+                "backfill_submission_statistics", batch_size=1, stdout=StringIO()
+            )
+
+        # the newest log record was processed
+        self.assertEqual(
+            [
+                record.timestamp.isoformat()
+                for record in SubmissionStatisticsRecord.objects.all()
+            ],
+            ["2024-12-20T10:00:00+00:00"],
+        )
+
+        call_command("backfill_submission_statistics", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            [
+                record.timestamp.isoformat()
+                for record in SubmissionStatisticsRecord.objects.order_by("timestamp")
+            ],
+            [
+                "2024-12-18T10:00:00+00:00",
+                "2024-12-19T10:00:00+00:00",
+                "2024-12-20T10:00:00+00:00",
+            ],
+        )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings, tag
 from django.utils.translation import gettext as _
@@ -5,6 +7,7 @@ from django.utils.translation import gettext as _
 from hypothesis import given, strategies as st
 from hypothesis.extra.django import SimpleTestCase, TestCase as HypothesisTestCase
 
+from openforms.utils.json_logic.compiler import compile_json_logic
 from openforms.utils.tests.feature_flags import enable_feature_flag
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 
@@ -1037,6 +1040,25 @@ class FormLogicTests(TestCase):
                 )
                 self.assertTrue(rule.is_backend_logic_evaluation_required)
 
+    def test_compiled_trigger_is_reused(self):
+        rule = FormLogicFactory.build(json_logic_trigger={"==": [{"var": "foo"}, 1]})
+
+        with patch(
+            "openforms.forms.models.logic.compile_json_logic",
+            wraps=compile_json_logic,
+        ) as mock_compile:
+            program = rule.compiled_trigger
+
+            self.assertIs(rule.compiled_trigger, program)
+            self.assertTrue(program({"foo": 1}))
+            mock_compile.assert_called_once()
+
+            with self.subTest("replaced trigger is compiled again"):
+                rule.json_logic_trigger = {"==": [{"var": "foo"}, 2]}
+
+                self.assertFalse(rule.compiled_trigger({"foo": 1}))
+                self.assertEqual(mock_compile.call_count, 2)
+
 
 class FormRegistrationBackendTests(TestCase):
     def test_string_contains_both_parts_of_the_relation(self):
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from django.db import DatabaseError
+from django.test import TestCase
+
+from openforms.logging.constants import FORM_SUBMIT_SUCCESS_EVENT
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..models import SubmissionStatisticsRecord
+from ..statistics import record_submission_statistics
+from .factories import FormFactory
+
+
+class RecordSubmissionStatisticsTests(TestCase):
+    def test_record_created(self):
+        form = FormFactory.create(name="Order coffee", internal_name="Coffee")
+        submission = SubmissionFactory.create(
+            form=form,
+            completed=True,
+            completed_on=datetime(2024, 12, 20, 15, 30, tzinfo=UTC),
+            public_registration_reference="OF-123",
+        )
+
+        record_submission_statistics(
+            FORM_SUBMIT_SUCCESS_EVENT,
+            submission,
+            timestamp=datetime(2024, 12, 20, 15, 31, tzinfo=UTC),
+        )
+
+        record = SubmissionStatisticsRecord.objects.get()
+        self.assertEqual(record.event, FORM_SUBMIT_SUCCESS_EVENT)
+        self.assertEqual(record.form, form)
+        self.assertEqual(record.form_name, "Order coffee")
+        self.assertEqual(record.internal_form_name, "Coffee")
+        self.assertEqual(record.public_reference, "OF-123")
+        self.assertEqual(
+            record.submitted_on, datetime(2024, 12, 20, 15, 30, tzinfo=UTC)
+        )
+        self.assertEqual(record.timestamp, datetime(2024, 12, 20, 15, 31, tzinfo=UTC))
+
+    def test_failure_is_logged_and_does_not_break_transaction(self):
+        submission = SubmissionFactory.create(completed=True)
+
+        with (
+            patch.object(
+                SubmissionStatisticsRecord.objects,
+                "create",
+                side_effect=DatabaseError("boom"),
+            ),
+            patch("openforms.forms.statistics.logger") as mock_logger,
+        ):
+            record_submission_statistics(
+                FORM_SUBMIT_SUCCESS_EVENT,
+                submission,
+                timestamp=datetime(2024, 12, 20, 15, 31, tzinfo=UTC),
+            )
+
+        mock_logger.error.assert_called_once()
+        self.assertFalse(SubmissionStatisticsRecord.objects.exists())
@@ -1,5 +1,6 @@
 import json
 import random
+import re
 import string
 import zipfile
 from collections.abc import Collection
@@ -63,6 +64,35 @@ SERIALIZERS = {
 }
 
 
+# Matches anything shaped like a UUID in the (JSON) import data, the matches are then
+# looked up in the UUID mapping of the resources imported so far.
+UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+def _remap_uuids(data: str, uuid_mapping: dict[str, str]) -> str:
+    """
+    Replace the occurrences of the old UUIDs with the new ones in a single pass.
+
+    The result is the same as replacing the UUIDs one after the other in the order of
+    the mapping - a new UUID that is itself replaced by a later entry (e.g. when an
+    export re-uses the same UUID for different resources) is resolved to the final
+    UUID upfront.
+    """
+    if not uuid_mapping:
+        return data
+
+    positions = {old: index for index, old in enumerate(uuid_mapping)}
+    resolved: dict[str, str] = {}
+    for index, (old, new) in reversed(list(enumerate(uuid_mapping.items()))):
+        if positions.get(new, -1) > index:
+            new = resolved[new]
+        resolved[old] = new
+
+    return UUID_RE.sub(lambda match: resolved.get(match[0], match[0]), data)
+
+
 def _get_mock_request():
     factory = APIRequestFactory()
     first_allowed_host = (
@@ -194,7 +224,7 @@ def import_form_data(
     import_data: dict,
     existing_form_instance: Form | None = None,
 ) -> Form | None:
-    uuid_mapping = {}
+    uuid_mapping: dict[str, str] = {}
 
     request = _get_mock_request()
 
@@ -221,9 +251,7 @@ def import_form_data(
         if resource not in import_data:
             continue
 
-        data = import_data[resource]
-        for old, new in uuid_mapping.items():
-            data = data.replace(old, new)
+        data = _remap_uuids(import_data[resource], uuid_mapping)
 
         try:
             serializer = SERIALIZERS[resource]
@@ -116,7 +116,9 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
 
     # always try to grab the submission by PK first - we can create an in-memory
     # instance to pass to the Generic Foreign Key instance without it actually having
-    # to exist in the database this way (due to pending DB transactions!)
+    # to exist in the database this way (due to pending DB transactions!). Events that
+    # only need the submission for the generic relation reuse this instance too, which
+    # saves a query per audit log record.
     submission: Submission | None = None
     if submission_pk := event_dict.get("submission_pk"):
         submission = Submission(pk=submission_pk)
@@ -196,7 +198,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "status_label": str(status_label),
             "email_event": str(email_event),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -339,7 +341,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             # when a user is submitting the step for the first time, the SubmissionStep
             # instance is still being created in a transaction and won't be committed
             # yet, so we can't query by ID.
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -369,7 +371,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             | "cosigner_email_queuing_success" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -382,7 +384,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             | "submission_details_view_api" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
 
             user: User | None = None
             if username := event_dict.get("user"):
@@ -420,7 +422,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             form = Form.objects.get(pk=form_id)
             instance: Submission | Form = form
             if isinstance((submission_uuid := event_dict.get("submission_uuid")), str):
-                instance = Submission.objects.get(uuid=submission_uuid)
+                instance = submission or Submission.objects.get(uuid=submission_uuid)
 
             auth: BaseAuth | None = (
                 {
@@ -492,7 +494,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "auth_attribute": str(auth_attribute),
             "auth_plugin": str(auth_plugin),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -552,7 +554,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             | "appointment_register_failure" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             appointment_plugin: AppointmentBasePlugin | None = event_dict.get("plugin")
             return EventDetails(
                 event=event,
@@ -569,7 +571,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "submission_uuid": str(submission_uuid),
             "plugin": AppointmentBasePlugin() as plugin,
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -585,7 +587,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "event": "max_registration_attempts_exceeded",
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event="registration_attempts_limited",
                 instance=submission,
@@ -601,7 +603,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
                 "payment_not_received": "registration_skipped_not_yet_paid",
                 "cosign_required": "skipped_registration_cosign_required",
             }
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=REASON_TO_EVENT_MAP[reason],
                 instance=submission,
@@ -612,7 +614,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "event": "registration_start" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -624,7 +626,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "submission_uuid": str(submission_uuid),
             "message": str(message),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             extra_data: dict[str, object] = {"message": message}
             # dict with key `key` and optionally a key `name`
             if backend := event_dict.get("backend"):
@@ -658,7 +660,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "submission_uuid": str(submission_uuid),
             "plugin": RegistrationBasePlugin() as plugin,
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -672,7 +674,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "reason": "no_registration_plugin_configured",
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event="registration_skip",
                 instance=submission,
@@ -690,7 +692,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
                 "update_registration_with_confirmation_email_completed": "registration_update_with_confirmation_email_skip",
                 "update_registration_with_confirmation_email_done": "registration_update_with_confirmation_email_success",
             }
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=EVENT_MAP[_event],
                 instance=submission,
@@ -707,7 +709,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             | "registration_payment_update_failure" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -724,7 +726,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "submission_uuid": str(submission_uuid),
             "component_key": str(component_key),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -746,7 +748,8 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "submission_id": int(submission_id),
             "report_id": int(report_id),
         }:
-            submission = Submission.objects.get(pk=submission_id)
+            # the timeline log only needs the primary key for the generic relation
+            submission = Submission(pk=submission_id)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -766,7 +769,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             "value": object() as value,
             "exception": str(error),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             return EventDetails(
                 event=event,
                 instance=submission,
@@ -826,7 +829,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
             | "confirmation_email_failure" as event,
             "submission_uuid": str(submission_uuid),
         }:
-            submission = Submission.objects.get(uuid=submission_uuid)
+            submission = submission or Submission.objects.get(uuid=submission_uuid)
             extra_data: dict[str, object] = {}
             if sched_opts := event_dict.get("scheduling_options"):
                 extra_data["scheduling_options"] = sched_opts
@@ -880,7 +883,7 @@ def from_structlog(event_dict: EventDict) -> EventDetails:
 
 def _snapshot_submission_statistics(submission: Submission):
     return {
-        # note: these keys are used in the form statistics admin view!
+        # note: these keys are used to backfill the submission statistics records!
         "public_reference": submission.public_registration_reference,
         "form_id": submission.form.pk,
         "form_name": submission.form.name,
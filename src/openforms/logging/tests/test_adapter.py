@@ -0,0 +1,64 @@
+from django.test import TestCase
+
+from openforms.forms.models import SubmissionStatisticsRecord
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..adapter import from_structlog
+from ..constants import FORM_SUBMIT_SUCCESS_EVENT
+
+
+class FromStructlogTests(TestCase):
+    def test_submission_instance_from_pk_is_reused(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertNumQueries(0):
+            details = from_structlog(
+                {
+                    "event": "registration_start",
+                    "submission_pk": submission.pk,
+                    "submission_uuid": str(submission.uuid),
+                }
+            )
+
+        self.assertEqual(details.instance.pk, submission.pk)
+
+    def test_submission_looked_up_by_uuid_without_pk(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertNumQueries(1):
+            details = from_structlog(
+                {
+                    "event": "registration_start",
+                    "submission_uuid": str(submission.uuid),
+                }
+            )
+
+        self.assertEqual(details.instance, submission)
+
+    def test_pdf_generation_events_do_not_query_submission(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertNumQueries(0):
+            details = from_structlog(
+                {
+                    "event": "pdf_generation_start",
+                    "submission_id": submission.pk,
+                    "report_id": 1,
+                }
+            )
+
+        self.assertEqual(details.instance.pk, submission.pk)
+
+    def test_submission_statistics_are_not_recorded(self):
+        submission = SubmissionFactory.create(completed=True)
+
+        details = from_structlog(
+            {
+                "event": FORM_SUBMIT_SUCCESS_EVENT,
+                "submission_uuid": str(submission.uuid),
+            }
+        )
+
+        self.assertEqual(details.instance, submission)
+        # recorded where the event happens, see openforms.forms.statistics
+        self.assertFalse(SubmissionStatisticsRecord.objects.exists())
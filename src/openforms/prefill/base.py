@@ -51,6 +51,13 @@ class BasePlugin[OptionsT: Options](AbstractBasePlugin):
     """
     for_components: Container[str] = AllComponentTypes()
     options: SerializerCls = EmptyOptions
+    max_concurrent_lookups: ClassVar[int] = 4
+    """
+    The maximum number of prefill lookups from options that run concurrently.
+
+    Variables with prefill options are prefilled in parallel when a submission starts.
+    Lower this limit for backends that can't cope with many simultaneous requests.
+    """
 
     @staticmethod
     def get_available_attributes() -> Iterable[tuple[str, StrOrPromise]]:
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from functools import partial
+from threading import BoundedSemaphore
 
 from django.core.exceptions import PermissionDenied
 
@@ -17,7 +18,7 @@ from openforms.submissions.models.submission_value_variable import (
 )
 from openforms.typing import JSONEncodable
 
-from .base import BasePlugin
+from .base import BasePlugin, Options
 from .constants import IdentifierRoles
 from .exceptions import PrefillSkipped
 from .registry import Registry
@@ -126,7 +127,27 @@ def fetch_prefill_values_from_options(
     register: Registry,
     variables: list[SubmissionValueVariable],
 ) -> dict[str, JSONEncodable]:
-    values: dict[str, JSONEncodable] = {}
+    @tracer.start_as_current_span(
+        name="invoke-plugin", attributes={"span.type": "app", "span.subtype": "prefill"}
+    )
+    def invoke_plugin(
+        structlog_ctx: Context,
+        item: tuple[BasePlugin, Options, SubmissionValueVariable],
+    ) -> dict[str, JSONEncodable] | Exception:
+        structlog.contextvars.bind_contextvars(**structlog_ctx)
+        plugin, plugin_options, variable = item
+        # The outcome is logged by the caller - the audit log is written to the
+        # database, which must happen in the connection (and transaction) of the
+        # calling thread.
+        with semaphores[plugin.identifier]:
+            try:
+                return plugin.get_prefill_values_from_options(
+                    submission, plugin_options, variable
+                )
+            except Exception as exc:
+                return exc
+
+    invoke_plugin_args: list[tuple[BasePlugin, Options, SubmissionValueVariable]] = []
     for variable in variables:
         assert variable.form_variable is not None
         plugin = register[variable.form_variable.prefill_plugin]
@@ -161,7 +182,8 @@ def fetch_prefill_values_from_options(
         plugin_options = options_serializer.validated_data
 
         # If an `initial_data_reference` was passed, we must verify that the
-        # authenticated user is the owner of the referenced object
+        # authenticated user is the owner of the referenced object. This happens before
+        # any of the lookups are started.
         has_initial_data_reference = bool(submission.initial_data_reference)
         log.debug(
             "prefill.plugin.verify_initial_data_ownership",
@@ -178,21 +200,35 @@ def fetch_prefill_values_from_options(
                 )
                 raise exc
 
-        try:
-            new_values = plugin.get_prefill_values_from_options(
-                submission, plugin_options, variable
-            )
-        except PrefillSkipped:
-            log.info("prefill.plugin.skipped")
-            values = {}
-        except Exception as exc:
-            audit_log.exception("prefill.plugin.retrieve_failure", exc_info=exc)
-        else:
-            if new_values:
-                values.update(**new_values)
-            audit_log.info(
-                "prefill_retrieve_success" if new_values else "prefill_retrieve_empty",
-                attributes=list(values),
-            )
+        invoke_plugin_args.append((plugin, plugin_options, variable))
+
+    # limit the number of concurrent lookups per plugin
+    semaphores = {
+        plugin.identifier: BoundedSemaphore(plugin.max_concurrent_lookups)
+        for plugin, *_ in invoke_plugin_args
+    }
+
+    # ensure we propagate the threadlocal context to the worker threads
+    ctx = structlog.contextvars.get_contextvars()
+    with parallel() as executor:
+        results = list(executor.map(partial(invoke_plugin, ctx), invoke_plugin_args))
 
+    # merge in order of the variables, so that the outcome is deterministic
+    values: dict[str, JSONEncodable] = {}
+    for (plugin, _, variable), result in zip(invoke_plugin_args, results, strict=True):
+        log = logger.bind(
+            variable=variable.key, plugin=plugin, submission_uuid=str(submission.uuid)
+        )
+        audit_log = audit_logger.bind(**structlog.get_context(log))
+        match result:
+            case PrefillSkipped():
+                log.info("prefill.plugin.skipped")
+            case Exception():
+                audit_log.exception("prefill.plugin.retrieve_failure", exc_info=result)
+            case _:
+                values.update(result)
+                audit_log.info(
+                    "prefill_retrieve_success" if result else "prefill_retrieve_empty",
+                    attributes=list(result),
+                )
     return values
@@ -1,3 +1,5 @@
+import threading
+import time
 from datetime import date
 from unittest.mock import patch
 
@@ -303,6 +305,42 @@ class GenericExceptionPlugin(DemoPrefill):
         raise Exception("Generic exception")
 
 
+@prefill_from_options_register("concurrent-lookups")
+class ConcurrentLookupsPlugin(DemoPrefill):
+    options = OptionsSerializer
+    max_concurrent_lookups = 3
+    # all three lookups must be running at the same time to pass the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    @classmethod
+    def get_prefill_values_from_options(
+        cls, submission: Submission, options, submission_value_variable
+    ):
+        cls.barrier.wait()
+        return {options["var_key"]: options["var_value"]}
+
+
+@prefill_from_options_register("sequential-lookups")
+class SequentialLookupsPlugin(DemoPrefill):
+    options = OptionsSerializer
+    max_concurrent_lookups = 1
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    @classmethod
+    def get_prefill_values_from_options(
+        cls, submission: Submission, options, submission_value_variable
+    ):
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+        return {options["var_key"]: options["var_value"]}
+
+
 class PrefillVariablesFromOptionsTests(TestCase):
     @patch(
         "openforms.prefill.service.fetch_prefill_values_from_options",
@@ -636,6 +674,33 @@ class PrefillVariablesFromOptionsTests(TestCase):
             variables_state.get_data(), {"voornamen": "", "prefillData": {}}
         )
 
+    def test_lookups_run_concurrently_within_plugin_limits(self):
+        form = FormFactory.create(generate_minimal_setup=True)
+        for plugin in ("concurrent-lookups", "sequential-lookups"):
+            for index in range(3):
+                FormVariableFactory.create(
+                    form=form, key=f"{plugin}-{index}", user_defined=True
+                )
+                FormVariableFactory.create(
+                    form=form,
+                    key=f"{plugin}-{index}-prefill",
+                    user_defined=True,
+                    prefill_plugin=plugin,
+                    prefill_options={
+                        "var_key": f"{plugin}-{index}",
+                        "var_value": f"value {index}",
+                    },
+                )
+        submission = SubmissionFactory.create(form=form)
+
+        prefill_variables(submission=submission, register=prefill_from_options_register)
+
+        data = submission.variables_state.get_data()
+        for plugin in ("concurrent-lookups", "sequential-lookups"):
+            for index in range(3):
+                self.assertEqual(data[f"{plugin}-{index}"], f"value {index}")
+        self.assertEqual(SequentialLookupsPlugin.max_active, 1)
+
 
 class PrefillVariablesTransactionTests(OFVCRMixin, TransactionTestCase):
     def setUp(self):
@@ -1,4 +1,3 @@
-import base64
 from collections import defaultdict
 from collections.abc import Mapping
 from functools import partial
@@ -20,6 +19,7 @@ from openforms.forms.json_schema import NestedDict
 from openforms.forms.models import FormVariable
 from openforms.submissions.models import Submission, SubmissionFileAttachment
 from openforms.typing import JSONObject, VariableValue
+from openforms.utils.json_stream import Base64Content, Base64Placeholders
 from openforms.variables.service import get_static_variables
 
 from ...base import BasePlugin  # openforms.registrations.base
@@ -81,9 +81,14 @@ class GenericJSONRegistration(BasePlugin):
         )
 
         # serialize and include the metadata keys, to send it to the service
-        data = document_data.serialize(
-            metadata=metadata_json_data.values.data,
-            metadata_schema=metadata_json_data.values_schema,
+        # the attachment content is only read and encoded while the request is sent
+        placeholders = Base64Placeholders()
+        data = placeholders.get_body(
+            document_data.serialize(
+                encoder=placeholders.get_json_encoder(),
+                metadata=metadata_json_data.values.data,
+                metadata_schema=metadata_json_data.values_schema,
+            )
         )
         # Send to the service
         service = options["service"]
@@ -296,7 +301,7 @@ def get_attachments(
     component: FileComponent,
     attachments: dict[str, list[SubmissionFileAttachment]],
     key_prefix: str = "",
-) -> list[JSONObject]:
+) -> list[dict[str, str | Base64Content]]:
     """Return list of encoded attachments.
 
     :param component: FileComponent
@@ -319,13 +324,15 @@ def get_attachments(
     ]
 
 
-def encode_attachment(attachment: SubmissionFileAttachment) -> str:
+def encode_attachment(attachment: SubmissionFileAttachment) -> Base64Content:
     """Encode an attachment using base64.
 
+    The content is only read and encoded when the request body is produced, so that
+    (large) attachments don't have to be kept in memory.
+
     :param attachment: Attachment to encode.
 
-    :returns: Encoded base64 data as a string.
+    :returns: Marker for the content, serialized as base64 string in the JSON body.
     """
-    with attachment.content.open("rb") as f:
-        f.seek(0)
-        return base64.b64encode(f.read()).decode()
+    # the file is opened lazily on the first read
+    return Base64Content(attachment.content, size=attachment.content.size, close=True)
@@ -45,6 +45,7 @@ from openforms.variables.constants import FormVariableSources
 from openforms.variables.utils import get_variables_for_context
 
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
+from ...utils import map_concurrently
 from .handlers.v1 import get_payment_context_data, render_template
 from .handlers.v2 import AssignmentSpec, OutputSpec, process_mapped_variable
 from .models import ObjectsAPIRegistrationData, ObjectsAPISubmissionAttachment
@@ -163,14 +164,13 @@ def register_submission_csv(
     return submission_csv_document["url"]
 
 
-def register_submission_attachment(
+def get_attachment_document_options(
     resolver: DocumentTypeResolver,
     submission: Submission,
     attachment: SubmissionFileAttachment,
     options: RegistrationOptions,
     file_options: Mapping[str, FileComponentOptions],
-    documents_client: DocumentenClient,
-) -> str:
+) -> DocumentOptions:
     default_document_type = _resolve_documenttype(
         resolver, "attachment", options, submission
     )
@@ -204,12 +204,27 @@ def register_submission_attachment(
         if _title := overrides.get("title"):
             document_options["titel"] = _title
 
+    return document_options
+
+
+def register_submission_attachment(
+    attachment: SubmissionFileAttachment,
+    name: str,
+    language: str,
+    document_options: DocumentOptions,
+    documents_client: DocumentenClient,
+) -> str:
+    """
+    Upload the attachment to the Documents API.
+
+    No database queries are performed, so that this can run in a worker thread.
+    """
     attachment_document = create_attachment_document(
         client=documents_client,
-        name=submission.form.name,
+        name=name,
         submission_attachment=attachment,
         options=document_options,
-        language=attachment.submission_step.submission.language_code,  # assume same as submission
+        language=language,
     )
 
     return attachment_document["url"]
@@ -304,22 +319,63 @@ class ObjectsAPIRegistrationHandler[
                     )
                 ]
 
-                for attachment in submission.attachments:
-                    if attachment not in existing:
-                        document_url = register_submission_attachment(
+                uploads = [
+                    (
+                        attachment,
+                        get_attachment_document_options(
                             doc_type_resolver,
                             submission,
                             attachment,
                             options,
                             file_options,
-                            documents_client,
+                        ),
+                    )
+                    for attachment in submission.attachments
+                    if attachment not in existing
+                ]
+
+                form_name = submission.form.name
+
+                def upload_attachment(
+                    item: tuple[SubmissionFileAttachment, DocumentOptions],
+                ) -> str:
+                    attachment, document_options = item
+                    # requests sessions are not thread-safe, so every upload uses its
+                    # own client
+                    with get_documents_client(api_group) as upload_documents_client:
+                        return register_submission_attachment(
+                            attachment,
+                            name=form_name,
+                            # assume same as submission
+                            language=submission.language_code,
+                            document_options=document_options,
+                            documents_client=upload_documents_client,
                         )
-                        submission_attachments.append(
-                            ObjectsAPISubmissionAttachment(
-                                submission_file_attachment=attachment,
-                                document_url=document_url,
+
+                # the uploads are independent of each other, so they're done
+                # concurrently. Successful uploads are saved even if others fail.
+                outcomes = {
+                    attachment.pk: outcome
+                    for (attachment, _), outcome in map_concurrently(
+                        upload_attachment, uploads
+                    )
+                }
+                # keep the order of the attachments, for the first failure and the
+                # saved document URLs
+                errors: list[Exception] = []
+                for attachment, _ in uploads:
+                    match outcomes[attachment.pk]:
+                        case Exception() as exc:
+                            errors.append(exc)
+                        case str(document_url):
+                            submission_attachments.append(
+                                ObjectsAPISubmissionAttachment(
+                                    submission_file_attachment=attachment,
+                                    document_url=document_url,
+                                )
                             )
-                        )
+                if errors:
+                    raise errors[0]
 
     @abstractmethod
     def get_record_data(
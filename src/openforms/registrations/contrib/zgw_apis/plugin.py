@@ -1,5 +1,6 @@
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial, wraps
 from io import BytesIO
@@ -12,7 +13,7 @@ from django.utils.translation import gettext, gettext_lazy as _
 import requests
 import structlog
 from furl import furl
-from glom import assign
+from glom import assign, glom
 
 from openforms.authentication.service import get_branch_number
 from openforms.config.data import Action
@@ -36,7 +37,11 @@ from openforms.formio.datastructures import FormioConfigurationWrapper
 from openforms.formio.typing import Component
 from openforms.forms.json_schema import NestedDict
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.submissions.public_references import generate_unique_submission_reference
 from openforms.template import openforms_backend, render_from_string
 from openforms.typing import JSONObject, VariableValue
@@ -49,7 +54,7 @@ from ...contrib.objects_api.handlers.v1 import _get_variables_for_context
 from ...exceptions import RegistrationFailed
 from ...json_output import get_json_data
 from ...registry import register
-from ...utils import execute_unless_result_exists
+from ...utils import execute_unless_result_exists, map_concurrently, store_result
 from .checks import check_config
 from .client import get_catalogi_client, get_documents_client, get_zaken_client
 from .constants import SummaryDocumentChoices
@@ -74,6 +79,63 @@ class VariablesProperties(TypedDict):
     eigenschap: str
 
 
+@dataclass
+class _AttachmentUpload:
+    attachment: SubmissionFileAttachment
+    options: DocumentOptions
+    document: dict | None
+    relation: dict | None
+
+
+def _upload_attachments(
+    zgw: ZGWApiGroupConfig,
+    submission: Submission,
+    zaak: dict,
+    uploads: Sequence[_AttachmentUpload],
+) -> None:
+    """
+    Upload the attachments to the Documenten API and relate them to the zaak.
+
+    The uploads are independent of each other, so they're done concurrently. The
+    intermediate results are stored as soon as an upload completes (or fails), so
+    that a retry doesn't create the same documents again. The error of the first
+    failed attachment is raised, like in sequential uploads.
+    """
+
+    def upload_attachment(upload: _AttachmentUpload) -> None:
+        # requests sessions are not thread-safe, so every upload uses its own clients
+        with (
+            get_documents_client(zgw) as documents_client,
+            get_zaken_client(zgw) as zaken_client,
+        ):
+            if not upload.document:
+                upload.document = create_attachment_document(
+                    client=documents_client,
+                    name="",  # ignored, a title is always provided via doc_options
+                    submission_attachment=upload.attachment,
+                    options=upload.options,
+                    language=submission.language_code,
+                )
+            if not upload.relation:
+                upload.relation = zaken_client.relate_document(
+                    zaak=zaak, document=upload.document
+                )
+
+    errors: dict[int, Exception] = {}
+    pending = [upload for upload in uploads if not upload.relation]
+    for upload, outcome in map_concurrently(upload_attachment, pending):
+        spec = f"intermediate.documents.{upload.attachment.id}"
+        if upload.document:
+            store_result(submission, f"{spec}.document", upload.document)
+        if upload.relation:
+            store_result(submission, f"{spec}.relation", upload.relation)
+        if isinstance(outcome, Exception):
+            errors[upload.attachment.id] = outcome
+    for upload in uploads:
+        if exc := errors.get(upload.attachment.id):
+            raise exc
+
+
 def get_property_mappings_from_submission(
     submission: Submission, mappings: list[VariablesProperties]
 ) -> dict[str, VariableValue]:
@@ -650,8 +712,7 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                 datetime_in_amsterdam(submission.completed_on).date().isoformat()
             )
 
-            # TODO: threading? asyncio?
-            submission_uploads = defaultdict[str, list[str]](list)
+            uploads: list[_AttachmentUpload] = []
             default_cl = options["doc_vertrouwelijkheidaanduiding"]
             file_options = {item["key"]: item for item in options.get("files", [])}
             for attachment in submission.attachments:
@@ -694,31 +755,23 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                     if _title := overrides.get("title"):
                         doc_options["titel"] = _title
 
-                attachment_document = execute_unless_result_exists(
-                    partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name="",  # ignored, a title is always provided via doc_options
-                        submission_attachment=attachment,
+                spec = f"intermediate.documents.{attachment.id}"
+                uploads.append(
+                    _AttachmentUpload(
+                        attachment=attachment,
                         options=doc_options,
-                        language=attachment.submission_step.submission.language_code,  # assume same as submission
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.document",  # type: ignore
+                        document=glom(result, f"{spec}.document", default=None),
+                        relation=glom(result, f"{spec}.relation", default=None),
+                    )
                 )
 
-                submission_uploads[attachment.data_path].append(
-                    attachment_document["url"]
-                )
+            _upload_attachments(zgw, submission, zaak, uploads)
 
-                execute_unless_result_exists(
-                    partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.relation",  # type: ignore
+            submission_uploads = defaultdict[str, list[str]](list)
+            for upload in uploads:
+                assert upload.document is not None
+                submission_uploads[upload.attachment.data_path].append(
+                    upload.document["url"]
                 )
 
             # needs to be done *after* the attachments have been uploaded to the
@@ -2,10 +2,11 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 from unittest.mock import patch
 
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 
+import requests_mock
 from privates.test import temp_private_root
-from requests import RequestException
+from requests import HTTPError, RequestException
 from vcr.request import Request as VCRRequest
 
 from openforms.contrib.objects_api.tests.factories import ObjectsAPIGroupConfigFactory
@@ -21,6 +22,7 @@ from openforms.utils.tests.vcr import OFVCRMixin
 from ....exceptions import RegistrationFailed
 from ....tasks import register_submission
 from ..constants import SummaryDocumentChoices
+from ..plugin import _AttachmentUpload, _upload_attachments
 from .factories import ZGWApiGroupConfigFactory
 
 
@@ -365,3 +367,89 @@ class PartialRegistrationFailureTests(OFVCRMixin, TestCase):
         self.assertTrue(
             object_data["url"].startswith("http://localhost:8001/api/v2/objects/")
         )
+
+
+@temp_private_root()
+@override_settings(REGISTRATION_MAX_CONCURRENT_UPLOADS=3)
+class ConcurrentAttachmentUploadTests(TestCase):
+    @requests_mock.Mocker()
+    def test_intermediate_results_stored_and_first_error_raised(self, m):
+        zgw_api_group = ZGWApiGroupConfigFactory.create(
+            zrc_service__api_root="https://zaken.example.com/api/v1/",
+            drc_service__api_root="https://documenten.example.com/api/v1/",
+        )
+        submission = SubmissionFactory.create(completed=True)
+        attachments = [
+            SubmissionFileAttachmentFactory.create(
+                submission_step__submission=submission
+            )
+            for _ in range(4)
+        ]
+        uploads = [
+            _AttachmentUpload(
+                attachment=attachment,
+                options={
+                    "informatieobjecttype": "https://catalogi.example.com/iot/1",
+                    "organisatie_rsin": "000000000",
+                    "titel": f"attachment-{index}",
+                },
+                document=None,
+                relation=None,
+            )
+            for index, attachment in enumerate(attachments)
+        ]
+
+        # the requests are performed in any order, so the responses are based on the
+        # request content
+        def create_document(request, context):
+            title = request.json()["titel"]
+            if title == "attachment-1":
+                context.status_code = 500
+                return {}
+            context.status_code = 201
+            return {"url": f"https://documenten.example.com/api/v1/docs/{title}"}
+
+        def relate_document(request, context):
+            document_url = request.json()["informatieobject"]
+            if document_url.endswith("attachment-3"):
+                context.status_code = 400
+                return {}
+            context.status_code = 201
+            return {"url": f"{document_url}/relation"}
+
+        m.post(
+            "https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten",
+            json=create_document,
+        )
+        m.post(
+            "https://zaken.example.com/api/v1/zaakinformatieobjecten",
+            json=relate_document,
+        )
+        zaak = {"url": "https://zaken.example.com/api/v1/zaken/1"}
+
+        with self.assertRaises(HTTPError) as exc_context:
+            _upload_attachments(zgw_api_group, submission, zaak, uploads)
+
+        # the error of the first failed attachment is raised
+        self.assertEqual(exc_context.exception.response.status_code, 500)
+        self.assertEqual(len(m.request_history), 7)
+        submission.refresh_from_db()
+        assert submission.registration_result
+        documents = submission.registration_result["intermediate"]["documents"]
+        base_url = "https://documenten.example.com/api/v1/docs"
+        self.assertEqual(
+            documents,
+            {
+                str(attachments[0].pk): {
+                    "document": {"url": f"{base_url}/attachment-0"},
+                    "relation": {"url": f"{base_url}/attachment-0/relation"},
+                },
+                str(attachments[2].pk): {
+                    "document": {"url": f"{base_url}/attachment-2"},
+                    "relation": {"url": f"{base_url}/attachment-2/relation"},
+                },
+                str(attachments[3].pk): {
+                    "document": {"url": f"{base_url}/attachment-3"},
+                },
+            },
+        )
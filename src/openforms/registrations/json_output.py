@@ -80,14 +80,16 @@ class JSONDocumentData:
     values and render them in a user-interface.
     """
 
-    def serialize(self, **extra) -> str:
+    def serialize(
+        self, *, encoder: type[json.JSONEncoder] = DjangoJSONEncoder, **extra
+    ) -> str:
         return json.dumps(
             {
                 "values": self.values.data,
                 "values_schema": self.values_schema,
                 **extra,
             },
-            cls=DjangoJSONEncoder,
+            cls=encoder,
         )
 
 
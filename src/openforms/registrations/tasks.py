@@ -14,7 +14,9 @@ from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.formio.registry import register as formio_registry
 from openforms.formio.typing.base import Component
+from openforms.forms.statistics import record_submission_statistics
 from openforms.logging import audit_logger
+from openforms.logging.constants import REGISTRATION_SUCCESS_EVENT
 from openforms.submissions.constants import (
     ComponentPreRegistrationStatuses,
     PostSubmissionEvents,
@@ -219,7 +221,9 @@ def register_submission(submission_id: int, event: PostSubmissionEvents | str) -
         trigger=event,
         submission_uuid=str(submission.uuid),
     )
-    audit_log = audit_logger.bind(**structlog.get_context(log))
+    audit_log = audit_logger.bind(
+        **structlog.get_context(log), submission_pk=submission.pk
+    )
 
     if submission.registration_status == RegistrationStatuses.success:
         # if it's already successfully registered, do not overwrite that.
@@ -345,7 +349,10 @@ def register_submission(submission_id: int, event: PostSubmissionEvents | str) -
             raise exc
         return
 
-    audit_log.info("registration_success")
+    audit_log.info(REGISTRATION_SUCCESS_EVENT)
+    record_submission_statistics(
+        REGISTRATION_SUCCESS_EVENT, submission, timestamp=timezone.now()
+    )
     if (
         config.wait_for_payment_to_register
         and event == PostSubmissionEvents.on_payment_complete
@@ -364,7 +371,9 @@ def update_registration_with_confirmation_email(submission_id: int) -> None:
 
     submission = Submission.objects.get(id=submission_id)
     log = log.bind(submission_uuid=str(submission.uuid))
-    audit_log = audit_logger.bind(**structlog.get_context(log))
+    audit_log = audit_logger.bind(
+        **structlog.get_context(log), submission_pk=submission.pk
+    )
 
     if submission.registration_status != RegistrationStatuses.success:
         log.info(
@@ -434,6 +443,7 @@ def execute_component_pre_registration(
     submission = Submission.objects.get(id=submission_id)
     audit_log = audit_logger.bind(
         action="formio.component_pre_registration",
+        submission_pk=submission.pk,
         submission_uuid=str(submission.uuid),
         component_key=component_key,
         component_type=component["type"],
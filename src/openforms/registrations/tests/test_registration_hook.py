@@ -15,7 +15,11 @@ from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.models import Service
 
 from openforms.config.models import GlobalConfiguration
-from openforms.forms.models import FormRegistrationBackend
+from openforms.forms.models import (
+    FormRegistrationBackend,
+    SubmissionStatisticsRecord,
+)
+from openforms.logging.constants import REGISTRATION_SUCCESS_EVENT
 from openforms.logging.models import TimelineLogProxy
 from openforms.payments.constants import PaymentStatus
 from openforms.submissions.constants import PostSubmissionEvents, RegistrationStatuses
@@ -91,6 +95,9 @@ class RegistrationHookTests(TestCase):
             {"result": "ok"},
         )
         self.assertEqual(self.submission.last_register_date, timezone.now())
+        statistics_record = SubmissionStatisticsRecord.objects.get()
+        self.assertEqual(statistics_record.event, REGISTRATION_SUCCESS_EVENT)
+        self.assertEqual(statistics_record.timestamp, timezone.now())
 
     @freeze_time("2021-08-04T12:00:00+02:00")
     def test_failing_registration(self):
@@ -127,6 +134,7 @@ class RegistrationHookTests(TestCase):
         tb = self.submission.registration_result["traceback"]
         self.assertIn("Can't divide by zero", tb)
         self.assertEqual(self.submission.last_register_date, timezone.now())
+        self.assertFalse(SubmissionStatisticsRecord.objects.exists())
 
         with (
             self.subTest("On retry - does raise"),
@@ -0,0 +1,37 @@
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from ..utils import map_concurrently
+
+
+class MapConcurrentlyTests(SimpleTestCase):
+    def test_outcomes_are_yielded_for_all_items(self):
+        def fn(item: int) -> int:
+            if item == 3:
+                raise ValueError("no threes")
+            return item * 2
+
+        outcomes = dict(map_concurrently(fn, range(5), max_workers=4))
+
+        self.assertEqual(set(outcomes), {0, 1, 2, 3, 4})
+        self.assertEqual(outcomes[4], 8)
+        self.assertIsInstance(outcomes[3], ValueError)
+
+    def test_items_are_processed_simultaneously(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fn(item: int) -> int:
+            # deadlocks (and times out) unless all items run at the same time
+            barrier.wait()
+            return item
+
+        outcomes = dict(map_concurrently(fn, range(3), max_workers=3))
+
+        self.assertEqual(outcomes, {0: 0, 1: 1, 2: 2})
+
+    @override_settings(REGISTRATION_MAX_CONCURRENT_UPLOADS=1)
+    def test_single_worker_preserves_order(self):
+        outcomes = list(map_concurrently(lambda item: item, range(10)))
+
+        self.assertEqual(outcomes, [(item, item) for item in range(10)])
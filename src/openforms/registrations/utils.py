@@ -1,6 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import as_completed
 
+from django.conf import settings
+
+import structlog
 from glom import assign, glom
+from zgw_consumers.concurrent import parallel
 
 from openforms.submissions.models import Submission
 
@@ -26,7 +31,51 @@ def execute_unless_result_exists[R](
     if result is unset:
         result = callback_result
 
-    # store the result
+    store_result(submission, spec, result)
+    return callback_result
+
+
+def store_result(submission: Submission, spec: str, result) -> None:
+    """
+    Store an (intermediate) result in the registration result of the submission.
+    """
+    if submission.registration_result is None:
+        submission.registration_result = {}
     assign(submission.registration_result, spec, result, missing=dict)
     submission.save(update_fields=["registration_result"])
-    return callback_result
+
+
+def map_concurrently[T, R](
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> Iterator[tuple[T, R | Exception]]:
+    """
+    Call ``fn`` for every item on a thread pool and yield the outcomes as they complete.
+
+    The outcomes are yielded in the calling thread, so that the caller can store the
+    (intermediate) results in the database. ``fn`` itself must not perform any
+    database queries, as the worker threads use their own database connection. API
+    clients must not be shared between the calls either, as requests sessions are not
+    thread-safe.
+
+    Exceptions raised by ``fn`` are yielded instead of a result, so that the outcomes
+    of the other items can still be processed before failing.
+    """
+    # ensure we propagate the threadlocal context to the worker threads
+    ctx = structlog.contextvars.get_contextvars()
+
+    def _call(item: T) -> R | Exception:
+        structlog.contextvars.bind_contextvars(**ctx)
+        try:
+            return fn(item)
+        except Exception as exc:
+            return exc
+
+    if max_workers is None:
+        max_workers = settings.REGISTRATION_MAX_CONCURRENT_UPLOADS
+
+    with parallel(max_workers=max_workers) as executor:
+        futures = {executor.submit(_call, item): item for item in items}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
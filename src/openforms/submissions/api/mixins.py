@@ -5,6 +5,7 @@ import structlog
 from rest_framework.request import Request
 from rest_framework.reverse import reverse
 
+from openforms.forms.statistics import record_submission_statistics
 from openforms.logging import audit_logger
 from openforms.logging.constants import FORM_SUBMIT_SUCCESS_EVENT
 
@@ -46,6 +47,9 @@ class SubmissionCompletionMixin:
             FORM_SUBMIT_SUCCESS_EVENT,
             submission_uuid=str(submission.uuid),
         )
+        record_submission_statistics(
+            FORM_SUBMIT_SUCCESS_EVENT, submission, timestamp=submission.completed_on
+        )
 
         remove_submission_from_session(submission, self.request.session)
 
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from uuid import UUID
 
 from rest_framework import permissions
@@ -116,7 +115,8 @@ class CanNavigateBetweenSubmissionStepsPermission(permissions.BasePermission):
         submission = obj.submission
         state = submission.load_execution_state()
         assert obj.form_step is not None
-        configuration_copy = deepcopy(obj.form_step.form_definition.configuration)
+        form_definition = obj.form_step.form_definition
+        configuration_wrapper_copy = form_definition.configuration_wrapper.copy()
         check_submission_logic(submission)
 
         incomplete_steps = [
@@ -129,8 +129,8 @@ class CanNavigateBetweenSubmissionStepsPermission(permissions.BasePermission):
         # restore any possible logic side-effects to the current step configuration.
         # Some logic rules may trigger that don't for the submission step PUT or logic
         # check, as we don't take unsaved/dirty data into account here.
-        obj.form_step.form_definition.configuration = configuration_copy
-        del obj.form_step.form_definition.configuration_wrapper
+        form_definition.configuration = configuration_wrapper_copy.configuration
+        form_definition.configuration_wrapper = configuration_wrapper_copy
 
         if not incomplete_steps:
             return True
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import TypedDict
@@ -406,7 +405,7 @@ class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
         if not require_backend:
             # Creating a default configuration is only useful if we do not require the
             # backend for logic evaluation.
-            wrapper = deepcopy(instance.form_step.form_definition.configuration_wrapper)
+            wrapper = instance.form_step.form_definition.configuration_wrapper.copy()
             rewrite_formio_components_for_request(
                 wrapper, request=self.context["request"]
             )
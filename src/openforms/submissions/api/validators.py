@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Literal
 
 from django.utils.translation import gettext_lazy as _
@@ -35,8 +34,8 @@ class ValidatePrefillData:
         # readonly, which beats the point of performing this check.
         state = instance.submission.variables_state
         original_data = state.get_data(include_unsaved=True)
-        original_configuration = deepcopy(
-            instance.form_step.form_definition.configuration
+        original_configuration_wrapper = (
+            instance.form_step.form_definition.configuration_wrapper.copy()
         )
         evaluate_form_logic(instance.submission, step=instance, unsaved_data=None)
 
@@ -81,9 +80,10 @@ class ValidatePrefillData:
 
         # Reset the configuration and data to the state from before validating prefill.
         state.set_values(original_data)
-        instance.form_step.form_definition.configuration = original_configuration
+        form_definition = instance.form_step.form_definition
+        form_definition.configuration = original_configuration_wrapper.configuration
+        form_definition.configuration_wrapper = original_configuration_wrapper
         instance._form_logic_evaluated = False
-        del instance.form_step.form_definition.configuration_wrapper
 
 
 class FormMaintenanceModeValidator:
@@ -1,6 +1,7 @@
 import contextlib
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
 from django.utils import timezone
@@ -707,7 +708,12 @@ class SubmissionStepViewSet(
         form_data_serializer.is_valid(raise_exception=True)
 
         data = form_data_serializer.validated_data["data"]
-        new_configuration = evaluate_form_logic(submission, submission_step, data)
+        new_configuration = evaluate_form_logic(
+            submission,
+            submission_step,
+            data,
+            incremental=settings.LOGIC_CHECK_INCREMENTAL_EVALUATION,
+        )
         submission_step.form_step.form_definition.configuration = new_configuration
 
         submission_state_logic_serializer = SubmissionStateLogicSerializer(
@@ -1,12 +1,19 @@
+import csv
 import dataclasses
-from collections.abc import Iterator
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
 
 from django.db import models
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, Font
 from tablib.formats._json import serialize_objects_handler
 
 from .models import Submission
@@ -30,6 +37,11 @@ class ExportFileTypes:
     XML = FileType("xml", "text/xml")
 
 
+# Number of submissions (with their steps and variables) fetched from the database at
+# once while exporting.
+EXPORT_BATCH_SIZE = 100
+
+
 def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
     renderer = Renderer(submission, mode=RenderModes.export, as_html=False)
     for data_nodes in renderer.get_children():
@@ -39,58 +51,204 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+def _iter_submission_data(submission: Submission) -> Iterator[tuple[str, Any]]:
+    for data_node in iter_submission_data_nodes(submission):
+        if hasattr(data_node, "component"):
+            yield data_node.component["key"], data_node.value
+        elif hasattr(data_node, "variable"):
+            yield data_node.variable.key, data_node.value
+
+
+def iter_submission_export_rows(
+    queryset: models.QuerySet[Submission],
+) -> Iterator[list[Any]]:
     """
-    Turn a submissions queryset into a tablib dataset for export.
+    Turn a submissions queryset into export rows, starting with the header row.
+
+    The submissions are fetched in batches together with their authentication
+    details, steps and saved variables, and only a single submission is rendered at a
+    time. The columns are
+    determined by the first submission.
 
     .. note:: the queryset of submissions must all be of the same form!
     """
+    submissions = (
+        queryset.select_related("form", "auth_info")
+        .prefetch_related("submissionstep_set", "submissionvaluevariable_set")
+        .iterator(chunk_size=EXPORT_BATCH_SIZE)
+    )
     # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    if (first_submission := next(submissions, None)) is None:
+        return
 
-    first_submission = queryset[0]
+    translation_enabled = first_submission.form.translation_enabled
     headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
+    if translation_enabled:
         headers.append("Taalcode")
 
-    for data_node in iter_submission_data_nodes(first_submission):
-        if hasattr(data_node, "component"):
-            headers.append(data_node.component["key"])
-        elif hasattr(data_node, "variable"):
-            headers.append(data_node.variable.key)
-
-    data = tablib.Dataset(headers=headers)
+    first_submission_data = list(_iter_submission_data(first_submission))
+    num_fixed_columns = len(headers)
+    headers += [key for key, _ in first_submission_data]
+    columns = {
+        key: index
+        for index, key in enumerate(headers[num_fixed_columns:], num_fixed_columns)
+    }
 
-    for submission in queryset:
-        inzending_datum = (
+    def _build_row(
+        submission: Submission, submission_data: Iterable[tuple[str, Any]]
+    ) -> list[Any]:
+        row: list[Any] = [None] * len(headers)
+        row[0] = submission.form.admin_name
+        row[1] = (
             make_naive(submission.completed_on) if submission.completed_on else None
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
+        if translation_enabled:
+            row[2] = submission.language_code
+        for key, value in submission_data:
+            if (index := columns.get(key)) is not None:
+                row[index] = value
+        return row
+
+    yield headers
+    yield _build_row(first_submission, first_submission_data)
+    for submission in submissions:
+        yield _build_row(submission, _iter_submission_data(submission))
+
+
+def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    rows = iter_submission_export_rows(queryset)
+    # queryset *could* be empty
+    if (headers := next(rows, None)) is None:
+        return tablib.Dataset()
+
+    data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
     return data
 
 
+class _Echo:
+    """
+    File-like object returning the written value, to stream the output of writers.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _stream_csv(rows: Iterator[list[Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _stream_json(rows: Iterator[list[Any]]) -> Iterator[str]:
+    yield "["
+    if (headers := next(rows, None)) is not None:
+        for index, row in enumerate(rows):
+            record = json.dumps(
+                dict(zip(headers, row, strict=True)),
+                default=serialize_objects_handler,
+                ensure_ascii=False,
+            )
+            yield f", {record}" if index else record
+    yield "]"
+
+
+def _stream_xml(rows: Iterator[list[Any]]) -> Iterator[bytes]:
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    if (headers := next(rows, None)) is not None:
+        for row in rows:
+            yield etree.tostring(
+                _xml_submission_element(zip(headers, row, strict=True)),
+                encoding="utf8",
+                xml_declaration=False,
+                pretty_print=True,
+            )
+    yield b"</submissions>\n"
+
+
+def _xlsx_cell(worksheet, value, *, font=None, alignment=None) -> Cell:
+    cell = WriteOnlyCell(worksheet)
+    try:
+        cell.value = value
+    except ValueError:
+        cell.value = str(value)
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _write_xlsx(rows: Iterator[list[Any]], file: IO[bytes]) -> None:
+    """
+    Write the rows to a spreadsheet, mimicking the tablib XLSX output.
+
+    In write-only mode, openpyxl writes the rows to disk as they are appended rather
+    than keeping the whole worksheet in memory.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+
+    if (headers := next(rows, None)) is not None:
+        worksheet.freeze_panes = "A2"
+        bold = Font(bold=True)
+        worksheet.append([_xlsx_cell(worksheet, key, font=bold) for key in headers])
+
+    wrap_text = Alignment(wrap_text=True)
+    for row in rows:
+        worksheet.append(
+            [
+                _xlsx_cell(worksheet, value, alignment=wrap_text)
+                if "\n" in str(value)
+                else _xlsx_cell(worksheet, value)
+                for value in row
+            ]
+        )
+    workbook.save(file)
+
+
 def export_submissions(
     queryset: models.QuerySet[Submission], file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> StreamingHttpResponse | FileResponse:
+    """
+    Export the submissions to a file download, without materializing the export.
+
+    Text based formats are streamed to the client while the submissions are being
+    rendered. Spreadsheets are a zip archive and can only be sent once completed, so
+    they are written to a temporary file first.
+    """
+    rows = iter_submission_export_rows(queryset)
     filename = f"submissions_export.{file_type.extension}"
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    match file_type:
+        case ExportFileTypes.XLSX:
+            file = tempfile.TemporaryFile()
+            _write_xlsx(rows, file)
+            file.seek(0)
+            response = FileResponse(file, content_type=file_type.content_type)
+        case ExportFileTypes.CSV:
+            response = StreamingHttpResponse(
+                _stream_csv(rows), content_type=file_type.content_type
+            )
+        case ExportFileTypes.JSON:
+            response = StreamingHttpResponse(
+                _stream_json(rows), content_type=file_type.content_type
+            )
+        case ExportFileTypes.XML:
+            response = StreamingHttpResponse(
+                _stream_xml(rows), content_type=file_type.content_type
+            )
+        case _:  # pragma: no cover
+            raise ValueError(f"Unsupported export file type: {file_type.extension}")
 
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
@@ -116,6 +274,14 @@ def _xml_value(parent, value, wrap_single=False):
         node.text = _xml_basic_value(value)
 
 
+def _xml_submission_element(fields: Iterable[tuple[str, Any]]) -> etree._Element:
+    elem = etree.Element("submission")
+    for key, value in fields:
+        field = etree.SubElement(elem, "field", name=key)
+        _xml_value(field, value, wrap_single=True)
+    return elem
+
+
 class XMLKeyValueExport:
     title = "xml"
 
@@ -141,10 +307,7 @@ class XMLKeyValueExport:
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(_xml_submission_element(row.items()))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
@@ -8,13 +8,15 @@ from opentelemetry import trace
 from openforms.formio.service import (
     FormioConfigurationWrapper,
     FormioData,
+    VisibilityGraph,
     get_dynamic_configuration,
     inject_variables,
-    process_visibility,
+    process_visibility,  # noqa: F401 - imported from here in the formio components
 )
 from openforms.formio.typing import FormioConfiguration
 
 from .logic.actions import ActionOperation
+from .logic.incremental import load_memo, store_memo
 from .logic.rules import get_rules_to_evaluate, iter_evaluate_rules
 
 if TYPE_CHECKING:
@@ -38,6 +40,8 @@ def evaluate_form_logic(
     submission: Submission,
     step: SubmissionStep,
     unsaved_data: FormioData | None = None,
+    *,
+    incremental: bool = False,
 ) -> FormioConfiguration:
     """
     Process all the form logic rules and mutate the step configuration if required.
@@ -80,7 +84,9 @@ def evaluate_form_logic(
     :param unsaved_data: Unsaved submitted data. This data is assumed to be valid, as we
       perform a conversion to the Python-type domain. Note that we fetch all the existing
       submission data from the state, so it's only necessary to pass unsaved data.
-
+    :param incremental: Re-use the outcome of the logic rules from the previous
+      evaluation for this step if their inputs did not change. See
+      :mod:`openforms.submissions.logic.incremental`.
     """
     # grab the configuration that will be mutated
     config_wrapper = step.form_step.form_definition.configuration_wrapper
@@ -143,6 +149,9 @@ def evaluate_form_logic(
 
     # 6. Evaluate the logic rules in order
     rules = get_rules_to_evaluate(submission, step)
+    memo = load_memo(submission, step) if incremental else None
+    if memo is not None:
+        memo.start(data_for_evaluation)
     mutation_operations = []
 
     # 6.1 If the action type is to set a variable, update the data. This happens inside
@@ -163,9 +172,13 @@ def evaluate_form_logic(
             data_for_visible_state=data_for_visible_state,
             configuration=config_wrapper,
             submission=submission,
+            memo=memo,
         ):
             mutation_operations.append(operation)
 
+    if memo is not None:
+        store_memo(submission, step, memo)
+
     # 7. Apply the dynamic configuration
 
     # we need to apply the context-specific configurations before we can apply
@@ -222,21 +235,15 @@ def evaluate_conditional_logic(
     Evaluate conditional logic through iteration.
 
     Note that this assumes the data converges to a final state, so no cycles can be
-    present in the complete conditional logic tree.
+    present in the complete conditional logic tree. Only the components affected by
+    changes are evaluated again, see :class:`openforms.formio.visibility.VisibilityGraph`.
 
     :param configuration: Formio configuration.
     :param data: Data used for evaluation. Mutations will be applied to the data
       directly.
     :param wrapper: Formio configuration wrapper. Required for component lookup.
     """
-    processed_data = None
-    _loop_count = 0
-    while processed_data != data:
-        if _loop_count >= 50:  # pragma: nocover
-            raise RuntimeError("Potential infinite loop stopped!")
-        _loop_count += 1
-        processed_data = deepcopy(data)
-        process_visibility(configuration, data, wrapper)
+    VisibilityGraph.build(configuration, wrapper).process(data)
 
 
 def check_submission_logic(
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Iterable, Mapping, Sequence
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from itertools import chain
 from typing import Any, Self, TypedDict
 from uuid import UUID
 
 from django.core.cache import cache
-from django.core.serializers.json import DjangoJSONEncoder
 
 from glom import assign
-from json_logic import UNDEFINED_VALUE, jsonLogic
+from json_logic import UNDEFINED_VALUE
 
 from openforms.dmn.service import evaluate_dmn
 from openforms.formio.service import (
@@ -22,10 +21,12 @@ from openforms.formio.service import (
 )
 from openforms.formio.typing.custom import ChildProperties
 from openforms.forms.constants import LogicActionTypes
-from openforms.forms.models import FormLogic, FormStep
+from openforms.forms.models import Form, FormLogic, FormStep, FormVariable
 from openforms.template import extract_variables_used
 from openforms.typing import DataMapping, JSONObject
+from openforms.utils.cache import get_digest
 from openforms.utils.json_logic import introspect_json_logic
+from openforms.utils.json_logic.compiler import compile_json_logic
 from openforms.variables.constants import FormVariableSources
 from openforms.variables.models import ServiceFetchConfiguration
 from openforms.variables.service import resolve_key
@@ -430,11 +431,8 @@ class VariableAction(ActionOperation):
         data_for_visible_state: FormioData,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            result = jsonLogic(
-                self.value,  # pyright: ignore[reportArgumentType]
-                context.data,  # pyright: ignore[reportArgumentType]
-                use_var_undefined=True,
-            )
+            program = compile_json_logic(self.value, use_var_undefined=True)  # pyright: ignore[reportArgumentType]
+            result = program(context.data)  # pyright: ignore[reportArgumentType]
             # variables are returned as UNDEFINED_VALUE when use_var_undefined is set to
             # True and they are missing from the context entirely. If they are present in
             # the context and None, then the output will be None.
@@ -591,10 +589,28 @@ class SynchronizeVariablesAction(ActionOperation):
 @dataclass
 class ServiceFetchAction(ActionOperation):
     variable: str
+    _form_variable: FormVariable | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
+    def form_variable(self) -> FormVariable:
+        """
+        The variable to fetch the value for, with its service fetch configuration.
+
+        The variable is only queried once per operation. Use
+        :func:`load_service_fetch_variables` to load the variables of multiple
+        operations at once.
+        """
+        if self._form_variable is None:
+            self._form_variable = self.rule.form.formvariable_set.select_related(
+                "service_fetch_configuration"
+            ).get(key=self.variable)
+        return self._form_variable
+
+    @cached_property
     def unresolved_input_variables(self) -> set[str]:
-        var = self.rule.form.formvariable_set.get(key=self.variable)
+        var = self.form_variable
         fetch_config: ServiceFetchConfiguration = var.service_fetch_configuration
 
         # The path, query parameters, and header values support templating, so we have
@@ -644,7 +660,7 @@ class ServiceFetchAction(ActionOperation):
         *,
         data_for_visible_state: FormioData,
     ) -> DataMapping:
-        var = self.rule.form.formvariable_set.get(key=self.variable)
+        var = self.form_variable
         with log_errors({}, self.rule):  # TODO proper error handling
             result = perform_service_fetch(var, context, str(submission.uuid))
             if result is None:
@@ -653,6 +669,32 @@ class ServiceFetchAction(ActionOperation):
             return {var.key: result.value}
 
 
+def load_service_fetch_variables(
+    form: Form, operations: Iterable[ServiceFetchAction]
+) -> None:
+    """
+    Load the form variables of multiple service fetch operations in a single query.
+
+    :param form: The form the operations (rules) belong to.
+    :param operations: The operations to load the variables for. Operations that
+      already loaded their variable are skipped.
+    """
+    pending = [
+        operation for operation in operations if operation._form_variable is None
+    ]
+    if not pending:
+        return
+
+    variables = {
+        variable.key: variable
+        for variable in form.formvariable_set.filter(
+            key__in={operation.variable for operation in pending}
+        ).select_related("service_fetch_configuration")
+    }
+    for operation in pending:
+        operation._form_variable = variables.get(operation.variable)
+
+
 class DMNVariableMapping(TypedDict):
     form_variable: str
     dmn_variable: str
@@ -744,15 +786,16 @@ class EvaluateDMNAction(ActionOperation):
                 plugin_id=self.plugin_id,
             )
 
-        # Perform DMN call or retrieve result from cache
-        inputs = json.dumps(dmn_inputs, cls=DjangoJSONEncoder, sort_keys=True)
-        cache_key = hash(
-            str(submission.uuid)
-            + self.decision_definition_id
-            + self.decision_definition_version
-            + self.plugin_id
-            + inputs
+        # Perform DMN call or retrieve result from cache.
+        digest = get_digest(
+            [
+                self.decision_definition_id,
+                self.decision_definition_version,
+                self.plugin_id,
+                dmn_inputs,
+            ]
         )
+        cache_key = f"dmn-evaluation:{submission.uuid}:{digest}"
         dmn_outputs = cache.get_or_set(
             cache_key,
             default=_evaluate_dmn,
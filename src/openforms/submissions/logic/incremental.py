@@ -0,0 +1,216 @@
+"""
+Incremental (dependency-driven) evaluation of the logic rules of a submission step.
+
+The ``_check-logic`` endpoint is called by the frontend on (debounced) input changes,
+which typically only touch a handful of fields. Rather than evaluating every rule from
+scratch on every call, we remember the outcome of each rule together with the
+(top-level) variable keys it depends on. On the next call, only the rules that (may)
+depend on changed data are evaluated again - the outcome of all other rules is re-used.
+
+Some ground rules to keep this correct:
+
+* the rules are already ordered according to their dependencies by the logic analysis
+  (see :mod:`openforms.forms.logic_analysis`), so a single forward pass suffices to
+  propagate changes from one rule to the rules depending on it;
+* only the *outcomes* (is the rule triggered, what values do the actions produce) are
+  re-used. Actions modifying the formio configuration are always applied again, as the
+  configuration is rebuilt for every request;
+* rules of which we cannot (statically) determine all the inputs are always evaluated.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+
+from openforms.formio.service import FormioData
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.cache import get_digest
+from openforms.utils.json_logic import introspect_json_logic
+
+from ..models import Submission, SubmissionStep
+from .actions import ActionOperation, VariableAction
+
+# The frontend calls the logic check endpoint while the user is filling out a step, so
+# the memo only needs to survive for a typical step (and session) duration.
+CACHE_TIMEOUT = 60 * 15
+
+type ActionResults = Mapping[int, DataMapping | None]
+"""
+Mapping of action index in the rule to the (python-typed) data mutations it produced.
+"""
+
+
+def _get_root(key: str) -> str:
+    return key.split(".", 1)[0]
+
+
+def _digest(value: object) -> str:
+    try:
+        return get_digest(value)
+    except TypeError:
+        return get_digest(repr(value))
+
+
+def get_rule_fingerprint(rule: FormLogic) -> str:
+    """
+    Digest of the rule definition - any change to the rule invalidates its outcome.
+    """
+    return _digest([rule.json_logic_trigger, rule.actions])
+
+
+def get_data_digests(data: FormioData) -> dict[str, str]:
+    """
+    Compute a digest for every top-level key in the data.
+    """
+    return {key: _digest(value) for key, value in data.data.items()}
+
+
+def get_rule_input_roots(
+    rule: FormLogic, operations: Collection[ActionOperation]
+) -> frozenset[str] | None:
+    """
+    Determine the top-level data keys the outcome of a rule depends on.
+
+    :returns: The set of top-level keys, or ``None`` if the inputs cannot be
+      determined reliably.
+    """
+    expressions = [rule.json_logic_trigger] + [
+        operation.value
+        for operation in operations
+        if isinstance(operation, VariableAction)
+    ]
+    keys: set[str] = set()
+    for expression in expressions:
+        try:
+            introspection = introspect_json_logic(expression)  # pyright: ignore[reportArgumentType]
+        except (ValueError, AssertionError):
+            # invalid expression, evaluating it (always) logs the error
+            return None
+        if not introspection.is_fully_introspectable():
+            return None
+        keys.update(var.key for var in introspection.get_input_keys())
+
+    for operation in operations:
+        keys.update(operation.unresolved_input_variables)
+
+    return frozenset(_get_root(key) for key in keys)
+
+
+@dataclass
+class RuleOutcome:
+    fingerprint: str
+    input_roots: frozenset[str]
+    triggered: bool
+    action_results: ActionResults
+
+
+@dataclass
+class LogicEvaluationMemo:
+    """
+    Outcome of the previous logic evaluation of a submission step.
+    """
+
+    data_digests: dict[str, str] = field(default_factory=dict)
+    outcomes: dict[int, RuleOutcome] = field(default_factory=dict)
+
+    dirty_roots: set[str] = field(default_factory=set, compare=False)
+    """
+    Top-level data keys that changed (or may have changed) compared to the previous
+    evaluation. Only relevant during evaluation, it is not persisted.
+    """
+
+    def __getstate__(self):
+        return {"data_digests": self.data_digests, "outcomes": self.outcomes}
+
+    def __setstate__(self, state):
+        self.data_digests = state["data_digests"]
+        self.outcomes = state["outcomes"]
+        self.dirty_roots = set()
+
+    def start(self, data: FormioData) -> None:
+        """
+        Mark the data that changed since the previous evaluation as dirty.
+
+        :param data: The data as it is right before the rules are evaluated.
+        """
+        digests = get_data_digests(data)
+        self.dirty_roots = {
+            key
+            for key in digests.keys() | self.data_digests.keys()
+            if digests.get(key) != self.data_digests.get(key)
+        }
+        self.data_digests = digests
+
+    def get_reusable_outcome(self, rule: FormLogic) -> RuleOutcome | None:
+        """
+        Return the outcome of the previous evaluation if none of its inputs changed.
+        """
+        outcome = self.outcomes.get(rule.pk)
+        if outcome is None or not outcome.input_roots.isdisjoint(self.dirty_roots):
+            return None
+        if outcome.fingerprint != get_rule_fingerprint(rule):
+            return None
+        return outcome
+
+    def record(
+        self,
+        rule: FormLogic,
+        *,
+        triggered: bool,
+        action_results: ActionResults,
+    ) -> None:
+        """
+        Record the outcome of a freshly evaluated rule and propagate changes.
+
+        If the outcome differs from the previous one, the outputs of the rule are
+        marked as dirty so that the rules depending on them are evaluated again.
+        """
+        previous = self.outcomes.pop(rule.pk, None)
+        written_roots = {
+            _get_root(key)
+            for mutations in action_results.values()
+            if mutations
+            for key in mutations
+        }
+        if (
+            previous is None
+            or previous.triggered != triggered
+            or previous.action_results != action_results
+        ):
+            self.dirty_roots |= written_roots
+            self.dirty_roots.update(_get_root(key) for key in rule.output_variable_keys)
+
+        input_roots = get_rule_input_roots(rule, list(rule.action_operations))
+        # rules with inputs that can't be determined are always evaluated
+        if input_roots is None:
+            return
+        self.outcomes[rule.pk] = RuleOutcome(
+            fingerprint=get_rule_fingerprint(rule),
+            # Actions may use the current value of the variable they write to, e.g.
+            # when synchronizing variables.
+            input_roots=input_roots | written_roots,
+            triggered=triggered,
+            action_results=action_results,
+        )
+
+
+def _get_cache_key(submission: Submission, step: SubmissionStep) -> str:
+    assert step.form_step is not None
+    return f"submission-logic-memo:{submission.uuid}:{step.form_step.uuid}"
+
+
+def load_memo(submission: Submission, step: SubmissionStep) -> LogicEvaluationMemo:
+    memo = cache.get(_get_cache_key(submission, step))
+    if not isinstance(memo, LogicEvaluationMemo):
+        memo = LogicEvaluationMemo()
+    return memo
+
+
+def store_memo(
+    submission: Submission, step: SubmissionStep, memo: LogicEvaluationMemo
+) -> None:
+    cache.set(_get_cache_key(submission, step), memo, timeout=CACHE_TIMEOUT)
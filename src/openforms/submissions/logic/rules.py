@@ -1,7 +1,7 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from copy import deepcopy
 from itertools import chain
 
-from json_logic import jsonLogic
 from opentelemetry import trace
 
 from openforms.formio.service import (
@@ -10,10 +10,19 @@ from openforms.formio.service import (
     process_visibility,
 )
 from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.json_logic import introspect_json_logic
 
 from ..models import Submission, SubmissionStep
-from .actions import ActionOperation
+from .actions import (
+    ActionOperation,
+    PropertyAction,
+    ServiceFetchAction,
+    load_service_fetch_variables,
+)
+from .incremental import LogicEvaluationMemo
 from .log_utils import log_errors
+from .service_fetching import prefetch_service_values
 
 tracer = trace.get_tracer("openforms.submissions.logic.rules")
 
@@ -100,6 +109,8 @@ def iter_evaluate_rules(
     data_for_visible_state: FormioData,
     configuration: FormioConfigurationWrapper,
     submission: Submission,
+    *,
+    memo: LogicEvaluationMemo | None = None,
 ) -> Iterator[ActionOperation]:
     """
     Iterate over the rules and evaluate the trigger, yielding action operations and
@@ -118,10 +129,16 @@ def iter_evaluate_rules(
       visibility states.
     :param configuration: Formio configuration wrapper of a step.
     :param submission: Submission instance.
+    :param memo: Outcome of the previous evaluation, used for incremental evaluation.
+      Rules of which none of the inputs changed are not evaluated again, instead their
+      previous outcome is re-used. The memo is updated with the new outcomes.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
     state = submission.variables_state
 
+    rules = list(rules)
+    _prefetch_independent_service_values(rules, data, submission, memo=memo)
+
     for rule in rules:
         with (
             tracer.start_as_current_span(
@@ -134,15 +151,17 @@ def iter_evaluate_rules(
                 },
             ),
         ):
-            triggered = False
-            with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(
-                    jsonLogic(
-                        rule.json_logic_trigger,
-                        data.data,  # pyright: ignore[reportArgumentType]
-                        use_var_undefined=True,
+            outcome = memo.get_reusable_outcome(rule) if memo is not None else None
+            if outcome is not None:
+                triggered = outcome.triggered
+            else:
+                triggered = False
+                with log_errors(rule.json_logic_trigger, rule):
+                    triggered = bool(
+                        rule.compiled_trigger(data.data)  # pyright: ignore[reportArgumentType]
                     )
-                )
+
+            action_results: dict[int, DataMapping | None] = {}
 
             # If the rule was not triggered, we still need to handle the clear on hide,
             # as components can be hidden by default and shown when a logic rule is
@@ -154,26 +173,134 @@ def iter_evaluate_rules(
                     configuration,
                     data_for_visible_state=data_for_visible_state,
                 )
-                continue
+            else:
+                for index, operation in enumerate(rule.action_operations):
+                    # Property actions modify the configuration (and possibly the data
+                    # through clear-on-hide), which is rebuilt on every evaluation, so
+                    # they always need to be evaluated.
+                    if outcome is not None and not isinstance(
+                        operation, PropertyAction
+                    ):
+                        # don't share the mutable values with the memo
+                        mutations_python = deepcopy(outcome.action_results.get(index))
+                    elif mutations := operation.eval(
+                        data,
+                        configuration,
+                        submission,
+                        data_for_visible_state=data_for_visible_state,
+                    ):
+                        mutations_python = {
+                            key: state.variables[key].to_python(value)
+                            for key, value in mutations.items()
+                        }
+                    else:
+                        mutations_python = None
 
-            for operation in rule.action_operations:
-                if mutations := operation.eval(
-                    data,
-                    configuration,
-                    submission,
-                    data_for_visible_state=data_for_visible_state,
-                ):
-                    mutations_python = {
-                        key: state.variables[key].to_python(value)
-                        for key, value in mutations.items()
-                    }
-                    data.update(mutations_python)
-                    # Any mutations also need to be applied to the data for the visible
-                    # component state. Otherwise, the original user input data might
-                    # override it when flipping visibility states.
-                    data_for_visible_state.update(mutations_python)
-
-                yield operation
+                    if mutations_python:
+                        data.update(mutations_python)
+                        # Any mutations also need to be applied to the data for the
+                        # visible component state. Otherwise, the original user input
+                        # data might override it when flipping visibility states.
+                        data_for_visible_state.update(mutations_python)
+                    action_results[index] = deepcopy(mutations_python)
+
+                    yield operation
+
+            if memo is not None and outcome is None:
+                memo.record(
+                    rule,
+                    triggered=triggered,
+                    action_results=action_results,
+                )
+
+
+def _get_root(key: str) -> str:
+    return key.split(".", 1)[0]
+
+
+def _prefetch_independent_service_values(
+    rules: Sequence[FormLogic],
+    data: FormioData,
+    submission: Submission,
+    *,
+    memo: LogicEvaluationMemo | None,
+) -> None:
+    """
+    Perform the requests of independent service fetch actions upfront, concurrently.
+
+    A service fetch is independent if none of the rules (and actions) preceding it can
+    change the outcome of its rule trigger or the request it makes. Such a fetch will
+    be performed with exactly the same request arguments when the rules are evaluated
+    in order, so we can already perform it (if the rule is triggered). The responses
+    are stored in the service fetch cache, where the in-order evaluation of the rules
+    picks them up again.
+    """
+    rules_with_fetches = [
+        (
+            rule,
+            [
+                operation
+                for operation in rule.action_operations
+                if isinstance(operation, ServiceFetchAction)
+            ],
+        )
+        for rule in rules
+    ]
+    all_fetch_operations = [
+        operation for _, operations in rules_with_fetches for operation in operations
+    ]
+    # nothing to gain from running a single request concurrently
+    if len(all_fetch_operations) < 2:
+        return
+
+    # the variables are kept on the operations, so the evaluation of the rules doesn't
+    # query them again
+    load_service_fetch_variables(submission.form, all_fetch_operations)
+
+    fetches = []
+    # top-level keys of the data that (may) be written to by the rules so far
+    written_roots: set[str] = set()
+    for rule, fetch_operations in rules_with_fetches:
+        output_roots = {_get_root(key) for key in rule.output_variable_keys}
+        if (
+            fetch_operations
+            and (memo is None or memo.get_reusable_outcome(rule) is None)
+            and (trigger_roots := _get_trigger_roots(rule)) is not None
+            and trigger_roots.isdisjoint(written_roots)
+            and _is_triggered(rule, data)
+        ):
+            # actions in the rule itself may provide the inputs of the fetch too
+            unavailable_roots = written_roots | output_roots
+            for operation in fetch_operations:
+                input_roots = {
+                    _get_root(key) for key in operation.unresolved_input_variables
+                }
+                if not input_roots.isdisjoint(unavailable_roots):
+                    continue
+                fetches.append((operation.form_variable, data))
+
+        written_roots |= output_roots
+
+    if fetches:
+        prefetch_service_values(fetches, str(submission.uuid))
+
+
+def _get_trigger_roots(rule: FormLogic) -> set[str] | None:
+    try:
+        introspection = introspect_json_logic(rule.json_logic_trigger)  # pyright: ignore[reportArgumentType]
+    except (ValueError, AssertionError):
+        return None
+    if not introspection.is_fully_introspectable():
+        return None
+    return {_get_root(var.key) for var in introspection.get_input_keys()}
+
+
+def _is_triggered(rule: FormLogic, data: FormioData) -> bool:
+    try:
+        return bool(rule.compiled_trigger(data.data))  # pyright: ignore[reportArgumentType]
+    except Exception:
+        # errors are logged when the rule is evaluated for real
+        return False
 
 
 def _handle_clear_on_hide_for_untriggered_rule(
@@ -1,20 +1,35 @@
-import json
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 import jq
 import structlog
+from ape_pie import APIClient
 from json_logic import UNDEFINED_VALUE, jsonLogic
+from opentelemetry import trace
+from structlog.typing import Context
 from zgw_consumers.client import build_client
+from zgw_consumers.concurrent import parallel
 
 from openforms.formio.service import FormioData
 from openforms.forms.models import FormVariable
 from openforms.typing import JSONObject, JSONValue
+from openforms.utils.cache import get_digest
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
 
+from ..metrics import service_fetch_cache_lookups
+
 logger = structlog.stdlib.get_logger(__name__)
+tracer = trace.get_tracer("openforms.submissions.logic.service_fetching")
+
+# The number of distinct jq mapping expressions for which the compiled program is kept
+# around in a (worker) process.
+JQ_CACHE_SIZE = 256
+
+_cache_miss = object()
 
 
 @dataclass
@@ -27,6 +42,106 @@ class FetchResult:
     # response_headers: JSONObject
 
 
+@lru_cache(maxsize=JQ_CACHE_SIZE)
+def compile_jq(expression: str) -> jq._Program:
+    """
+    Compile the jq expression, or obtain the earlier compiled program from the cache.
+
+    Compiling is expensive compared to running the program against the (typically
+    small) response data, and the same mapping expressions are used over and over again.
+    """
+    return jq.compile(expression)
+
+
+def get_cache_key(submission_uuid: str, request_args: JSONObject) -> str:
+    """
+    Build the cache key for the fetch result of a service fetch in a submission.
+    """
+    return f"service-fetch:{submission_uuid}:{get_digest(request_args)}"
+
+
+def _get_cache_timeout(fetch_config: ServiceFetchConfiguration) -> int | object:
+    if (timeout := fetch_config.cache_timeout) is not None:
+        return timeout
+    return DEFAULT_TIMEOUT
+
+
+@tracer.start_as_current_span(
+    name="prefetch-service-values",
+    attributes={
+        "span.type": "app",
+        "span.subtype": "submissions",
+        "span.action": "logic",
+    },
+)
+def prefetch_service_values(
+    fetches: Iterable[tuple[FormVariable, FormioData]], submission_uuid: str
+) -> None:
+    """
+    Perform the HTTP requests of multiple service fetches concurrently.
+
+    The responses are stored in the cache, where :func:`perform_service_fetch` picks
+    them up for the same submission and request arguments. Nothing happens for fetches
+    that are already cached or can't be cached. Errors are logged and otherwise
+    ignored - the request is simply performed again (and the error handled) by
+    :func:`perform_service_fetch`.
+
+    :param fetches: The variables to fetch the value for, with the data to build the
+      request arguments from.
+    :param submission_uuid: The UUID of the submission to cache the responses for.
+    """
+    requests: dict[str, tuple[ServiceFetchConfiguration, dict]] = {}
+    for var, context in fetches:
+        fetch_config = var.service_fetch_configuration
+        if fetch_config is None or fetch_config.cache_timeout == 0:
+            continue
+        try:
+            request_args = fetch_config.request_arguments(context)
+        except Exception:
+            continue
+        cache_key = get_cache_key(submission_uuid, request_args)
+        if cache_key in requests or cache.has_key(cache_key):
+            continue
+        requests[cache_key] = (fetch_config, request_args)
+
+    # nothing to gain from running a single request in a thread
+    if len(requests) < 2:
+        return
+
+    # the client is built upfront, as this may need to query the database
+    jobs = [
+        (cache_key, build_client(fetch_config.service), request_args)
+        for cache_key, (fetch_config, request_args) in requests.items()
+    ]
+    # ensure we propagate the threadlocal context to the worker threads
+    ctx = structlog.contextvars.get_contextvars()
+    with parallel() as executor:
+        results = list(executor.map(partial(_prefetch, ctx), jobs))
+
+    for cache_key, raw_value in results:
+        if raw_value is _cache_miss:
+            continue
+        fetch_config = requests[cache_key][0]
+        cache.set(cache_key, raw_value, timeout=_get_cache_timeout(fetch_config))
+
+
+def _prefetch(
+    structlog_ctx: Context, job: tuple[str, APIClient, dict]
+) -> tuple[str, JSONValue | object]:
+    structlog.contextvars.bind_contextvars(**structlog_ctx)
+    cache_key, client, request_args = job
+    try:
+        with client:
+            response = client.request(**request_args)
+            response.raise_for_status()
+        return cache_key, response.json()
+    except Exception as exc:
+        logger.info(
+            "prefetch_service_value_failed", url=request_args["url"], exc_info=exc
+        )
+        return cache_key, _cache_miss
+
+
 def perform_service_fetch(
     var: FormVariable, context: FormioData, submission_uuid: str = ""
 ) -> FetchResult | None:
@@ -68,18 +183,21 @@ def perform_service_fetch(
     if not submission_uuid:
         raw_value = _do_fetch()
     else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
-        timeout = (
-            _timeout
-            if (_timeout := fetch_config.cache_timeout) is not None
-            else DEFAULT_TIMEOUT
+        cache_key = get_cache_key(str(submission_uuid), request_args)
+        timeout = _get_cache_timeout(fetch_config)
+        raw_value = cache.get(cache_key, default=_cache_miss)
+        cache_hit = raw_value is not _cache_miss
+        service_fetch_cache_lookups.add(
+            1, attributes={"type": "hit" if cache_hit else "miss"}
         )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
+        if not cache_hit:
+            raw_value = _do_fetch()
+            cache.set(cache_key, raw_value, timeout=timeout)
 
     match fetch_config.data_mapping_type, fetch_config.mapping_expression:
         case DataMappingTypes.jq, expression:
             # XXX raise warning if len(result) > 1 ?
-            value = jq.compile(expression).input(raw_value).first()
+            value = compile_jq(expression).input(raw_value).first()
         case DataMappingTypes.json_logic, expression:
             value = jsonLogic(expression, raw_value, use_var_undefined=True)
             # variables are returned as UNDEFINED_VALUE when use_var_undefined is set to
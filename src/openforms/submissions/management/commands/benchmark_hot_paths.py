@@ -0,0 +1,97 @@
+import json
+import platform
+import re
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the logic evaluation, step validation, variables state, PDF "
+        "rendering and form export on synthetic forms of increasing size. The results "
+        "are output as JSON. Requires the test tooling to be installed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10, 50, 200],
+            help=(
+                "Form sizes to benchmark - the number of fields and logic rules. "
+                "Defaults to 10, 50 and 200."
+            ),
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="How often to run each benchmark per form size. Defaults to 5.",
+        )
+        parser.add_argument(
+            "--benchmark",
+            dest="benchmarks",
+            action="append",
+            help="Benchmark to run, may be repeated. Defaults to all benchmarks.",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write the JSON results to. Defaults to stdout.",
+        )
+
+    def handle(self, **options):
+        # local imports since the test tooling is not part of the base dependencies!
+        import requests_mock
+
+        from ...tests.benchmarks import (
+            BENCHMARKS,
+            SERVICE_API_ROOT,
+            create_benchmark_form,
+            run_benchmark,
+        )
+
+        benchmarks = options["benchmarks"] or list(BENCHMARKS)
+        if unknown := [name for name in benchmarks if name not in BENCHMARKS]:
+            raise CommandError(
+                f"Unknown benchmark(s): {', '.join(unknown)}. Choose from: "
+                f"{', '.join(BENCHMARKS)}."
+            )
+
+        results = []
+        with requests_mock.Mocker() as m:
+            m.get(re.compile(f"^{re.escape(SERVICE_API_ROOT)}"), json={"value": 42})
+
+            for size in options["sizes"]:
+                # every size runs in its own transaction, which is rolled back since
+                # the synthetic forms and submissions are not kept
+                with transaction.atomic():
+                    benchmark_form = create_benchmark_form(size)
+                    try:
+                        for name in benchmarks:
+                            self.stderr.write(f"Running {name} (size {size})...")
+                            results.append(
+                                run_benchmark(
+                                    name, benchmark_form, size, options["repeat"]
+                                )
+                            )
+                    finally:
+                        transaction.set_rollback(True)
+                        # the on-commit cache invalidation doesn't run for the rolled
+                        # back transaction
+                        benchmark_form.clear_cache()
+
+        report = {
+            "release": settings.RELEASE,
+            "git_sha": settings.GIT_SHA,
+            "python": platform.python_version(),
+            "repeat": options["repeat"],
+            "results": results,
+        }
+        if output := options["output"]:
+            with open(output, "w") as outfile:
+                json.dump(report, outfile, indent=2)
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
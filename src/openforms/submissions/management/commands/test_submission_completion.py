@@ -75,14 +75,18 @@ class Command(BaseCommand):
         on_post_submission_event(submission.id, PostSubmissionEvents.on_retry)
 
         submission.refresh_from_db()
-        request = RequestFactory().get("/irrelevant")
+        request = Request(RequestFactory().get("/irrelevant"))
         processing_status = SubmissionProcessingStatus(
-            request=Request(request), submission=submission
+            request=request, submission=submission
         )
 
         while processing_status.status == ProcessingStatuses.in_progress:
             self.stdout.write("Still processing...")
             time.sleep(1)
+            # the task states are looked up once per instance
+            processing_status = SubmissionProcessingStatus(
+                request=request, submission=submission
+            )
 
         self.stdout.write(f"Processing complete, result: {processing_status.result}")
         if options["forget"]:
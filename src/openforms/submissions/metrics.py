@@ -32,6 +32,15 @@ step_saved_counter = meter.create_counter(
     description="The number of steps saved to the database.",
 )
 
+service_fetch_cache_lookups = meter.create_counter(
+    "openforms.submission.service_fetch_cache_lookups",
+    unit="1",  # unitless count
+    description=(
+        "The number of cache lookups for service fetch results, by result "
+        "(hit or miss)."
+    ),
+)
+
 
 def count_submissions(
     options: metrics.CallbackOptions,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import uuid
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, ClassVar, assert_never
@@ -458,8 +457,7 @@ class Submission(models.Model):
             if len(form_steps) == 0:
                 return FormioConfigurationWrapper(configuration={})
 
-            begin_configuration = deepcopy(form_steps[0].form_definition.configuration)
-            wrapper = FormioConfigurationWrapper(begin_configuration)
+            wrapper = form_steps[0].form_definition.configuration_wrapper.copy()
             for form_step in form_steps[1:]:
                 wrapper += form_step.form_definition.configuration_wrapper
             self._total_configuration_wrapper = wrapper
@@ -537,6 +535,7 @@ class Submission(models.Model):
     @transaction.atomic()
     def remove_sensitive_data(self):
         from .submission_files import SubmissionFileAttachment
+        from .submission_value_variable import invalidate_variables_snapshot
 
         if self.is_authenticated:
             self.auth_info.clear_sensitive_data()
@@ -550,6 +549,7 @@ class Submission(models.Model):
         sensitive_variables.update(
             value="", source=SubmissionValueVariableSources.sensitive_data_cleaner
         )
+        invalidate_variables_snapshot(self.pk)
 
         SubmissionFileAttachment.objects.filter(
             submission_step__submission=self,
@@ -859,7 +859,9 @@ class Submission(models.Model):
         self, enable_log: bool = False
     ) -> RegistrationBackendKey | None:
         backends = list(self.form.registration_backends.order_by("id"))
-        audit_log = audit_logger.bind(submission_uuid=str(self.uuid))
+        audit_log = audit_logger.bind(
+            submission_pk=self.pk, submission_uuid=str(self.uuid)
+        )
         match len(backends):  # sanity check
             case 1:
                 return backends[0].key
@@ -883,7 +885,9 @@ class Submission(models.Model):
     def resolve_registration_backend(
         self, enable_log: bool = False
     ) -> FormRegistrationBackend | None:
-        audit_log = audit_logger.bind(submission_uuid=str(self.uuid))
+        audit_log = audit_logger.bind(
+            submission_pk=self.pk, submission_uuid=str(self.uuid)
+        )
         if self.finalised_registration_backend_key:
             try:
                 return self.form.registration_backends.get(
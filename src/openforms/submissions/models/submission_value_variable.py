@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Collection
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
+from django.core.cache import cache
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, router, transaction
 from django.db.models.constraints import CheckConstraint
 from django.utils import timezone
 from django.utils.dateparse import parse_date
@@ -54,6 +56,115 @@ class ValueEncoder(DjangoJSONEncoder):
         return to_json() if callable(to_json) else super().default(obj)
 
 
+# The persisted variables of a submission are needed on (almost) every request while
+# filling out the form, so they only need to survive for a typical session duration.
+SNAPSHOT_CACHE_TIMEOUT = 60 * 60
+
+
+def _get_snapshot_version_key(submission_id: int) -> str:
+    return f"submission-variables-version:{submission_id}"
+
+
+def _get_snapshot_key(submission_id: int, version: str) -> str:
+    return f"submission-variables:{submission_id}:{version}"
+
+
+class _SnapshotVersionBump:
+    """
+    On-commit callback setting a new snapshot version for a submission.
+    """
+
+    def __init__(self, submission_id: int):
+        self.submission_id = submission_id
+        self.done = False
+
+    def __call__(self) -> None:
+        cache.set(
+            _get_snapshot_version_key(self.submission_id),
+            uuid4().hex,
+            timeout=SNAPSHOT_CACHE_TIMEOUT,
+        )
+        self.done = True
+
+
+def _has_pending_invalidation(submission_id: int) -> bool:
+    connection = transaction.get_connection(
+        router.db_for_write(SubmissionValueVariable)
+    )
+    if not connection.in_atomic_block:
+        return False
+    # Django discards the callbacks of transactions (and savepoints) that are rolled
+    # back
+    return any(
+        isinstance(func, _SnapshotVersionBump)
+        and func.submission_id == submission_id
+        and not func.done
+        for _, func, _ in connection.run_on_commit
+    )
+
+
+def invalidate_variables_snapshot(submission_id: int) -> None:
+    """
+    Invalidate the cached snapshot of the persisted variables of a submission.
+
+    A new version is set when the transaction is committed. Until then, the
+    transaction reads the variables from the database and doesn't cache them, as the
+    data is not visible to other requests (and may still be rolled back).
+    """
+    transaction.on_commit(
+        _SnapshotVersionBump(submission_id),
+        using=router.db_for_write(SubmissionValueVariable),
+    )
+
+
+def load_saved_variables(submission: Submission) -> list[SubmissionValueVariable]:
+    """
+    Load the persisted variables of a submission, using the cached snapshot if
+    possible.
+
+    The snapshot holds the raw column values of the variables, which saves the
+    (JSON) decoding of the values and component configurations on every request.
+    Variables that were prefetched (e.g. when exporting submissions in batches) are
+    used as-is.
+    """
+    if "submissionvaluevariable_set" in getattr(
+        submission, "_prefetched_objects_cache", {}
+    ):
+        return list(submission.submissionvaluevariable_set.all())
+
+    field_names = [
+        field.attname for field in SubmissionValueVariable._meta.concrete_fields
+    ]
+    rows: Sequence[tuple[Any, ...]] | None = None
+    snapshot_key = None
+    if not _has_pending_invalidation(submission.pk):
+        version_key = _get_snapshot_version_key(submission.pk)
+        if (version := cache.get(version_key)) is None:
+            version = uuid4().hex
+            # another process may have set the version in the meantime
+            if not cache.add(version_key, version, timeout=SNAPSHOT_CACHE_TIMEOUT):
+                version = cache.get(version_key, version)
+        snapshot_key = _get_snapshot_key(submission.pk, version)
+        rows = cache.get(snapshot_key)
+
+    if rows is None:
+        rows = list(
+            SubmissionValueVariable.objects.filter(submission=submission).values_list(
+                *field_names
+            )
+        )
+        if snapshot_key is not None:
+            cache.set(snapshot_key, rows, timeout=SNAPSHOT_CACHE_TIMEOUT)
+
+    db = router.db_for_read(SubmissionValueVariable)
+    variables = []
+    for row in rows:
+        variable = SubmissionValueVariable.from_db(db, field_names, row)
+        variable.submission = submission
+        variables.append(variable)
+    return variables
+
+
 @dataclass
 class SubmissionValueVariablesState:
     submission: Submission
@@ -211,7 +322,7 @@ class SubmissionValueVariablesState:
         # calls since we already have the relevant data
         all_submission_variables = {
             submission_value_variables.key: submission_value_variables
-            for submission_value_variables in self.submission.submissionvaluevariable_set.all()
+            for submission_value_variables in load_saved_variables(self.submission)
         }
         # do the join by `key`, which is unique across the form
         for variable_key, submission_value_variable in all_submission_variables.items():
@@ -349,6 +460,7 @@ class SubmissionValueVariablesState:
             variables_to_update, fields=["value", "source"]
         )
         SubmissionValueVariable.objects.bulk_create(variables_to_create)
+        invalidate_variables_snapshot(self.submission.pk)
 
     def set_values(self, data: FormioData) -> None:
         """
@@ -430,6 +542,7 @@ class SubmissionValueVariableManager(models.Manager):
         self.bulk_create(variables_to_create)
         self.bulk_update(variables_to_update, fields=["value"])
         self.filter(submission=submission, key__in=variables_keys_to_reset).delete()
+        invalidate_variables_snapshot(submission.pk)
 
         # Variables that are deleted are not automatically updated in the state
         # (i.e. they remain present with their pk), so we have to reset them manually.
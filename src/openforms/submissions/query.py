@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING, Self
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     Case,
     CharField,
@@ -18,11 +19,14 @@ from django.utils import timezone
 
 from openforms.config.models import GlobalConfiguration
 
-from .constants import RegistrationStatuses, Stages
+from .constants import RegistrationStatuses, Stages, SubmissionValueVariableSources
 
 if TYPE_CHECKING:
     from .models import Submission  # noqa
 
+# Number of submissions of which the sensitive data is removed in a single transaction.
+REMOVE_SENSITIVE_DATA_CHUNK_SIZE = 500
+
 
 class SubmissionQuerySet(models.QuerySet["Submission"]):
     if TYPE_CHECKING:
@@ -85,6 +89,81 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
         )
         return self.annotate(stage=stage_case_when)
 
+    def remove_sensitive_data(
+        self, chunk_size: int = REMOVE_SENSITIVE_DATA_CHUNK_SIZE
+    ) -> int:
+        """
+        Remove the sensitive data of the submissions in bulk.
+
+        This is the set-based equivalent of
+        :meth:`openforms.submissions.models.Submission.remove_sensitive_data`. The
+        submissions are processed in chunks, each chunk in its own transaction. Cleaned
+        submissions are excluded, so an interrupted run continues where it left off
+        when it is started again.
+
+        :returns: The number of submissions that were cleaned.
+        """
+        queryset = self.filter(_is_cleaned=False).order_by("pk")
+        amount = 0
+        while pks := list(queryset.values_list("pk", flat=True)[:chunk_size]):
+            with transaction.atomic():
+                _remove_sensitive_data(pks)
+            amount += len(pks)
+        return amount
+
+
+def _remove_sensitive_data(pks: list[int]) -> None:
+    from openforms.authentication.models import AuthInfo
+    from openforms.forms.models import FormVariable
+
+    from .models import (
+        Submission,
+        SubmissionFileAttachment,
+        SubmissionValueVariable,
+    )
+    from .models.submission_value_variable import invalidate_variables_snapshot
+
+    submissions = Submission.objects.filter(pk__in=pks).only(
+        "uuid", "form_id", "co_sign_data"
+    )
+    submissions_by_form: defaultdict[int, list[Submission]] = defaultdict(list)
+    for submission in submissions:
+        submissions_by_form[submission.form_id].append(submission)
+
+    sensitive_variable_keys: defaultdict[int, list[str]] = defaultdict(list)
+    for form_id, key in FormVariable.objects.filter(
+        form__in=submissions_by_form, is_sensitive_data=True
+    ).values_list("form_id", "key"):
+        sensitive_variable_keys[form_id].append(key)
+
+    AuthInfo.objects.filter(submission__in=pks).update(value="")
+
+    for form_id, form_submissions in submissions_by_form.items():
+        if not (keys := sensitive_variable_keys[form_id]):
+            continue
+        SubmissionValueVariable.objects.filter(
+            submission__in=form_submissions, key__in=keys
+        ).update(value="", source=SubmissionValueVariableSources.sensitive_data_cleaner)
+        for submission in form_submissions:
+            invalidate_variables_snapshot(submission.pk)
+        # deleting through the queryset still sends the post_delete signal that
+        # removes the files from the storage
+        SubmissionFileAttachment.objects.filter(
+            submission_step__submission__in=form_submissions,
+            submission_variable__key__in=keys,
+        ).delete()
+
+    # FIXME: this only deals with cosign v1 and not v2, see
+    # Submission.remove_sensitive_data
+    co_signed_submissions = [
+        submission for submission in submissions if submission.co_sign_data
+    ]
+    for submission in co_signed_submissions:
+        submission.co_sign_data.update({"identifier": "", "fields": {}})
+    Submission.objects.bulk_update(co_signed_submissions, ["co_sign_data"])
+
+    Submission.objects.filter(pk__in=pks).update(_is_cleaned=True)
+
 
 # Purely used for static type checking.
 class SubmissionsManagerType(models.Manager["Submission"]):
@@ -93,3 +172,6 @@ class SubmissionsManagerType(models.Manager["Submission"]):
     ) -> SubmissionQuerySet: ...
 
     def annotate_stage(self) -> SubmissionQuerySet: ...
+    def remove_sensitive_data(
+        self, chunk_size: int = REMOVE_SENSITIVE_DATA_CHUNK_SIZE
+    ) -> int: ...
@@ -1,6 +1,6 @@
 from django.db import transaction
 from django.db.models import F
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 import structlog
@@ -9,6 +9,10 @@ from openforms.submissions.models import (
     Submission,
     SubmissionFileAttachment,
     SubmissionReport,
+    SubmissionValueVariable,
+)
+from openforms.submissions.models.submission_value_variable import (
+    invalidate_variables_snapshot,
 )
 from openforms.utils.files import _delete_obj_files, get_file_field_names
 
@@ -71,6 +75,14 @@ def delete_obj_files(
         _delete_obj_files(file_field_names, instance)
 
 
+@receiver(post_save, sender=SubmissionValueVariable)
+def invalidate_submission_variables_snapshot(
+    sender: type[SubmissionValueVariable], instance: SubmissionValueVariable, **kwargs
+) -> None:
+    # Bulk operations don't send signals, those invalidate the snapshot explicitly.
+    invalidate_variables_snapshot(instance.submission_id)
+
+
 @receiver(post_delete, sender=SubmissionReport)
 def delete_submission_report_files(
     sender: type[SubmissionReport], instance: SubmissionReport, **kwargs
@@ -2,11 +2,13 @@
 Utility to interact with the celery task status.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from django.urls import reverse
 
 from celery import states
+from celery.backends.base import KeyValueStoreBackend
 from celery.result import AsyncResult
 from rest_framework.request import Request
 
@@ -17,6 +19,31 @@ from .models import Submission
 from .utils import add_submmission_to_session, get_report_download_url
 
 
+def get_task_states(results: list[AsyncResult]) -> list[str]:
+    """
+    Retrieve the states of the tasks, with a single lookup if the backend supports it.
+
+    Checking the ``state`` of each result performs a lookup in the result backend for
+    every task. Key-value store backends (like Redis) can look up the task meta of all
+    tasks at once instead.
+    """
+    if not results:
+        return []
+    backend = results[0].backend
+    if not isinstance(backend, KeyValueStoreBackend):
+        return [result.state for result in results]
+
+    keys = [backend.get_key_for_task(result.id) for result in results]
+    values = backend.mget(keys)
+    # depending on the client, a mapping of the found keys or a list is returned
+    if isinstance(values, Mapping):
+        values = [values.get(key) for key in keys]
+    return [
+        backend.decode_result(value)["status"] if value else states.PENDING
+        for value in values
+    ]
+
+
 @dataclass
 class SubmissionProcessingStatus:
     request: Request
@@ -24,7 +51,7 @@ class SubmissionProcessingStatus:
 
     def get_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for the task scheduled ONLY when the submission was completed."""
-        if not hasattr(self, "_async_result"):
+        if not hasattr(self, "_async_results"):
             task_ids = self.submission.post_completion_task_ids
             self._async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._async_results
@@ -48,12 +75,23 @@ class SubmissionProcessingStatus:
             self._all_async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._all_async_results
 
+    def get_task_states(self) -> list[str]:
+        """
+        Retrieve the states of the tasks scheduled when the submission was completed.
+
+        The states are looked up once per instance, create a new instance to check
+        the progress again.
+        """
+        if not hasattr(self, "_task_states"):
+            self._task_states = get_task_states(self.get_async_results())
+        return self._task_states
+
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any(result.state == states.FAILURE for result in results)
-        all_ready = all(result.state in states.READY_STATES for result in results)
-        if results and (any_failed or all_ready):
+        task_states = self.get_task_states()
+        any_failed = any(state == states.FAILURE for state in task_states)
+        all_ready = all(state in states.READY_STATES for state in task_states)
+        if task_states and (any_failed or all_ready):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -62,9 +100,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all(result.state == states.SUCCESS for result in results)
-        any_failed = any(result.state == states.FAILURE for result in results)
+        task_states = self.get_task_states()
+        all_success = all(state == states.SUCCESS for state in task_states)
+        any_failed = any(state == states.FAILURE for state in task_states)
 
         if all_success:
             return ProcessingResults.success
@@ -92,7 +92,9 @@ def send_confirmation_email(submission_id: int) -> None:
 @app.task(ignore_result=True)
 def send_email_cosigner(submission_id: int) -> None:
     submission = Submission.objects.get(id=submission_id)
-    audit_log = audit_logger.bind(submission_uuid=str(submission.uuid))
+    audit_log = audit_logger.bind(
+        submission_pk=submission.pk, submission_uuid=str(submission.uuid)
+    )
 
     with translation.override(submission.language_code):
         config = GlobalConfiguration.get_solo()
@@ -171,6 +173,7 @@ def send_email_cosigner(submission_id: int) -> None:
 def schedule_emails(submission_id: int) -> None:
     submission = Submission.objects.get(id=submission_id)
     audit_log = audit_logger.bind(
+        submission_pk=submission.pk,
         submission_uuid=str(submission.uuid),
         form_uuid=str(submission.form.uuid),
     )
@@ -0,0 +1,298 @@
+"""
+Benchmarks of the hot paths when filling out and completing a form.
+
+The benchmarks run on synthetic forms generated with the test factories, which scale
+the number of components, logic rules and service fetches with the requested size. Use
+the ``benchmark_hot_paths`` management command to run them.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import dataclass
+from io import BytesIO
+from typing import TypedDict
+
+from django.core.cache import cache
+
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.config.templatetags.theme import THEME_OVERRIDE_CONTEXT_VAR
+from openforms.formio.service import FormioData, build_serializer
+from openforms.formio.typing import Component
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import Form
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.forms.utils import export_form
+from openforms.utils.pdf import render_to_pdf
+from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
+
+from ..form_logic import check_submission_logic, evaluate_form_logic
+from ..models import Submission, SubmissionValueVariablesState
+from ..models.submission_value_variable import (
+    _get_snapshot_key,
+    _get_snapshot_version_key,
+)
+from ..report import Report
+from .factories import SubmissionFactory, SubmissionStepFactory
+
+# all service fetches are done against this API root, which must be stubbed
+SERVICE_API_ROOT = "https://benchmarks.example.com/api/"
+
+EDITGRID_DEPTH = 3
+EDITGRID_ITEMS = 2
+
+
+@dataclass
+class BenchmarkForm:
+    form: Form
+    submission: Submission
+    data: FormioData
+
+    def get_submission(self) -> Submission:
+        """
+        Load the submission from the database, without any of the state cached on the
+        instance.
+        """
+        return Submission.objects.select_related("form").get(pk=self.submission.pk)
+
+    def clear_cache(self) -> None:
+        """
+        Remove the cached variables snapshot of the submission.
+
+        The submission only exists in the (rolled back) benchmark transaction, so the
+        snapshot must not be left behind in the cache.
+        """
+        version_key = _get_snapshot_version_key(self.submission.pk)
+        keys = [version_key]
+        if (version := cache.get(version_key)) is not None:
+            keys.append(_get_snapshot_key(self.submission.pk, version))
+        cache.delete_many(keys)
+
+
+def _editgrid(level: int) -> tuple[Component, list[dict]]:
+    key = f"grid{level}"
+    components: list[Component] = [
+        {
+            "type": "textfield",
+            "key": f"{key}Text{i}",
+            "label": f"{key} text {i}",
+            "validate": {"required": True, "maxLength": 100},
+        }
+        for i in range(2)
+    ]
+    item = {f"{key}Text{i}": f"value {i}" for i in range(2)}
+    if level + 1 < EDITGRID_DEPTH:
+        nested, nested_value = _editgrid(level + 1)
+        components.append(nested)
+        item[nested["key"]] = nested_value
+
+    component: Component = {
+        "type": "editgrid",
+        "key": key,
+        "label": f"Repeating group {level}",
+        "groupLabel": "Item",
+        "components": components,
+    }
+    return component, [deepcopy(item) for _ in range(EDITGRID_ITEMS)]
+
+
+def create_benchmark_form(size: int) -> BenchmarkForm:
+    """
+    Create a form and submission scaled to ``size``.
+
+    The single step has ``size`` text fields and editgrids nested
+    :const:`EDITGRID_DEPTH` levels deep. There are ``size`` logic rules, alternating
+    between modifying a component and setting a user defined variable, and a service
+    fetch for every ten fields.
+    """
+    components: list[Component] = [
+        {
+            "type": "textfield",
+            "key": f"field{i}",
+            "label": f"Field {i}",
+            "validate": {"required": True, "maxLength": 100},
+        }
+        for i in range(size)
+    ]
+    data = {f"field{i}": f"value {i}" for i in range(size)}
+    editgrid, editgrid_value = _editgrid(0)
+    components.append(editgrid)
+    data[editgrid["key"]] = editgrid_value
+
+    form = FormFactory.create()
+    form_step = FormStepFactory.create(
+        form=form, form_definition__configuration={"components": components}
+    )
+
+    for i in range(size):
+        if i % 2 == 0:
+            FormLogicFactory.create(
+                form=form,
+                json_logic_trigger={"==": [{"var": f"field{i}"}, "hide"]},
+                actions=[
+                    {
+                        "component": f"field{(i + 1) % size}",
+                        "action": {
+                            "type": LogicActionTypes.property,
+                            "property": {"type": "bool", "value": "hidden"},
+                            "state": True,
+                        },
+                    }
+                ],
+            )
+        else:
+            FormVariableFactory.create(form=form, key=f"computed{i}", user_defined=True)
+            FormLogicFactory.create(
+                form=form,
+                json_logic_trigger={"!!": [{"var": f"field{i}"}]},
+                actions=[
+                    {
+                        "variable": f"computed{i}",
+                        "action": {
+                            "type": LogicActionTypes.variable,
+                            "value": {"cat": [{"var": f"field{i}"}, "!"]},
+                        },
+                    }
+                ],
+            )
+
+    service = ServiceFactory.create(
+        api_type=APITypes.orc,
+        api_root=SERVICE_API_ROOT,
+        auth_type=AuthTypes.no_auth,
+    )
+    for i in range(max(size // 10, 1)):
+        FormVariableFactory.create(
+            form=form,
+            key=f"fetched{i}",
+            user_defined=True,
+            service_fetch_configuration=ServiceFetchConfigurationFactory.create(
+                service=service, path=f"items/{i}"
+            ),
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"!!": [{"var": f"field{i}"}]},
+            actions=[
+                {
+                    "variable": f"fetched{i}",
+                    "action": {
+                        "type": LogicActionTypes.fetch_from_service,
+                        "value": "",
+                    },
+                }
+            ],
+        )
+    form.apply_logic_analysis()
+
+    submission = SubmissionFactory.create(form=form)
+    SubmissionStepFactory.create(submission=submission, form_step=form_step, data=data)
+    return BenchmarkForm(form=form, submission=submission, data=FormioData(data))
+
+
+# A benchmark does the preparation that should not be measured and returns the
+# callable to time.
+type Benchmark = Callable[[BenchmarkForm], Callable[[], object]]
+
+
+def bench_evaluate_form_logic(benchmark_form: BenchmarkForm):
+    submission = benchmark_form.get_submission()
+    step = submission.submissionstep_set.get()
+    data = FormioData(deepcopy(benchmark_form.data.data))
+    return lambda: evaluate_form_logic(submission, step, data)
+
+
+def bench_check_submission_logic(benchmark_form: BenchmarkForm):
+    submission = benchmark_form.get_submission()
+    return lambda: check_submission_logic(submission)
+
+
+def bench_step_data_validation(benchmark_form: BenchmarkForm):
+    submission = benchmark_form.get_submission()
+    configuration = deepcopy(
+        submission.form.formstep_set.get().form_definition.configuration
+    )
+    data = deepcopy(benchmark_form.data.data)
+
+    def validate():
+        serializer = build_serializer(
+            configuration["components"],
+            data=data,
+            context={"submission": submission, "configuration": configuration},
+        )
+        serializer.is_valid(raise_exception=True)
+
+    return validate
+
+
+def bench_collect_variables(benchmark_form: BenchmarkForm):
+    submission = benchmark_form.get_submission()
+    submission.load_execution_state()
+    return lambda: SubmissionValueVariablesState(submission).collect_variables()
+
+
+def bench_render_pdf(benchmark_form: BenchmarkForm):
+    submission = benchmark_form.get_submission()
+    # like SubmissionReport.generate_submission_report_pdf, without storing the file
+    return lambda: render_to_pdf(
+        "report/submission_report.html",
+        context={
+            "report": Report(submission),
+            THEME_OVERRIDE_CONTEXT_VAR: submission.form.theme,
+        },
+    )
+
+
+def bench_export_form(benchmark_form: BenchmarkForm):
+    return lambda: export_form(benchmark_form.form.pk, response=BytesIO())
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "evaluate_form_logic": bench_evaluate_form_logic,
+    "check_submission_logic": bench_check_submission_logic,
+    "step_data_validation": bench_step_data_validation,
+    "collect_variables": bench_collect_variables,
+    "render_pdf": bench_render_pdf,
+    "export_form": bench_export_form,
+}
+
+
+class BenchmarkResult(TypedDict):
+    benchmark: str
+    size: int
+    timings: list[float]
+    min: float
+    median: float
+    mean: float
+
+
+def run_benchmark(
+    name: str, benchmark_form: BenchmarkForm, size: int, repeat: int
+) -> BenchmarkResult:
+    """
+    Time the benchmark ``repeat`` times, in seconds.
+    """
+    benchmark = BENCHMARKS[name]
+    timings: list[float] = []
+    for _ in range(repeat):
+        fn = benchmark(benchmark_form)
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "benchmark": name,
+        "size": size,
+        "timings": timings,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+    }
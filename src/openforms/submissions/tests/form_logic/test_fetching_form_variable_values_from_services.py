@@ -1,7 +1,9 @@
 from typing import Any
 from unittest import skip
+from unittest.mock import call, patch
 from urllib.parse import unquote
 
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation
 from django.test import SimpleTestCase, tag
 
@@ -19,7 +21,7 @@ from openforms.variables.models import _convert_to_string
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 from openforms.variables.validators import HeaderValidator, ValidationError
 
-from ...logic.service_fetching import perform_service_fetch
+from ...logic.service_fetching import get_cache_key, perform_service_fetch
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept",
@@ -426,6 +428,44 @@ class ServiceFetchConfigVariableBindingTests(DisableNLXRewritingMixin, SimpleTes
 
         self.assertEqual(value, "https://httpbin.org/get")
 
+    @requests_mock.Mocker()
+    def test_it_caches_responses_for_the_submission(self, m):
+        self.addCleanup(cache.clear)
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service,
+                path="get",
+                data_mapping_type=DataMappingTypes.jq,
+                mapping_expression=".url",
+            )
+        )
+
+        with patch(
+            "openforms.submissions.logic.service_fetching.service_fetch_cache_lookups"
+        ) as mock_counter:
+            result1 = perform_service_fetch(var, FormioData(), submission_uuid="1234")
+            result2 = perform_service_fetch(var, FormioData(), submission_uuid="1234")
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(result1.value, "https://httpbin.org/get")
+        self.assertEqual(result2.value, "https://httpbin.org/get")
+        mock_counter.add.assert_has_calls(
+            [call(1, attributes={"type": "miss"}), call(1, attributes={"type": "hit"})]
+        )
+
+    def test_cache_key_is_stable(self):
+        # must be the same across processes, so this can't use the builtin hash()
+        key1 = get_cache_key(
+            "1234", {"method": "GET", "url": "https://httpbin.org/get"}
+        )
+        key2 = get_cache_key(
+            "1234", {"url": "https://httpbin.org/get", "method": "GET"}
+        )
+
+        self.assertEqual(key1, key2)
+        self.assertEqual(key1, "service-fetch:1234:1d0d5ce189f4bac355bc3c0a55860ac5")
+
     def test_it_raises_value_errors(self):
         var = FormVariableFactory.build()
 
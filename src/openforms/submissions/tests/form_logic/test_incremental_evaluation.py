@@ -0,0 +1,181 @@
+from unittest.mock import ANY, patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.forms.models import FormLogic
+from openforms.forms.tests.factories import FormLogicFactory, FormVariableFactory
+from openforms.variables.constants import FormVariableDataTypes
+
+from ..factories import SubmissionFactory
+from ..mixins import SubmissionsMixin
+
+
+@override_settings(LOGIC_CHECK_INCREMENTAL_EVALUATION=True)
+class IncrementalLogicEvaluationTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+        self.submission = SubmissionFactory.from_components(
+            components_list=[
+                {"type": "number", "key": "age", "label": "Age"},
+                {"type": "textfield", "key": "name", "label": "Name"},
+                {"type": "textfield", "key": "category", "label": "Category"},
+                {"type": "textfield", "key": "greeting", "label": "Greeting"},
+            ]
+        )
+        form = self.submission.form
+        FormVariableFactory.create(
+            form=form,
+            user_defined=True,
+            key="isAdult",
+            data_type=FormVariableDataTypes.boolean,
+            initial_value=False,
+        )
+        self.age_rule = FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">=": [{"var": "age"}, 18]},
+            actions=[
+                {
+                    "variable": "isAdult",
+                    "action": {"type": "variable", "value": True},
+                }
+            ],
+        )
+        self.category_rule = FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"var": "isAdult"},
+            actions=[
+                {
+                    "variable": "category",
+                    "action": {"type": "variable", "value": "adult"},
+                }
+            ],
+        )
+        self.name_rule = FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"!!": [{"var": "name"}]},
+            actions=[
+                {
+                    "variable": "greeting",
+                    "action": {
+                        "type": "variable",
+                        "value": {"cat": ["Hello ", {"var": "name"}]},
+                    },
+                }
+            ],
+        )
+        form.apply_logic_analysis()
+
+        self.endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": self.submission.uuid,
+                "step_uuid": form.formstep_set.get().uuid,
+            },
+        )
+        self._add_submission_to_session(self.submission)
+
+    def _check_logic(self, data: dict) -> tuple[dict, list]:
+        evaluated_triggers = []
+        compiled_trigger = FormLogic.compiled_trigger
+
+        def _spy_compiled_trigger(rule: FormLogic):
+            program = compiled_trigger.fget(rule)
+
+            def _evaluate(data):
+                evaluated_triggers.append(rule.json_logic_trigger)
+                return program(data)
+
+            return _evaluate
+
+        with patch.object(
+            FormLogic, "compiled_trigger", property(_spy_compiled_trigger)
+        ):
+            response = self.client.post(self.endpoint, data={"data": data})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["step"]["data"], evaluated_triggers
+
+    def test_unchanged_inputs_reuse_outcome(self):
+        data = {"age": 20, "name": "John", "category": "", "greeting": ""}
+
+        first_result, first_evaluated = self._check_logic(data)
+        second_result, second_evaluated = self._check_logic(data)
+
+        self.assertEqual(first_result, {"category": "adult", "greeting": "Hello John"})
+        self.assertEqual(second_result, first_result)
+        self.assertEqual(len(first_evaluated), 3)
+        self.assertEqual(second_evaluated, [])
+
+    def test_changed_inputs_evaluate_dependent_rules(self):
+        self._check_logic({"age": 20, "name": "John", "category": "", "greeting": ""})
+
+        result, evaluated = self._check_logic(
+            {"age": 20, "name": "Jane", "category": "", "greeting": ""}
+        )
+
+        self.assertEqual(result, {"category": "adult", "greeting": "Hello Jane"})
+        self.assertEqual(evaluated, [self.name_rule.json_logic_trigger])
+
+    def test_changes_propagate_through_rule_outputs(self):
+        self._check_logic({"age": 12, "name": "John", "category": "", "greeting": ""})
+
+        result, evaluated = self._check_logic(
+            {"age": 20, "name": "John", "category": "", "greeting": ""}
+        )
+
+        self.assertEqual(result, {"category": "adult", "greeting": "Hello John"})
+        self.assertEqual(
+            evaluated,
+            [
+                self.age_rule.json_logic_trigger,
+                self.category_rule.json_logic_trigger,
+            ],
+        )
+
+    @override_settings(LOGIC_CHECK_INCREMENTAL_EVALUATION=False)
+    def test_disabled_incremental_evaluation(self):
+        data = {"age": 20, "name": "John", "category": "", "greeting": ""}
+        self._check_logic(data)
+
+        _, evaluated = self._check_logic(data)
+
+        self.assertEqual(len(evaluated), 3)
+
+    def test_rule_with_invalid_expression_is_always_evaluated(self):
+        form = self.submission.form
+        invalid_rule = FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"invalid_op": [{"var": "age"}]},
+            actions=[
+                {
+                    "variable": "category",
+                    "action": {"type": "variable", "value": "invalid"},
+                }
+            ],
+        )
+        # the logic analysis can't process the invalid expression
+        invalid_rule.form_steps.add(form.formstep_set.get())
+        data = {"age": 20, "name": "John", "category": "", "greeting": ""}
+
+        with patch("openforms.submissions.logic.log_utils.logger") as mock_logger:
+            first_result, first_evaluated = self._check_logic(data)
+            second_result, second_evaluated = self._check_logic(data)
+
+        self.assertEqual(first_result, {"category": "adult", "greeting": "Hello John"})
+        self.assertEqual(second_result, first_result)
+        self.assertEqual(len(first_evaluated), 4)
+        self.assertEqual(second_evaluated, [invalid_rule.json_logic_trigger])
+        mock_error = mock_logger.bind.return_value.error
+        self.assertEqual(mock_error.call_count, 2)
+        mock_error.assert_called_with(
+            "submissions.logic_rule_evaluation_failure",
+            logic=invalid_rule.json_logic_trigger,
+            exc_info=ANY,
+        )
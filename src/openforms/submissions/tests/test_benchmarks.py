@@ -0,0 +1,84 @@
+import json
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ..models import Submission
+
+
+class BenchmarkHotPathsCommandTests(TestCase):
+    def test_results_are_output_as_json(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_hot_paths",
+            "--sizes",
+            "2",
+            "4",
+            "--repeat",
+            "2",
+            "--benchmark",
+            "evaluate_form_logic",
+            "--benchmark",
+            "check_submission_logic",
+            "--benchmark",
+            "step_data_validation",
+            "--benchmark",
+            "collect_variables",
+            "--benchmark",
+            "export_form",
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report["repeat"], 2)
+        self.assertEqual(
+            [(result["benchmark"], result["size"]) for result in report["results"]],
+            [
+                ("evaluate_form_logic", 2),
+                ("check_submission_logic", 2),
+                ("step_data_validation", 2),
+                ("collect_variables", 2),
+                ("export_form", 2),
+                ("evaluate_form_logic", 4),
+                ("check_submission_logic", 4),
+                ("step_data_validation", 4),
+                ("collect_variables", 4),
+                ("export_form", 4),
+            ],
+        )
+        for result in report["results"]:
+            with self.subTest(benchmark=result["benchmark"], size=result["size"]):
+                self.assertEqual(len(result["timings"]), 2)
+                self.assertLessEqual(result["min"], result["median"])
+
+    def test_synthetic_data_is_not_kept(self):
+        call_command(
+            "benchmark_hot_paths",
+            "--sizes",
+            "2",
+            "--repeat",
+            "1",
+            "--benchmark",
+            "evaluate_form_logic",
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+
+        self.assertFalse(Submission.objects.exists())
+
+    def test_unknown_benchmark(self):
+        with self.assertRaisesMessage(CommandError, "Unknown benchmark(s): foo."):
+            call_command(
+                "benchmark_hot_paths",
+                "--benchmark",
+                "evaluate_form_logic",
+                "--benchmark",
+                "foo",
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+        self.assertFalse(Submission.objects.exists())
@@ -9,7 +9,12 @@ from privates.test import temp_private_root
 from openforms.formio.tests.factories import SubmittedFileFactory
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    create_submission_export,
+    export_submissions,
+    iter_submission_export_rows,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -406,3 +411,77 @@ class ExportTests(TestCase):
         self.assertEqual(len(dataset), 2)
         self.assertEqual(len(dataset[0]), 3)
         self.assertEqual(len(dataset[1]), 3)
+
+    def test_submissions_are_fetched_in_batches(self):
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "textfield",
+                        "key": "fullName",
+                        "label": "Full name",
+                    }
+                ]
+            },
+        )
+        for name in ("Arie", "Bert", "Carla"):
+            SubmissionStepFactory.create(
+                submission__form=form,
+                submission__completed=True,
+                form_step=form.formstep_set.get(),
+                data={"fullName": name},
+            )
+
+        with self.assertNumQueries(3 + 3 * 3):
+            # 1 for the submissions, 1 for the submission steps and 1 for the saved
+            # variables + the form steps, logic rules and form variables for every
+            # submission, as rendering mutates the form definition configurations
+            rows = list(iter_submission_export_rows(Submission.objects.order_by("pk")))
+
+        self.assertEqual(rows[0][2:], ["fullName"])
+        self.assertEqual([row[2] for row in rows[1:]], ["Arie", "Bert", "Carla"])
+
+    @freeze_time("2022-05-09T13:00:00Z")
+    def test_streamed_export_matches_dataset_export(self):
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "textfield",
+                        "key": "fullName",
+                        "label": "Full name",
+                    },
+                    {
+                        "type": "textfield",
+                        "key": "nicknames",
+                        "label": "Nicknames",
+                        "multiple": True,
+                    },
+                ]
+            },
+        )
+        for data in (
+            {"fullName": "Arie Kabaalstra", "nicknames": ["Arie", "A"]},
+            {"fullName": "Herman Brood", "nicknames": []},
+        ):
+            SubmissionStepFactory.create(
+                submission__form=form,
+                submission__completed=True,
+                submission__completed_on=timezone.now(),
+                form_step=form.formstep_set.get(),
+                data=data,
+            )
+        queryset = Submission.objects.order_by("pk")
+        dataset = create_submission_export(queryset)
+
+        for file_type in (ExportFileTypes.CSV, ExportFileTypes.JSON):
+            with self.subTest(file_type=file_type.extension):
+                response = export_submissions(queryset, file_type)
+
+                self.assertTrue(response.streaming)
+                self.assertEqual(
+                    response.getvalue().decode("utf-8"),
+                    dataset.export(file_type.extension),
+                )
@@ -171,6 +171,104 @@ class SubmissionTests(TestCase):
             },
         )
 
+    def test_bulk_remove_sensitive_data(self):
+        form_1, form_2 = FormFactory.create_batch(2)
+        form_steps = {
+            form: FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [
+                        {
+                            "type": "textfield",
+                            "key": "sensitive",
+                            "label": "Sensitive",
+                            "isSensitiveData": True,
+                        },
+                        {
+                            "type": "file",
+                            "key": "sensitiveFile",
+                            "label": "Sensitive file",
+                            "file": {"type": []},
+                            "filePattern": "",
+                            "isSensitiveData": True,
+                        },
+                        {
+                            "type": "textfield",
+                            "key": "notSensitive",
+                            "label": "Not sensitive",
+                        },
+                    ]
+                },
+            )
+            for form in (form_1, form_2)
+        }
+
+        def create_submission(form, data, **kwargs):
+            submission = SubmissionFactory.create(form=form, **kwargs)
+            SubmissionStepFactory.create(
+                submission=submission, form_step=form_steps[form], data=data
+            )
+            return submission
+
+        submissions = [
+            create_submission(
+                form,
+                {"sensitive": "secret", "notSensitive": "public"},
+                auth_info__value="999990676",
+            )
+            for form in (form_1, form_2, form_1)
+        ]
+        co_signed = create_submission(
+            form_2,
+            {"sensitive": "secret"},
+            co_sign_data={
+                "version": "v1",
+                "plugin": "digid",
+                "identifier": "123456782",
+                "representation": "T. Hulk",
+                "co_sign_auth_attribute": "bsn",
+                "fields": {"firstName": "The"},
+            },
+        )
+        attachment = SubmissionFileAttachmentFactory.create(
+            submission_step=submissions[1].steps[0],
+            submission_variable__key="sensitiveFile",
+        )
+        already_cleaned = create_submission(
+            form_1, {"sensitive": "secret"}, _is_cleaned=True
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            amount = Submission.objects.remove_sensitive_data(chunk_size=3)
+
+        self.assertEqual(amount, 4)
+        for submission in [*submissions, co_signed]:
+            with self.subTest(submission=submission):
+                submission.refresh_from_db()
+                self.assertTrue(submission._is_cleaned)
+                data = dict(
+                    SubmissionValueVariable.objects.filter(
+                        submission=submission
+                    ).values_list("key", "value")
+                )
+                self.assertEqual(data["sensitive"], "")
+                if submission != co_signed:
+                    self.assertEqual(data["notSensitive"], "public")
+                    self.assertEqual(submission.auth_info.value, "")
+        self.assertEqual(co_signed.co_sign_data["identifier"], "")
+        self.assertEqual(co_signed.co_sign_data["fields"], {})
+        self.assertEqual(co_signed.co_sign_data["representation"], "T. Hulk")
+        self.assertFalse(
+            SubmissionFileAttachment.objects.filter(pk=attachment.pk).exists()
+        )
+        self.assertFalse(attachment.content.storage.exists(attachment.content.name))
+        self.assertEqual(
+            SubmissionValueVariable.objects.get(
+                submission=already_cleaned, key="sensitive"
+            ).value,
+            "secret",
+        )
+
     def test_submission_delete_file_uploads_cascade(self):
         """
         Assert that when a submission is deleted, the file uploads (on disk!) are deleted.
@@ -23,6 +23,7 @@ from openforms.authentication.service import FORM_AUTH_SESSION_KEY, AuthAttribut
 from openforms.config.models import GlobalConfiguration
 from openforms.formio.constants import DataSrcOptions
 from openforms.forms.constants import StatementCheckboxChoices, SubmissionAllowedChoices
+from openforms.forms.models import SubmissionStatisticsRecord
 from openforms.forms.tests.factories import (
     FormFactory,
     FormLogicFactory,
@@ -30,6 +31,7 @@ from openforms.forms.tests.factories import (
     FormStepFactory,
     FormVariableFactory,
 )
+from openforms.logging.constants import FORM_SUBMIT_SUCCESS_EVENT
 from openforms.logging.models import TimelineLogProxy
 from openforms.registrations.base import BasePlugin
 from openforms.registrations.registry import Registry
@@ -150,6 +152,10 @@ class SubmissionCompletionTests(SubmissionsMixin, APITestCase):
         submission.refresh_from_db()
         self.assertEqual(submission.completed_on, timezone.now())
         self.assertTrue(submission.privacy_policy_accepted)
+        statistics_record = SubmissionStatisticsRecord.objects.get()
+        self.assertEqual(statistics_record.event, FORM_SUBMIT_SUCCESS_EVENT)
+        self.assertEqual(statistics_record.form, form)
+        self.assertEqual(statistics_record.timestamp, submission.completed_on)
 
         # test that submission ID removed from session
         submissions_in_session = response.wsgi_request.session[SUBMISSIONS_SESSION_KEY]
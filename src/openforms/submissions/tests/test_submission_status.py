@@ -2,10 +2,12 @@ from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
-from django.test import TestCase, tag
+from django.test import SimpleTestCase, TestCase, tag
 from django.utils import timezone
 
 from celery import states
+from celery.backends.cache import CacheBackend
+from celery.result import AsyncResult
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from rest_framework import status
@@ -13,6 +15,7 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from openforms.appointments.tests.factories import AppointmentInfoFactory
+from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.config.tests.factories import ThemeFactory
 from openforms.frontend import get_frontend_redirect_url
@@ -28,6 +31,7 @@ from ..constants import (
     ProcessingResults,
     ProcessingStatuses,
 )
+from ..status import get_task_states
 from ..tasks import cleanup_on_completion_results
 from ..tokens import submission_status_token_generator
 from .factories import (
@@ -692,3 +696,31 @@ class CleanupTaskTests(TestCase):
         cleanup_on_completion_results()
 
         self.assertEqual(0, mock_forget.call_count)
+
+
+class TaskStatesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.backend = CacheBackend(app=app, backend="memory")
+
+    def test_states_are_looked_up_at_once(self):
+        self.backend.store_result("task-1", None, states.SUCCESS)
+        self.backend.store_result("task-2", None, states.STARTED)
+        results = [
+            AsyncResult(task_id, backend=self.backend)
+            for task_id in ("task-1", "task-2", "task-3")
+        ]
+
+        with (
+            patch.object(self.backend, "mget", wraps=self.backend.mget) as mock_mget,
+            patch.object(self.backend, "get") as mock_get,
+        ):
+            task_states = get_task_states(results)
+
+        self.assertEqual(task_states, [states.SUCCESS, states.STARTED, states.PENDING])
+        mock_mget.assert_called_once()
+        mock_get.assert_not_called()
+
+    def test_no_results(self):
+        self.assertEqual(get_task_states([]), [])
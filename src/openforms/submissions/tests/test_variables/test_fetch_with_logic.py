@@ -1,4 +1,8 @@
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 import requests_mock
 from freezegun import freeze_time
@@ -15,6 +19,8 @@ from openforms.variables.constants import DataMappingTypes
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 
 from ...form_logic import evaluate_form_logic
+from ...logic.rules import get_rules_to_evaluate, iter_evaluate_rules
+from ...logic.service_fetching import prefetch_service_values
 from ..factories import SubmissionFactory
 
 
@@ -167,8 +173,11 @@ class ServiceFetchWithActionsTest(TestCase):
         )
 
         self.assertEqual(len(m.request_history), 2)
-        self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get?fieldC=42")
-        self.assertEqual(m.request_history[-2].url, "https://httpbin.org/get")
+        # independent fetches are performed concurrently
+        self.assertEqual(
+            {request.url for request in m.request_history},
+            {"https://httpbin.org/get", "https://httpbin.org/get?fieldC=42"},
+        )
 
         evaluate_form_logic(
             submission,
@@ -260,3 +269,111 @@ class ServiceFetchWithActionsTest(TestCase):
         variables_data = submission.variables_state.get_data(include_unsaved=True)
 
         self.assertEqual(variables_data, {"someVariable": ""})
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_independent_requests_are_prefetched(self, m):
+        submission = SubmissionFactory.from_components([])
+        variables = {}
+        for key, query_params in (
+            ("first", {}),
+            ("second", {"q": ["second"]}),
+            # depends on the outcome of the first fetch
+            ("dependent", {"q": ["{{ first }}"]}),
+        ):
+            variables[key] = FormVariableFactory.create(
+                key=key,
+                form=submission.form,
+                service_fetch_configuration=ServiceFetchConfigurationFactory.create(
+                    service=self.service, path="get", query_params=query_params
+                ),
+            )
+            FormLogicFactory.create(
+                form=submission.form,
+                json_logic_trigger=True,
+                actions=[
+                    {
+                        "variable": key,
+                        "action": {
+                            "name": "Fetch some field from some server",
+                            "type": LogicActionTypes.fetch_from_service,
+                        },
+                    }
+                ],
+            )
+        submission.form.apply_logic_analysis()
+        m.get("https://httpbin.org/get", json="fetched")
+
+        with patch(
+            "openforms.submissions.logic.rules.prefetch_service_values",
+            wraps=prefetch_service_values,
+        ) as mock_prefetch:
+            evaluate_form_logic(submission, submission.submissionstep_set.first())
+
+        mock_prefetch.assert_called_once()
+        prefetched_variables = [var for var, _ in mock_prefetch.call_args.args[0]]
+        self.assertEqual(
+            prefetched_variables, [variables["first"], variables["second"]]
+        )
+        self.assertEqual(len(m.request_history), 3)
+        self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get?q=fetched")
+        self.assertEqual(
+            submission.variables_state.get_data(include_unsaved=True).data,
+            {"first": "fetched", "second": "fetched", "dependent": "fetched"},
+        )
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_fetch_variables_are_loaded_once(self, m):
+        submission = SubmissionFactory.from_components([])
+        for key in ("first", "second", "third"):
+            FormVariableFactory.create(
+                key=key,
+                form=submission.form,
+                service_fetch_configuration=ServiceFetchConfigurationFactory.create(
+                    service=self.service, path="get", query_params={"q": [key]}
+                ),
+            )
+            FormLogicFactory.create(
+                form=submission.form,
+                json_logic_trigger=True,
+                actions=[
+                    {
+                        "variable": key,
+                        "action": {
+                            "name": "Fetch some field from some server",
+                            "type": LogicActionTypes.fetch_from_service,
+                        },
+                    }
+                ],
+            )
+        submission.form.apply_logic_analysis()
+        m.get("https://httpbin.org/get", json="fetched")
+        # responses are cached after the first evaluation
+        evaluate_form_logic(submission, submission.submissionstep_set.first())
+        self.assertEqual(len(m.request_history), 3)
+
+        step = submission.submissionstep_set.get()
+        rules = list(get_rules_to_evaluate(submission, step))
+        data = FormioData({})
+        configuration = step.form_step.form_definition.configuration_wrapper
+
+        with CaptureQueriesContext(connection) as ctx:
+            list(
+                iter_evaluate_rules(
+                    rules,
+                    data,
+                    data_for_visible_state=FormioData({}),
+                    configuration=configuration,
+                    submission=submission,
+                )
+            )
+
+        fetch_config_queries = [
+            query
+            for query in ctx.captured_queries
+            if '"variables_servicefetchconfiguration"' in query["sql"]
+        ]
+        self.assertEqual(len(fetch_config_queries), 1)
+        self.assertEqual(len(m.request_history), 3)
+        self.assertEqual(
+            data.data, {"first": "fetched", "second": "fetched", "third": "fetched"}
+        )
@@ -1,3 +1,5 @@
+from django.db import transaction
+
 from rest_framework.test import APITestCase
 
 from openforms.formio.datastructures import FormioData
@@ -20,6 +22,10 @@ from ...models.submission_value_variable import (
 from ...rendering import Renderer, RenderModes
 
 
+class _Rollback(Exception):
+    pass
+
+
 class SubmissionVariablesPerformanceTests(APITestCase):
     def test_evaluate_form_logic_without_rules(self):
         form = FormFactory.create()
@@ -362,6 +368,65 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         with self.assertNumQueries(2):
             SubmissionValueVariablesState(submission).variables
 
+    def test_get_variables_state_from_snapshot(self):
+        # the snapshot is invalidated when the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            submission = SubmissionFactory.from_components(
+                [
+                    {"key": "var1", "type": "textfield", "label": "var1"},
+                    {"key": "var2", "type": "textfield", "label": "var2"},
+                ],
+                submitted_data={"var1": "test1"},
+            )
+        # typically done in the viewset before the data is accessed
+        submission.load_execution_state()
+        SubmissionValueVariablesState(submission).variables
+
+        # 1. Get the form variables, the submission variables are in the snapshot
+        with self.assertNumQueries(1):
+            variables = SubmissionValueVariablesState(submission).variables
+
+        self.assertEqual(variables["var1"].value, "test1")
+        self.assertIsNotNone(variables["var1"].pk)
+        self.assertIsNone(variables["var2"].pk)
+
+        with self.subTest("saving data invalidates the snapshot"):
+            SubmissionValueVariable.objects.bulk_create_or_update_from_data(
+                FormioData({"var1": "updated", "var2": "test2"}), submission
+            )
+
+            variables = SubmissionValueVariablesState(submission).variables
+
+            self.assertEqual(variables["var1"].value, "updated")
+            self.assertEqual(variables["var2"].value, "test2")
+            self.assertIsNotNone(variables["var2"].pk)
+
+    def test_uncommitted_variables_are_not_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            submission = SubmissionFactory.from_components(
+                [{"key": "var1", "type": "textfield", "label": "var1"}],
+                submitted_data={"var1": "test1"},
+            )
+        SubmissionValueVariablesState(submission).variables
+
+        with self.assertRaises(_Rollback):
+            with transaction.atomic():
+                SubmissionValueVariable.objects.bulk_create_or_update_from_data(
+                    FormioData({"var1": "rolled back"}), submission
+                )
+                # the uncommitted data is read from the database, every time
+                for _ in range(2):
+                    with self.assertNumQueries(2):
+                        variables = SubmissionValueVariablesState(submission).variables
+                    self.assertEqual(variables["var1"].value, "rolled back")
+
+                raise _Rollback
+
+        with self.assertNumQueries(1):
+            variables = SubmissionValueVariablesState(submission).variables
+
+        self.assertEqual(variables["var1"].value, "test1")
+
     def test_value_variables_state_get_data(self):
         form = FormFactory.create()
         form_step1 = FormStepFactory.create(
@@ -43,6 +43,7 @@ from .models import (
     SubmissionReport,
     SubmissionValueVariable,
 )
+from .models.submission_value_variable import invalidate_variables_snapshot
 from .tokens import submission_report_token_generator
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -161,7 +162,9 @@ def remove_submission_from_session(
 
 
 def send_confirmation_email(submission: Submission) -> None:
-    audit_log = audit_logger.bind(submission_uuid=str(submission.uuid))
+    audit_log = audit_logger.bind(
+        submission_pk=submission.pk, submission_uuid=str(submission.uuid)
+    )
     audit_log.info("confirmation_email_start")
 
     subject_template, content_template = get_confirmation_email_templates(submission)
@@ -243,6 +246,7 @@ def initialise_user_defined_variables(submission: Submission):
             if not variable.pk
         ]
     )
+    invalidate_variables_snapshot(submission.pk)
 
 
 def persist_user_defined_variables(submission: Submission) -> None:
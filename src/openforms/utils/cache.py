@@ -1,8 +1,29 @@
+import hashlib
+import json
 import threading
 
 from django.core import signals
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def get_digest(value: object, *, sort_keys: bool = True) -> str:
+    """
+    Compute a digest of a JSON serializable value, for use in cache keys.
+
+    The digest is the same in every process (web and celery workers alike), unlike the
+    builtin :func:`hash`, which is salted per interpreter. It is not suitable for
+    security purposes.
+
+    :param value: The value to digest, serialized with the
+      :class:`~django.core.serializers.json.DjangoJSONEncoder`.
+    :param sort_keys: Sort the keys of mappings, so that the order in which they were
+      inserted doesn't affect the digest.
+    :raises TypeError: if the value is not JSON serializable.
+    """
+    serialized = json.dumps(value, cls=DjangoJSONEncoder, sort_keys=sort_keys)
+    return hashlib.md5(serialized.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 class RequestProxyCache(BaseCache):
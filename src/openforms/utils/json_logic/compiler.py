@@ -0,0 +1,140 @@
+"""
+Compile JSON logic expressions into reusable Python callables.
+
+:func:`json_logic.jsonLogic` interprets the raw expression on every call - it has to
+destructure every (nested) operation, look up the operator and check whether it's a
+scoped operation before it can do any actual work. For expressions that are evaluated
+over and over again (like the triggers of logic rules), we do this work only once by
+turning the expression tree into a tree of closures.
+
+The compiled programs have the exact same semantics as :func:`json_logic.jsonLogic`
+(in non-permissive mode). Anything we don't (fully) understand is delegated to the
+interpreter.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from functools import lru_cache, partial
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+    scoped_operations,
+)
+from json_logic.typing import JSON
+
+__all__ = ["compile_json_logic", "CompiledExpression"]
+
+type CompiledExpression = Callable[[JSON], JSON]
+"""
+Callable taking the evaluation context (data) and returning the expression result.
+"""
+
+# Every rule in every form has a trigger (and possibly some variable actions), this
+# comfortably holds the expressions of the popular forms in a worker process.
+CACHE_SIZE = 2048
+
+
+def compile_json_logic(
+    expression: JSON, *, use_var_undefined: bool = False
+) -> CompiledExpression:
+    """
+    Compile the expression, or obtain the earlier compiled program from the cache.
+
+    The cache is keyed on the (serialized) expression itself, so modifying an
+    expression (e.g. by editing and saving the logic rules of a form) automatically
+    results in a new program.
+
+    :param expression: The JSON logic expression.
+    :param use_var_undefined: See :func:`json_logic.jsonLogic`.
+    """
+    try:
+        serialized = json.dumps(expression)
+    except TypeError:
+        # not JSON serializable, e.g. when python date objects are part of the
+        # expression - we can't cache those
+        return partial(_interpret, expression, use_var_undefined=use_var_undefined)
+    return _compile_cached(serialized, use_var_undefined)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_cached(serialized: str, use_var_undefined: bool) -> CompiledExpression:
+    # loading the expression again guarantees that the compiled program does not share
+    # any (mutable) data with the caller
+    return _compile(json.loads(serialized), use_var_undefined)
+
+
+def _interpret(expression: JSON, data: JSON, *, use_var_undefined: bool) -> JSON:
+    return jsonLogic(expression, data, use_var_undefined=use_var_undefined)
+
+
+def _compile(expression: JSON, use_var_undefined: bool) -> CompiledExpression:
+    if isinstance(expression, list):
+        items = [_compile(item, use_var_undefined) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator_keys = [key for key in expression if not key.startswith("_")]
+    # invalid expression, let the interpreter raise the appropriate error when it's
+    # evaluated
+    if len(operator_keys) != 1:
+        return partial(_interpret, expression, use_var_undefined=use_var_undefined)
+
+    operator = operator_keys[0]
+    values = expression[operator]
+    # Easy syntax for unary operators, like {"var": "x"} instead of strict
+    # {"var": ["x"]}
+    if not isinstance(values, list | tuple):
+        values = [values]
+
+    if operator in scoped_operations:
+        scoped_operation = scoped_operations[operator]
+        return lambda data: scoped_operation(data or {}, *values)
+
+    arguments = [_compile(value, use_var_undefined) for value in values]
+
+    match operator:
+        case "var":
+
+            def _var(data: JSON) -> JSON:
+                return get_var(
+                    data or {},
+                    *[argument(data or {}) for argument in arguments],
+                    use_var_undefined=use_var_undefined,
+                )
+
+            return _var
+
+        case "missing" | "missing_some":
+            func = missing if operator == "missing" else missing_some
+            return lambda data: func(
+                data or {}, *[argument(data or {}) for argument in arguments]
+            )
+
+    if operator not in operations:
+        # unknown operators crash, after evaluating the arguments
+        return partial(_interpret, expression, use_var_undefined=use_var_undefined)
+
+    func = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+
+    def _operation(data: JSON) -> JSON:
+        data = data or {}
+        resolved = [argument(data) for argument in arguments]
+        # Some operators raise errors if operands are empty. However, when evaluating
+        # without data or with incomplete data, often variables are empty. In this
+        # case, the jsonLogic evaluation will return None
+        if empty_values and any(value in empty_values for value in resolved):
+            return None
+        return func(*resolved)
+
+    return _operation
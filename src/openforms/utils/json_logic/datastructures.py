@@ -46,6 +46,24 @@ class ExpressionIntrospection:
 
         return inputs
 
+    def is_fully_introspectable(self) -> bool:
+        """
+        Check whether the expression result only depends on the input keys.
+
+        Expressions that look up variables with a computed key, like
+        ``{"var": {"cat": ["foo.", {"var": "bar"}]}}``, or that depend on the current
+        date through the ``today`` operation are not fully introspectable -
+        :meth:`get_input_keys` cannot report everything the result depends on.
+        """
+        for node, _ in iter_tree(self.tree, LogicContext(in_reduce=False)):
+            if isinstance(node, Primitive):
+                continue
+            if node.operator == "today":
+                return False
+            if node.operator == "var" and not isinstance(node.arguments[0], str):
+                return False
+        return True
+
 
 def iter_tree(
     tree: JSONLogicExpressionTree, context: LogicContext
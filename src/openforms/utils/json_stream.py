@@ -0,0 +1,188 @@
+"""
+Produce (large) request bodies with embedded base64 file content incrementally.
+
+APIs like the Documenten API expect file content to be embedded as a base64 string
+in the JSON body, StUF-ZDS does the same in its XML messages. Reading the file,
+encoding it and serializing the body in memory requires a multiple of the file size
+in memory, which quickly adds up for large attachments. Instead, the file content can be marked with :class:`Base64Content`
+and the body is produced chunk by chunk while it is being sent.
+"""
+
+import io
+import json
+import secrets
+from base64 import b64encode
+from collections.abc import Iterator, Mapping
+from typing import IO
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+__all__ = [
+    "Base64Content",
+    "Base64Placeholders",
+    "StreamingBody",
+    "StreamingJSONBody",
+    "get_json_body",
+]
+
+# multiple of 3 so that every chunk can be encoded on its own without padding
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+class Base64Content:
+    """
+    Marker for file content that must be included as base64 string in the JSON body.
+
+    :param file: The (binary) file to read the content from, from the current
+      position.
+    :param size: The number of bytes that will be read from the file.
+    :param close: Close the file once all of its content has been read.
+    """
+
+    def __init__(self, file: IO[bytes], size: int, close: bool = False):
+        self.file = file
+        self.size = size
+        self.close = close
+
+    @property
+    def encoded_size(self) -> int:
+        return 4 * ((self.size + 2) // 3)
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        remainder = b""
+        while chunk := self.file.read(CHUNK_SIZE):
+            chunk = remainder + chunk
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            if cutoff:
+                yield b64encode(chunk[:cutoff])
+        if remainder:
+            yield b64encode(remainder)
+        if self.close:
+            self.file.close()
+
+
+class StreamingBody(io.RawIOBase):
+    """
+    Read-only file-like object producing ``text`` with the placeholders replaced.
+
+    The file content is read only while the body is being consumed. The length of the
+    body is known upfront, so that it can be sent with a ``Content-Length`` header
+    rather than chunked transfer encoding.
+
+    :param text: The body, containing the placeholders of ``contents``.
+    :param contents: Mapping of placeholder to the content replacing it, see
+      :class:`Base64Placeholders`.
+    """
+
+    def __init__(self, text: str, contents: Mapping[str, Base64Content]):
+        super().__init__()
+        self._parts: list[bytes | Base64Content] = []
+        for placeholder, content in contents.items():
+            head, text = text.split(placeholder, 1)
+            self._parts += [head.encode(), content]
+        self._parts.append(text.encode())
+
+        self._length = sum(
+            part.encoded_size if isinstance(part, Base64Content) else len(part)
+            for part in self._parts
+        )
+        self._chunks = self._iter_chunks()
+        self._pending = memoryview(b"")
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, Base64Content):
+                yield from part.iter_encoded()
+            elif part:
+                yield part
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if (chunk := next(self._chunks, None)) is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        # requests uses the position to determine the remaining content length
+        return self._position
+
+
+class Base64Placeholders:
+    """
+    Registry of placeholders standing in for :class:`Base64Content` in a text body.
+
+    The body (JSON, XML...) is produced with the placeholders in place of the file
+    content, after which :meth:`get_body` streams it with the actual content.
+    """
+
+    def __init__(self):
+        # the random token guarantees the placeholders don't clash with actual data
+        self._token = secrets.token_hex(8)
+        self.contents: dict[str, Base64Content] = {}
+
+    def add(self, content: Base64Content) -> str:
+        placeholder = f"base64-{self._token}-{len(self.contents)}"
+        self.contents[placeholder] = content
+        return placeholder
+
+    def get_json_encoder(
+        self, encoder: type[json.JSONEncoder] = DjangoJSONEncoder
+    ) -> type[json.JSONEncoder]:
+        add = self.add
+
+        class _Encoder(encoder):
+            def default(self, o):
+                if isinstance(o, Base64Content):
+                    return add(o)
+                return super().default(o)
+
+        return _Encoder
+
+    def get_body(self, text: str) -> str | StreamingBody:
+        """
+        Produce the request body for ``text``, streaming it if it's large.
+        """
+        return _read_small_body(StreamingBody(text, self.contents))
+
+
+class StreamingJSONBody(StreamingBody):
+    """
+    Read-only file-like object producing the JSON serialization of ``data``.
+
+    Any :class:`Base64Content` instances in ``data`` are serialized as base64 strings.
+    """
+
+    def __init__(self, data, encoder: type[json.JSONEncoder] = DjangoJSONEncoder):
+        placeholders = Base64Placeholders()
+        serialized = json.dumps(data, cls=placeholders.get_json_encoder(encoder))
+        super().__init__(serialized, placeholders.contents)
+
+
+def _read_small_body(body: StreamingBody) -> str | StreamingBody:
+    # Bodies small enough to be saved by the outgoing requests log are read into
+    # memory, as the log needs the actual content. Larger bodies are not saved there
+    # and are streamed instead.
+    if len(body) <= settings.LOG_OUTGOING_REQUESTS_MAX_CONTENT_LENGTH:
+        return body.read().decode()
+    return body
+
+
+def get_json_body(data) -> str | StreamingBody:
+    """
+    Serialize ``data`` into a JSON request body, streaming it if it's large.
+    """
+    return _read_small_body(StreamingJSONBody(data))
@@ -1,34 +1,116 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import PurePosixPath
+from urllib.parse import urljoin, urlparse
+
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import FileSystemStorage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import render_to_string
 
 import structlog
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Static assets (stylesheets, fonts, images) referenced in the PDF templates don't
+# change during the lifetime of the process, so they are read only once per worker
+# rather than for every rendered PDF. Only the most recently used assets are kept.
+STATIC_ASSETS_CACHE_SIZE = 64
+_static_assets: OrderedDict[str, dict] = OrderedDict()
+_static_assets_lock = threading.Lock()
+
+
+@receiver(setting_changed, dispatch_uid="openforms.utils.pdf.clear_static_assets")
+def _clear_static_assets(sender, setting: str, **kwargs) -> None:
+    # the cached assets are only valid for the static files configuration they were
+    # fetched with (e.g. in tests)
+    if setting in ("STATIC_ROOT", "STATIC_URL", "STORAGES"):
+        with _static_assets_lock:
+            _static_assets.clear()
+
 
 def get_base_url() -> str:
     return settings.BASE_URL
 
 
-def render_to_pdf(template_name: str, context: dict[str, object]) -> tuple[str, bytes]:
+def _is_local_static_asset(url: str, static_url: str) -> bool:
     """
-    Render a (HTML) template to PDF with the given context.
+    Check if the URL is served from the static files on the local file system.
+
+    Other static files are fetched by WeasyPrint itself (e.g. from remote storage),
+    and their content is not guaranteed to be the same on the next fetch.
     """
+    if not url.startswith(static_url) or not isinstance(
+        staticfiles_storage, FileSystemStorage
+    ):
+        return False
+    rel_path = PurePosixPath(urlparse(url).path).relative_to(urlparse(static_url).path)
+    try:
+        return staticfiles_storage.exists(str(rel_path))
+    except SuspiciousFileOperation:
+        return False
+
+
+def _get_url_fetcher() -> Callable[[str], dict]:
+    # local import to avoid importing weasyprint at startup time
+    from maykin_common.pdf import DEFAULT_ALLOWED_PROTOCOLS, UrlFetcher
+
+    url_fetcher = UrlFetcher(allowed_protocols=DEFAULT_ALLOWED_PROTOCOLS)
+    static_url = urljoin(get_base_url(), settings.STATIC_URL)
+
+    def fetch(url: str) -> dict:
+        # in development, static files are served from the app directories and can
+        # change at any time
+        if settings.DEBUG or not _is_local_static_asset(url, static_url):
+            return url_fetcher(url)  # pyright: ignore[reportReturnType]
+        with _static_assets_lock:
+            if (result := _static_assets.get(url)) is not None:
+                _static_assets.move_to_end(url)
+                return dict(result)
+
+        result = dict(url_fetcher(url))
+        # file objects can only be read once, keep the content instead
+        if (file_obj := result.pop("file_obj", None)) is not None:
+            result["string"] = file_obj.read()
+        with _static_assets_lock:
+            _static_assets[url] = result
+            if len(_static_assets) > STATIC_ASSETS_CACHE_SIZE:
+                _static_assets.popitem(last=False)
+        return dict(result)
+
+    return fetch
+
+
+def _write_pdf(html: str) -> bytes:
     # local import to avoid importing weasyprint at startup time
-    from maykin_common.pdf import render_template_to_pdf as _render_template_to_pdf
+    import weasyprint
 
+    html_object = weasyprint.HTML(
+        string=html, url_fetcher=_get_url_fetcher(), base_url=get_base_url()
+    )
+    pdf = html_object.write_pdf(pdf_variant="pdf/ua-1")
+    assert isinstance(pdf, bytes)
+    return pdf
+
+
+def render_to_pdf(template_name: str, context: dict[str, object]) -> tuple[str, bytes]:
+    """
+    Render a (HTML) template to PDF with the given context.
+    """
     # workaround for https://github.com/Kozea/WeasyPrint/issues/2789 - we can pass the
     # base URL explicitly to make relevant URLs absolute
     base_url = get_base_url()
     if base_url.endswith("/"):
         base_url = base_url[:-1]
     context.setdefault("weasyprint_base_url", base_url)
-    return _render_template_to_pdf(template_name, context, variant="pdf/ua-1")
+    html = render_to_string(template_name, context=context)
+    return html, _write_pdf(html)
 
 
 def convert_html_to_pdf(html: str) -> bytes:
     """Convert a string with HTML to a PDF."""
-    # local import to avoid importing weasyprint at startup time
-    from maykin_common.pdf import render_to_pdf as _render_to_pdf
-
-    _, pdf = _render_to_pdf(html, variant="pdf/ua-1")
-    return pdf
+    return _write_pdf(html)
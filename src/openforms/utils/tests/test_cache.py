@@ -1,12 +1,15 @@
 import contextlib
 import time
+from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.cache import caches
 from django.http import HttpResponse
-from django.test import Client, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import path
 
+from ..cache import get_digest
+
 
 @override_settings(
     CACHES={
@@ -229,3 +232,23 @@ class WithinRequestProxyCacheTests(TestCase):
                 client.get("/")
             except Exception:
                 self.fail("Assertions in test view failed")
+
+
+class GetDigestTests(SimpleTestCase):
+    def test_digest_is_stable(self):
+        digest = get_digest({"foo": [1, "bar"], "amount": Decimal("1.50")})
+
+        self.assertEqual(
+            digest, get_digest({"amount": Decimal("1.50"), "foo": [1, "bar"]})
+        )
+        self.assertNotEqual(digest, get_digest({"foo": [1, "bar"]}))
+
+    def test_key_order_is_kept(self):
+        self.assertNotEqual(
+            get_digest({"a": 1, "b": 2}, sort_keys=False),
+            get_digest({"b": 2, "a": 1}, sort_keys=False),
+        )
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            get_digest({"foo": object()})
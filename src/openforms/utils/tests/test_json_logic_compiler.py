@@ -0,0 +1,115 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from freezegun import freeze_time
+from json_logic import UNDEFINED_VALUE, jsonLogic
+from unittest_parametrize import ParametrizedTestCase, param, parametrize
+
+from ..json_logic.compiler import compile_json_logic
+
+DATA = {
+    "name": "Jane",
+    "age": 42,
+    "empty": None,
+    "nested": {"items": [{"price": 10}, {"price": 20}], "flag": True},
+    "birthdate": "1982-04-01",
+}
+
+
+class CompileJsonLogicTests(ParametrizedTestCase, SimpleTestCase):
+    @parametrize(
+        "expression",
+        [
+            param(True, id="primitive"),
+            param([1, {"var": "age"}], id="list"),
+            param({"var": "name"}, id="var_unary_syntax"),
+            param({"var": ["missing", "fallback"]}, id="var_default"),
+            param({"var": "missing"}, id="var_missing"),
+            param({"var": "empty"}, id="var_none"),
+            param({"var": "nested.items.1.price"}, id="var_nested"),
+            param({"var": ""}, id="var_all_data"),
+            param({"==": [{"var": "age"}, "42"]}, id="soft_equals"),
+            param({">": [{"var": "age"}, 18]}, id="greater_than"),
+            param({">": [{"var": "empty"}, 18]}, id="empty_operand"),
+            param(
+                {"and": [{"var": "nested.flag"}, {"!": {"var": "missing"}}]},
+                id="and_not",
+            ),
+            param({"cat": ["Hello ", {"var": "name"}]}, id="cat"),
+            param(
+                {"if": [{"<": [{"var": "age"}, 18]}, "minor", "adult"]}, id="if_else"
+            ),
+            param({"missing": ["name", "other"]}, id="missing"),
+            param({"missing_some": [1, ["name", "other"]]}, id="missing_some"),
+            param(
+                {
+                    "reduce": [
+                        {"var": "nested.items"},
+                        {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                        0,
+                    ]
+                },
+                id="reduce",
+            ),
+            param(
+                {"map": [{"var": "nested.items"}, {"*": [{"var": "price"}, 2]}]},
+                id="map",
+            ),
+            param(
+                {"+": [{"date": {"var": "birthdate"}}, {"duration": "P1M"}]},
+                id="date_arithmetic",
+            ),
+            param({"in": ["an", {"var": "name"}]}, id="in"),
+        ],
+    )
+    def test_same_result_as_interpreter(self, expression):
+        for use_var_undefined in (False, True):
+            with self.subTest(use_var_undefined=use_var_undefined):
+                program = compile_json_logic(
+                    expression, use_var_undefined=use_var_undefined
+                )
+
+                result = program(DATA)
+
+                self.assertEqual(
+                    result,
+                    jsonLogic(expression, DATA, use_var_undefined=use_var_undefined),
+                )
+
+    def test_undefined_variable(self):
+        program = compile_json_logic({"var": "missing"}, use_var_undefined=True)
+
+        self.assertIs(program(DATA), UNDEFINED_VALUE)
+
+    @freeze_time("2024-03-18")
+    def test_today_is_evaluated_at_call_time(self):
+        program = compile_json_logic({"today": []})
+
+        self.assertEqual(program({}), date(2024, 3, 18))
+
+        with freeze_time("2024-03-19"):
+            self.assertEqual(program({}), date(2024, 3, 19))
+
+    def test_compiled_program_is_cached(self):
+        program1 = compile_json_logic({"==": [{"var": "foo"}, 1]})
+        program2 = compile_json_logic({"==": [{"var": "foo"}, 1]})
+        program3 = compile_json_logic(
+            {"==": [{"var": "foo"}, 1]}, use_var_undefined=True
+        )
+
+        self.assertIs(program1, program2)
+        self.assertIsNot(program1, program3)
+
+    def test_invalid_expressions_raise_when_evaluated(self):
+        with self.subTest("unknown operator"):
+            program = compile_json_logic({"foo": [1, 2]})
+
+            with self.assertRaises(ValueError):
+                program({})
+
+        with self.subTest("multiple operators"):
+            program = compile_json_logic({"==": [1, 1], "!=": [1, 2]})
+
+            with self.assertRaises(AssertionError):
+                program({})
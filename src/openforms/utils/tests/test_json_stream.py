@@ -0,0 +1,113 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+
+import requests
+
+from ..json_stream import (
+    CHUNK_SIZE,
+    Base64Content,
+    Base64Placeholders,
+    StreamingBody,
+    StreamingJSONBody,
+    get_json_body,
+)
+
+
+class StreamingJSONBodyTests(SimpleTestCase):
+    def test_body_matches_in_memory_serialization(self):
+        for size in (0, 1, 2, 3, 4, CHUNK_SIZE, CHUNK_SIZE + 1, 3 * CHUNK_SIZE + 2):
+            with self.subTest(size=size):
+                content = bytes(range(256)) * (size // 256) + bytes(size % 256)
+                data = {
+                    "name": "bijlage.bin",
+                    "files": [
+                        {"content": Base64Content(BytesIO(content), size=size)},
+                        {"content": Base64Content(BytesIO(b"foo"), size=3)},
+                    ],
+                }
+
+                body = StreamingJSONBody(data)
+
+                expected = json.dumps(
+                    {
+                        "name": "bijlage.bin",
+                        "files": [
+                            {"content": b64encode(content).decode()},
+                            {"content": "Zm9v"},
+                        ],
+                    }
+                ).encode()
+                self.assertEqual(len(body), len(expected))
+                self.assertEqual(body.read(), expected)
+
+    def test_read_in_blocks(self):
+        content = b"x" * (CHUNK_SIZE * 2 + 1)
+        body = StreamingJSONBody(
+            {"inhoud": Base64Content(BytesIO(content), size=len(content))}
+        )
+
+        blocks = []
+        while block := body.read(8192):
+            self.assertEqual(body.tell(), sum(map(len, blocks)) + len(block))
+            blocks.append(block)
+
+        self.assertEqual(
+            json.loads(b"".join(blocks)), {"inhoud": b64encode(content).decode()}
+        )
+
+    def test_file_is_closed_when_requested(self):
+        file = BytesIO(b"foo")
+        body = StreamingJSONBody({"inhoud": Base64Content(file, size=3, close=True)})
+
+        body.read()
+
+        self.assertTrue(file.closed)
+
+
+@override_settings(LOG_OUTGOING_REQUESTS_MAX_CONTENT_LENGTH=100)
+class GetJSONBodyTests(SimpleTestCase):
+    def test_small_body_is_read_into_memory(self):
+        body = get_json_body({"inhoud": Base64Content(BytesIO(b"foo"), size=3)})
+
+        self.assertEqual(body, '{"inhoud": "Zm9v"}')
+
+    def test_large_body_is_streamed_with_content_length(self):
+        content = b"x" * 1000
+        body = get_json_body({"inhoud": Base64Content(BytesIO(content), size=1000)})
+
+        self.assertIsInstance(body, StreamingJSONBody)
+        request = requests.Request("POST", "https://example.com", data=body).prepare()
+        self.assertEqual(request.headers["Content-Length"], str(len(body)))
+        self.assertNotIn("Transfer-Encoding", request.headers)
+        self.assertEqual(
+            json.loads(request.body.read()), {"inhoud": b64encode(content).decode()}
+        )
+
+
+@override_settings(LOG_OUTGOING_REQUESTS_MAX_CONTENT_LENGTH=100)
+class Base64PlaceholdersTests(SimpleTestCase):
+    def test_text_body_with_placeholders(self):
+        content = b"x" * 1000
+        placeholders = Base64Placeholders()
+        placeholder = placeholders.add(Base64Content(BytesIO(content), size=1000))
+
+        body = placeholders.get_body(f"<inhoud>{placeholder}</inhoud>")
+
+        self.assertIsInstance(body, StreamingBody)
+        self.assertEqual(
+            body.read(), f"<inhoud>{b64encode(content).decode()}</inhoud>".encode()
+        )
+
+    def test_json_encoder(self):
+        placeholders = Base64Placeholders()
+        serialized = json.dumps(
+            {"inhoud": Base64Content(BytesIO(b"foo"), size=3)},
+            cls=placeholders.get_json_encoder(),
+        )
+
+        body = placeholders.get_body(serialized)
+
+        self.assertEqual(body, '{"inhoud": "Zm9v"}')
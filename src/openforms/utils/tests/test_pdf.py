@@ -0,0 +1,118 @@
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from .. import pdf
+
+
+@override_settings(
+    BASE_URL="https://forms.example.com", STATIC_URL="/static/", DEBUG=False
+)
+class UrlFetcherTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        static_root = TemporaryDirectory()
+        self.addCleanup(static_root.cleanup)
+        self.static_root = Path(static_root.name)
+        (self.static_root / "bundles").mkdir()
+        (self.static_root / "bundles" / "pdf-css.css").write_text("body {}")
+        settings_override = override_settings(STATIC_ROOT=self.static_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        patcher = patch.dict(pdf._static_assets, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            "maykin_common.pdf.UrlFetcher.__call__",
+            side_effect=lambda url: {
+                "mime_type": "text/css",
+                "redirected_url": url,
+                "file_obj": BytesIO(b"body {}"),
+            },
+        )
+        self.mock_fetch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_static_assets_are_fetched_once(self):
+        url = "https://forms.example.com/static/bundles/pdf-css.css"
+
+        for _ in range(2):
+            result = pdf._get_url_fetcher()(url)
+
+            self.assertEqual(result["string"], b"body {}")
+            self.assertNotIn("file_obj", result)
+
+        self.mock_fetch.assert_called_once_with(url)
+
+    def test_other_urls_are_not_cached(self):
+        url = "https://forms.example.com/media/logo.png"
+        fetch = pdf._get_url_fetcher()
+
+        fetch(url)
+        fetch(url)
+
+        self.assertEqual(self.mock_fetch.call_count, 2)
+
+    def test_static_files_missing_from_storage_are_not_cached(self):
+        # deferred to the WeasyPrint default fetcher, e.g. with remote storage
+        url = "https://forms.example.com/static/bundles/missing.css"
+        fetch = pdf._get_url_fetcher()
+
+        fetch(url)
+        fetch(url)
+
+        self.assertEqual(self.mock_fetch.call_count, 2)
+        self.assertEqual(pdf._static_assets, {})
+
+    def test_static_files_not_on_file_system_are_not_cached(self):
+        url = "https://forms.example.com/static/bundles/pdf-css.css"
+        storages = {
+            "staticfiles": {"BACKEND": "django.core.files.storage.InMemoryStorage"}
+        }
+
+        with override_settings(STORAGES=storages):
+            fetch = pdf._get_url_fetcher()
+            fetch(url)
+            fetch(url)
+
+        self.assertEqual(self.mock_fetch.call_count, 2)
+        self.assertEqual(pdf._static_assets, {})
+
+    def test_least_recently_used_assets_are_evicted(self):
+        for i in range(3):
+            (self.static_root / f"asset{i}.css").write_text("body {}")
+        fetch = pdf._get_url_fetcher()
+
+        with patch.object(pdf, "STATIC_ASSETS_CACHE_SIZE", 2):
+            fetch("https://forms.example.com/static/asset0.css")
+            fetch("https://forms.example.com/static/asset1.css")
+            fetch("https://forms.example.com/static/asset0.css")
+            fetch("https://forms.example.com/static/asset2.css")
+
+        self.assertEqual(
+            list(pdf._static_assets),
+            [
+                "https://forms.example.com/static/asset0.css",
+                "https://forms.example.com/static/asset2.css",
+            ],
+        )
+        self.assertEqual(self.mock_fetch.call_count, 3)
+
+    def test_static_assets_cleared_when_static_files_settings_change(self):
+        url = "https://forms.example.com/static/bundles/pdf-css.css"
+        pdf._get_url_fetcher()(url)
+        self.assertIn(url, pdf._static_assets)
+
+        with override_settings(STATIC_URL="/other-static/"):
+            self.assertEqual(pdf._static_assets, {})
+
+            pdf._get_url_fetcher()(url)
+
+        self.assertEqual(pdf._static_assets, {})
+        self.assertEqual(self.mock_fetch.call_count, 2)
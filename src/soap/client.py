@@ -1,10 +1,27 @@
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from django.utils.crypto import salted_hmac
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
 from zeep.client import Client
+from zeep.settings import Settings
 from zeep.transports import Transport
+from zeep.wsdl import Document
 
 from .models import SoapService
 from .session_factory import SessionFactory
 
+# Number of parsed WSDL documents kept around in the process. Parsing a WSDL and its
+# XSDs easily takes hundreds of milliseconds, while the result only depends on the
+# service configuration and the WSDL location.
+WSDL_CACHE_SIZE = 32
+
+_wsdl_cache: OrderedDict[Hashable, Document] = OrderedDict()
+_wsdl_cache_lock = threading.Lock()
+
 
 def build_client(
     service: SoapService,
@@ -29,7 +46,12 @@ def build_client(
         # monkeypatched requests.Session defaults
         operation_timeout=service.timeout,
     )
-    kwargs.setdefault("wsdl", service.url)
+    wsdl = kwargs.pop("wsdl", service.url)
+    kwargs["wsdl"] = (
+        get_wsdl_document(service, wsdl, settings=kwargs.get("settings"))
+        if wsdl
+        else wsdl
+    )
     client = client_factory(
         transport=transport,
         wsse=service.get_wsse(),
@@ -38,6 +60,67 @@ def build_client(
     return client
 
 
+def get_wsdl_document(
+    service: SoapService, location: str, settings: Settings | None = None
+) -> Document:
+    """
+    Return the parsed WSDL document at ``location``, re-using earlier parse results.
+
+    The documents are cached for the lifetime of the process. The cache key includes
+    the service configuration used to retrieve the WSDL and the zeep settings used to
+    parse it, so changing either results in the WSDL being loaded again.
+    """
+    settings = settings or Settings()
+    # the credentials are only kept as digest in the cache key
+    credentials = salted_hmac(
+        "soap.client.get_wsdl_document",
+        json.dumps([service.user, service.password]),
+    ).hexdigest()
+    key = (
+        service.pk,
+        location,
+        service.url,
+        service.endpoint_security,
+        credentials,
+        service.client_certificate_id,
+        service.server_certificate_id,
+        # the settings affecting the parsed document
+        settings.strict,
+        settings.force_https,
+        settings.xml_huge_tree,
+        settings.forbid_dtd,
+        settings.forbid_entities,
+        settings.forbid_external,
+        settings.xsd_ignore_sequence_order,
+    )
+    with _wsdl_cache_lock:
+        if (document := _wsdl_cache.get(key)) is not None:
+            _wsdl_cache.move_to_end(key)
+            return document
+
+    # Parse outside of the lock, loading the WSDL may require network requests. The
+    # document keeps a reference to the transport it was loaded with, so it gets a
+    # dedicated one rather than the transport (and session) of a particular client.
+    session = SOAPSession.configure_from(SessionFactory(service))
+    transport = Transport(
+        session=session,
+        timeout=service.timeout,
+        operation_timeout=service.timeout,
+    )
+    with session:
+        document = Document(location, transport, settings=settings)
+    with _wsdl_cache_lock:
+        _wsdl_cache[key] = document
+        if len(_wsdl_cache) > WSDL_CACHE_SIZE:
+            _wsdl_cache.popitem(last=False)
+    return document
+
+
+def clear_wsdl_cache() -> None:
+    with _wsdl_cache_lock:
+        _wsdl_cache.clear()
+
+
 class SOAPSession(SessionBase):
     def to_absolute_url(self, maybe_relative_url: str) -> str:
         """
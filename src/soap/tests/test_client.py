@@ -12,11 +12,12 @@ from privates.test import temp_private_root
 from requests.exceptions import RequestException
 from simple_certmanager.test.factories import CertificateFactory
 from zeep.exceptions import XMLSyntaxError
+from zeep.settings import Settings
 from zeep.wsse import Signature, UsernameToken
 
 from openforms.utils.tests.vcr import OFVCRMixin
 
-from ..client import SOAPSession, build_client
+from ..client import SOAPSession, _wsdl_cache, build_client, clear_wsdl_cache
 from ..constants import EndpointSecurity
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
@@ -284,3 +285,69 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # timeout time has passed and we're trying
                 self.fail("timeout not honoured by SOAP client")
+
+
+class WSDLCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_wsdl_cache()
+        self.addCleanup(clear_wsdl_cache)
+
+    def test_parsed_wsdl_is_reused(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        client1 = build_client(service)
+        client2 = build_client(service)
+
+        self.assertIs(client1.wsdl, client2.wsdl)
+        # the clients each have their own transport
+        self.assertIsNot(client1.transport, client2.transport)
+        # the document is not tied to the transport of any client
+        self.assertIsNot(client1.wsdl.transport, client1.transport)
+        self.assertIsNot(client1.wsdl.transport, client2.transport)
+
+    def test_wsdl_is_loaded_again_when_service_changes(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        client1 = build_client(service)
+
+        service.endpoint_security = EndpointSecurity.basicauth
+        service.user = "admin"
+        service.password = "secret"
+        service.save()
+        client2 = build_client(service)
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
+
+    def test_wsdl_is_cached_per_service(self):
+        service1, service2 = SoapServiceFactory.create_batch(2, url=WSDL_URI)
+
+        client1 = build_client(service1)
+        client2 = build_client(service2)
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
+
+    def test_wsdl_is_cached_per_settings(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        client1 = build_client(service)
+        client2 = build_client(service, settings=Settings(strict=False))
+        client3 = build_client(service, settings=Settings(strict=False))
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
+        self.assertIs(client2.wsdl, client3.wsdl)
+        # the document is parsed with the settings of the client
+        self.assertTrue(client1.wsdl.settings.strict)
+        self.assertFalse(client2.wsdl.settings.strict)
+
+    def test_credentials_are_not_part_of_the_cache_key(self):
+        service = SoapServiceFactory.create(
+            url=WSDL_URI,
+            endpoint_security=EndpointSecurity.basicauth,
+            user="admin",
+            password="secret",
+        )
+
+        build_client(service)
+
+        self.assertNotIn("secret", repr(list(_wsdl_cache)))
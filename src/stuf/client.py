@@ -23,6 +23,7 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.json_stream import Base64Placeholders, StreamingBody
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -133,7 +134,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -146,7 +147,7 @@ class BaseClient(APIClient):
         log.debug("stuf_request_started")
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -186,12 +187,17 @@ class BaseClient(APIClient):
         template: str,
         context: dict[str, Any] | None = None,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
+        placeholders: Base64Placeholders | None = None,
     ) -> Response:
         """
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        File content can be put in the context as placeholders (see
+        :class:`openforms.utils.json_stream.Base64Placeholders`), it is then only read
+        and encoded while the request is being sent.
         """
         initial_full_context = {**self.build_base_context(), **(context or {})}
         structlog.contextvars.bind_contextvars(
@@ -209,6 +215,8 @@ class BaseClient(APIClient):
 
         logger.debug("prepare_and_make_request")
         body = loader.render_to_string(template, sanitized_full_context)
+        if placeholders is not None:
+            body = placeholders.get_body(body)
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 import uuid
 from collections import OrderedDict
 from collections.abc import Iterator, Mapping, MutableMapping
@@ -28,6 +27,7 @@ from openforms.config.models import GlobalConfiguration
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils.json_stream import Base64Content, Base64Placeholders
 
 from ..client import BaseClient
 from ..constants import EndpointType
@@ -307,7 +307,10 @@ class Client(BaseClient):
         doc_data: dict,
     ) -> None:
         content.seek(0)
-        base64_body = base64.b64encode(content.read()).decode()
+        # the content is only read and encoded while the request is being sent, which
+        # keeps the memory usage bounded for large attachments
+        placeholders = Base64Placeholders()
+        base64_body = placeholders.add(Base64Content(content, size=content.size))
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -334,6 +337,7 @@ class Client(BaseClient):
             template="stuf_zds/soap/voegZaakdocumentToe.xml",
             context=context,
             endpoint_type=EndpointType.ontvang_asynchroon,
+            placeholders=placeholders,
         )
 
     def create_zaak_document(
@@ -1,4 +1,6 @@
-from django.test import tag
+from base64 import b64encode
+
+from django.test import override_settings, tag
 
 import requests_mock
 from freezegun import freeze_time
@@ -11,6 +13,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFileAttachmentFactory,
     SubmissionReportFactory,
 )
+from openforms.utils.json_stream import StreamingBody
 from soap.constants import SOAPVersion
 from stuf.tests.factories import StufServiceFactory
 
@@ -354,6 +357,35 @@ class StufZDSClientTests(StUFZDSTestBase):
             },
         )
 
+    @override_settings(LOG_OUTGOING_REQUESTS_MAX_CONTENT_LENGTH=100)
+    def test_create_zaak_attachment_streams_large_content(self, m):
+        client = StufZDSClient(self.service, self.options, config=StufZDSConfig())
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+        )
+        content = bytes(range(256)) * 4
+        submission_attachment = SubmissionFileAttachmentFactory.create(
+            content__data=content,
+            file_name="large.bin",
+            content_type="application/octet-stream",
+        )
+
+        client.create_zaak_attachment(
+            zaak_id="foo", doc_id="bar", submission_attachment=submission_attachment
+        )
+
+        request = m.request_history[0]
+        self.assertIsInstance(request.body, StreamingBody)
+        xml_doc = etree.fromstring(request.body.read())
+        self.assertXPathEqualDict(
+            xml_doc,
+            {
+                "//zkn:object/zkn:identificatie": "bar",
+                "//zkn:object/zkn:inhoud": b64encode(content).decode(),
+            },
+        )
+
     def test_client_wraps_network_error(self, m):
         client = StufZDSClient(self.service, self.options, config=StufZDSConfig())
         m.post(self.service.soap_service.url, exc=RequestException)